@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module provides an artificial intelligence that searches the tree of moves with alpha-beta pruning."""
+
+from time import perf_counter
+from typing import Dict, List, Tuple, Union
+
+from abalone.abstract_player import AbstractPlayer
+from abalone.bitboard import Bitboard, popcount, spaces_to_mask
+from abalone.enums import Direction, Player, Space
+from abalone.game import Game
+from abalone.solver import PushOffSolver
+from abalone.transposition import Bound, TranspositionTable
+from abalone.utils import DISTANCES_TO_EDGE, LOSING_MARBLES, SPACES
+
+_WIN_SCORE = 1000000
+"""The score of a won position. Wins in fewer moves get a slightly higher score."""
+
+_MAX_PLY = 1000
+"""An upper bound of the distance to the root of a search, so that every score whose absolute value is greater than\
+`_WIN_SCORE - _MAX_PLY` is a win or loss."""
+
+_MARBLE_SCORE = 1000
+"""The score of a single marble."""
+
+_CENTER_SCORE = 10
+"""The score of a marble per space that it is closer to the edge than to the center of the board."""
+
+
+_RINGS: List[int] = [spaces_to_mask(space for space in SPACES if DISTANCES_TO_EDGE[space] == distance)
+                     for distance in range(5)]
+"""The bitboards of the rings of spaces around the center, indexed by their distance to the edge of the board."""
+
+
+class _Timeout(Exception):
+    """Exception that is raised to abort a search when the time is up."""
+
+
+class AlphaBetaPlayer(AbstractPlayer):
+    """A player that searches the tree of moves by negamax with alpha-beta pruning and iterative deepening, based on\
+    `abalone.bitboard.Bitboard`. Moves are ordered by the best move of a previous search (from a\
+    `abalone.transposition.TranspositionTable`), captures and sumitos. When the time per move is up, the best move of\
+    the deepest search so far is returned. Before searching, a forced push-off is looked for by an\
+    `abalone.solver.PushOffSolver`, which is only possible shortly before the end of the game.
+
+    After every turn, the attributes `depth`, `nodes` and `nodes_per_second` describe the search.
+    """
+
+    def __init__(self, time_limit: float = 1.0, max_depth: int = 32, table_size_mb: float = 16,
+                 verbose: bool = False, table: Union[TranspositionTable, None] = None, min_depth: int = 1,
+                 solver_plies: int = 3):
+        """Initializes the player.
+
+        Args:
+            time_limit: The wall-clock time per move in seconds.
+            max_depth: The maximum depth of the search.
+            table_size_mb: The memory of the `abalone.transposition.TranspositionTable` in megabytes.
+            verbose: Whether to print the statistics of every search.
+            table: A `abalone.transposition.TranspositionTable` to be used instead of a new one of `table_size_mb`,\
+                e.g. one that is shared with other searches (see `abalone.parallel`).
+            min_depth: The depth of the first iteration of iterative deepening.
+            solver_plies: The maximum number of plies of a forced push-off found by the\
+                `abalone.solver.PushOffSolver` (0 to disable the solver).
+        """
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.min_depth = min_depth
+        self.verbose = verbose
+        self.table = table if table is not None else TranspositionTable(table_size_mb)
+        self.solver_plies = solver_plies
+        self.solver = PushOffSolver()
+        self.depth = 0
+        """The depth of the last completed iteration of the last search."""
+        self.nodes = 0
+        """The number of positions visited by the last search."""
+        self.nodes_per_second = 0.0
+        """The number of positions visited per second by the last search."""
+        self._deadline = 0.0
+        self._best_move: Union[Tuple[Union[Space, Tuple[Space, Space]], Direction], None] = None
+
+    def turn(self, game: Game, moves_history: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]) \
+            -> Tuple[Union[Space, Tuple[Space, Space]], Direction]:
+        start = perf_counter()
+        self._deadline = start + self.time_limit
+        self.nodes = 0
+        self.depth = 0
+        self.nodes_per_second = 0.0
+        root = Bitboard.from_game(game)
+        # the solver shares the time of the search
+        if self.solver_plies > 0:
+            solution = self.solver.prove(root, root.turn, self.solver_plies, self._deadline)
+            if solution is not None and solution.moves:
+                if self.verbose:  # pragma: no cover
+                    print(f'forced push-off in {solution.plies} plies')
+                return solution.moves[0]
+        children = self._ordered_children(root, None)
+        self._best_move = children[0][0]
+        try:
+            for depth in range(self.min_depth, self.max_depth + 1):
+                self._search_root(root, children, depth)
+                self.depth = depth
+        except _Timeout:
+            pass
+        elapsed = perf_counter() - start
+        self.nodes_per_second = self.nodes / elapsed if elapsed > 0 else 0.0
+        if self.verbose:  # pragma: no cover
+            print(f'depth {self.depth}, {self.nodes} nodes, {self.nodes_per_second:.0f} nodes/s')
+        return self._best_move
+
+    def _search_root(self, root: Bitboard,
+                     children: List[Tuple[Tuple[Union[Space, Tuple[Space, Space]], Direction], Bitboard]],
+                     depth: int) -> None:
+        """Searches all moves of the root position to a given depth and updates `self._best_move`. The best move of\
+        the previous iteration is searched first, so that a better move found before a timeout can be used.
+
+        Args:
+            root: The position in which a move is searched.
+            children: The legal moves of `root` and the resulting positions.
+            depth: The depth of the search.
+        """
+        children.sort(key=lambda child: child[0] != self._best_move)
+        alpha = -_WIN_SCORE - 1
+        for move, child in children:
+            score = -self._negamax(child, depth - 1, -_WIN_SCORE - 1, -alpha, 1)
+            if score > alpha:
+                alpha = score
+                self._best_move = move
+        self.table.store(_key(root), depth, alpha, Bound.EXACT, self._best_move)
+
+    def _negamax(self, board: Bitboard, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """Computes the score of a position from the perspective of the player in turn.
+
+        Args:
+            board: The position.
+            depth: The remaining depth of the search.
+            alpha: The score that the player in turn can already achieve.
+            beta: The score that the opponent can already achieve (negated).
+            ply: The distance to the root of the search.
+
+        Returns:
+            The score of `board`, which is only exact if it lies between `alpha` and `beta`.
+
+        Raises:
+            _Timeout: The time is up
+        """
+        self.nodes += 1
+        if self.nodes & 1023 == 0 and perf_counter() > self._deadline:
+            raise _Timeout()
+
+        own, opp = (board.black, board.white) if board.turn is Player.BLACK else (board.white, board.black)
+        if popcount(own) <= LOSING_MARBLES:
+            return -_WIN_SCORE + ply
+        if depth == 0:
+            return _evaluate(own, opp)
+
+        key = _key(board)
+        entry = self.table.probe(key)
+        best_move = None
+        if entry is not None:
+            best_move = entry.best_move
+            if entry.depth >= depth:
+                score = _score_from_table(entry.score, ply)
+                if entry.bound is Bound.EXACT:
+                    return score
+                if entry.bound is Bound.LOWER:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+
+        children = self._ordered_children(board, best_move)
+        if not children:
+            return _evaluate(own, opp)
+        original_alpha = alpha
+        best_score = -_WIN_SCORE - 1
+        for move, child in children:
+            score = -self._negamax(child, depth - 1, -beta, -alpha, ply + 1)
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best_score <= original_alpha:
+            bound = Bound.UPPER
+        elif best_score >= beta:
+            bound = Bound.LOWER
+        else:
+            bound = Bound.EXACT
+        self.table.store(key, depth, _score_to_table(best_score, ply), bound, best_move)
+        return best_score
+
+    @staticmethod
+    def _ordered_children(board: Bitboard,
+                          best_move: Union[Tuple[Union[Space, Tuple[Space, Space]], Direction], None]) \
+            -> List[Tuple[Tuple[Union[Space, Tuple[Space, Space]], Direction], Bitboard]]:
+        """Performs all legal moves and orders them by their expected strength: the given best move first, then\
+        captures, then other sumitos and then all remaining moves.
+
+        Args:
+            board: The position whose moves are generated.
+            best_move: The best move from a previous search or `None`.
+
+        Returns:
+            A list of the legal moves and the resulting positions.
+        """
+        opp = board.white if board.turn is Player.BLACK else board.black
+        opp_marbles = popcount(opp)
+        prioritized: Dict[int, List[Tuple[Tuple[Union[Space, Tuple[Space, Space]], Direction], Bitboard]]] = {
+            0: [], 1: [], 2: [], 3: []
+        }
+        for move in board.generate_legal_moves():
+            child = board.move(*move)
+            child_opp = child.white if board.turn is Player.BLACK else child.black
+            if move == best_move:
+                prioritized[0].append((move, child))
+            elif child_opp == opp:
+                prioritized[3].append((move, child))
+            elif popcount(child_opp) < opp_marbles:
+                prioritized[1].append((move, child))
+            else:
+                prioritized[2].append((move, child))
+        return prioritized[0] + prioritized[1] + prioritized[2] + prioritized[3]
+
+
+def _key(board: Bitboard) -> int:
+    """Computes a 64 bit key of a position for the `abalone.transposition.TranspositionTable`."""
+    return board.zobrist
+
+
+def _score_to_table(score: int, ply: int) -> int:
+    """Converts the score of a win or loss from the distance to the root to the distance to the position itself, so\
+    that it can be stored in the `abalone.transposition.TranspositionTable` and probed at any other ply.
+
+    Args:
+        score: The score of a position as returned by `AlphaBetaPlayer._negamax`.
+        ply: The distance of the position to the root of the search.
+
+    Returns:
+        The score to be stored.
+    """
+    if score > _WIN_SCORE - _MAX_PLY:
+        return score + ply
+    if score < -_WIN_SCORE + _MAX_PLY:
+        return score - ply
+    return score
+
+
+def _score_from_table(score: int, ply: int) -> int:
+    """Reverses `_score_to_table` for a position at a given distance to the root of the search.
+
+    Args:
+        score: The score from the `abalone.transposition.TranspositionTable`.
+        ply: The distance of the position to the root of the search.
+
+    Returns:
+        The score relative to the root.
+    """
+    if score > _WIN_SCORE - _MAX_PLY:
+        return score - ply
+    if score < -_WIN_SCORE + _MAX_PLY:
+        return score + ply
+    return score
+
+
+def _evaluate(own: int, opp: int) -> int:
+    """Evaluates a position by the number of marbles and their distance to the edge of the board.
+
+    Args:
+        own: The bitboard of the player in turn.
+        opp: The bitboard of the opponent.
+
+    Returns:
+        The score of the position from the perspective of the player in turn.
+    """
+    score = _MARBLE_SCORE * (popcount(own) - popcount(opp))
+    for distance_to_edge, ring in enumerate(_RINGS):
+        score += _CENTER_SCORE * distance_to_edge * (popcount(own & ring) - popcount(opp & ring))
+    return score
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module generates the legal moves of many positions at once with NumPy, e.g. for Monte Carlo or neural network\
+players. It requires NumPy, which can be installed with `pip install abalone-boai[numpy]`.
+
+Positions are given as an array of shape `(N, 61)` of the values of the `abalone.enums.Marble`s, ordered like\
+`abalone.utils.SPACES` (as in `abalone.game.Game.to_bytes`), and an array of shape `(N,)` of the values of the\
+`abalone.enums.Player`s in turn. Moves are given by their index in `abalone.moves.MOVES`.
+"""
+
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+from abalone.game import Game
+from abalone.moves import INLINE_MOVES, _BROADSIDE_DESTINATIONS, _BROADSIDE_MARBLES, _INLINE_LINES
+
+_INLINE_GATHER = np.array(_INLINE_LINES, dtype=np.intp)
+"""The indices of the first six spaces in the direction of every inline move, see `abalone.moves`."""
+_BROADSIDE_MARBLES_GATHER = np.array(_BROADSIDE_MARBLES, dtype=np.intp)
+"""The indices of the marbles of every broadside move."""
+_BROADSIDE_DESTINATIONS_GATHER = np.array(_BROADSIDE_DESTINATIONS, dtype=np.intp)
+"""The indices of the destinations of every broadside move."""
+
+_EMPTY = 0
+_OFF = 2
+"""The value of `abalone.enums.Space.OFF` in the padded boards of this module."""
+
+# The states of the spaces relative to the player in turn are the two lowest bits of the relative values (own marbles
+# are 1, opponent marbles are -1).
+_EMPTY_STATE = 0
+_OWN_STATE = 1
+_OFF_STATE = 2
+_OPPONENT_STATE = 3
+
+
+def _is_legal_inline(states: List[int]) -> bool:
+    """Checks whether an inline move is legal based on the states of the first six spaces in its direction. This\
+    function is only used to build `abalone.batch._LEGAL`.
+
+    Args:
+        states: The states of the six spaces, starting with the caboose.
+
+    Returns:
+        `True` if the move is legal, like `abalone.game.Game.is_legal_move`.
+    """
+    own = 0
+    while own < 4 and states[own] == _OWN_STATE:
+        own += 1
+    opponent = 0
+    while own + opponent < 6 and states[own + opponent] == _OPPONENT_STATE:
+        opponent += 1
+    if own == 0 or own > 3 or opponent >= own:
+        return False
+    # the space after the moved marbles must not be occupied by own marbles or be off the board for own marbles
+    return states[own + opponent] == _EMPTY_STATE or opponent > 0 and states[own + opponent] == _OFF_STATE
+
+
+def _is_legal_broadside(states: List[int]) -> bool:
+    """Checks whether a broadside move is legal based on the states of its three marbles and their three destinations.\
+    This function is only used to build `abalone.batch._LEGAL`.
+
+    Args:
+        states: The states of the spaces of the marbles followed by the states of their destinations.
+
+    Returns:
+        `True` if the move is legal, like `abalone.game.Game.is_legal_move`.
+    """
+    return all(state == _OWN_STATE for state in states[:3]) and all(state == _EMPTY_STATE for state in states[3:])
+
+
+_GATHER = np.concatenate((_INLINE_GATHER, np.concatenate((_BROADSIDE_MARBLES_GATHER,
+                                                          _BROADSIDE_DESTINATIONS_GATHER), axis=1)))
+"""The indices of the six spaces that determine whether a move is legal, for every move of `abalone.moves.MOVES`."""
+
+_LEGAL = np.array([is_legal([code >> 2 * i & 3 for i in range(6)])
+                   for is_legal in (_is_legal_inline, _is_legal_broadside) for code in range(4 ** 6)])
+"""Whether a move is legal for every combination of the states of its six spaces (2 bits per space), first for inline\
+moves and then for broadside moves."""
+
+_LEGAL_OFFSETS = np.where(np.arange(len(_GATHER)) < INLINE_MOVES, 0, 4 ** 6).astype(np.int16)[:, None]
+"""The offsets of the moves of `abalone.moves.MOVES` in `abalone.batch._LEGAL`."""
+
+
+def stack_games(games: Iterable[Game]) -> Tuple[np.ndarray, np.ndarray]:
+    """Converts `abalone.game.Game`s into the array representation of this module.
+
+    Args:
+        games: The `abalone.game.Game`s.
+
+    Returns:
+        A tuple of the boards (shape `(N, 61)`) and the players in turn (shape `(N,)`), both of type `np.int8`.
+    """
+    positions = np.frombuffer(b''.join(game.to_bytes() for game in games), dtype=np.int8).reshape(-1, 62)
+    return positions[:, :61], positions[:, 61]
+
+
+def legal_move_masks(boards: np.ndarray, turns: np.ndarray) -> np.ndarray:
+    """Computes which moves of `abalone.moves.MOVES` are legal in each of many positions. The result is the same as\
+    that of `abalone.game.Game.generate_legal_moves`, but the moves of all positions are checked at once: The states of\
+    the six spaces that determine the legality of a move (e.g. for an inline move up to three own marbles, up to two\
+    opponent marbles and the space to which they are pushed) are gathered from the boards and combined into an index of\
+    a precomputed table of legal combinations.
+
+    Args:
+        boards: An integer array of shape `(N, 61)` with the values of the `abalone.enums.Marble`s.
+        turns: An integer array of shape `(N,)` with the values of the `abalone.enums.Player`s in turn.
+
+    Returns:
+        A boolean array of shape `(N, len(abalone.moves.MOVES))`.
+    """
+    # the states of the spaces relative to the player in turn with an extra space for `Space.OFF`, transposed such that
+    # gathering the spaces of the moves copies whole rows
+    states = np.empty((boards.shape[1] + 1, len(boards)), dtype=np.int8)
+    np.multiply(boards.T, np.asarray(turns, dtype=np.int8), out=states[:-1])
+    states[-1] = _OFF
+    states = (states & 3).astype(np.int16)
+
+    codes = states[_GATHER[:, 0]] + _LEGAL_OFFSETS
+    for i in range(1, 6):
+        codes += states[_GATHER[:, i]] << 2 * i
+    return _LEGAL[codes].T
+
+
+def apply_moves(boards: np.ndarray, turns: np.ndarray, moves: np.ndarray) -> np.ndarray:
+    """Performs one legal move in each of many positions, like `abalone.game.Game.move`. The players in turn are not\
+    switched.
+
+    Args:
+        boards: An integer array of shape `(N, 61)` with the values of the `abalone.enums.Marble`s.
+        turns: An integer array of shape `(N,)` with the values of the `abalone.enums.Player`s in turn.
+        moves: An integer array of shape `(N,)` with the indices of legal moves in `abalone.moves.MOVES`, see\
+            `abalone.batch.legal_move_masks`.
+
+    Returns:
+        A new array of shape `(N, 61)` and type `np.int8` with the boards after the moves.
+    """
+    # with an extra column for `Space.OFF`, which receives the marbles that are pushed off the board
+    padded = np.empty((len(boards), boards.shape[1] + 1), dtype=np.int8)
+    padded[:, :-1] = boards
+    padded[:, -1] = _OFF
+    turns = np.asarray(turns, dtype=np.int8)
+    moves = np.asarray(moves)
+
+    # an inline move shifts the chain of marbles at the start of its line by one space
+    rows = np.flatnonzero(moves < INLINE_MOVES)
+    spaces = _INLINE_GATHER[moves[rows]]
+    line = padded[rows[:, None], spaces]
+    chain = np.cumprod((line != _EMPTY) & (line != _OFF), axis=1).sum(axis=1)
+    shifted = np.zeros_like(line)
+    shifted[:, 1:] = line[:, :-1]
+    padded[rows[:, None], spaces] = np.where(np.arange(line.shape[1]) <= chain[:, None], shifted, line)
+
+    rows = np.flatnonzero(moves >= INLINE_MOVES)
+    broadside_moves = moves[rows] - INLINE_MOVES
+    padded[rows[:, None], _BROADSIDE_MARBLES_GATHER[broadside_moves]] = _EMPTY
+    padded[rows[:, None], _BROADSIDE_DESTINATIONS_GATHER[broadside_moves]] = turns[rows, None]
+
+    return padded[:, :-1].copy()
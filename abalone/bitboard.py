@@ -0,0 +1,420 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module provides a representation of game states as bitboards and a fast generator of legal moves.
+
+A bitboard is an integer in which every bit represents a space of the board. The state of a game is given by two
+bitboards, one for the marbles of each player. The spaces are laid out on a grid of 9 rows (A to I) with 10 columns
+(1 to 9 and an unused column) each, so that moving all marbles of a bitboard one space in a given
+`abalone.enums.Direction` is a single shift by `_SHIFTS[direction]`. Bits that are shifted beyond the edge of the board
+are cleared by `_VALID`.
+"""
+
+from typing import Dict, Generator, Iterable, List, Tuple, Union
+
+from abalone.enums import Direction, Marble, Player, Space
+# the Zobrist keys of `Game` are reused, so that a `Bitboard` has the same hash as the equivalent `Game`
+from abalone.game import _ZOBRIST_SPACE_KEYS, _ZOBRIST_WHITE_KEY, Game, IllegalMoveException
+from abalone.utils import SPACES, line_from_to
+
+_SHIFTS: Dict[Direction, int] = {
+    Direction.NORTH_EAST: 11,
+    Direction.EAST: 1,
+    Direction.SOUTH_EAST: -10,
+    Direction.SOUTH_WEST: -11,
+    Direction.WEST: -1,
+    Direction.NORTH_WEST: 10
+}
+"""The distance between the bits of two neighboring spaces in every `abalone.enums.Direction`."""
+
+_OPPOSITES: Dict[Direction, Direction] = {
+    Direction.NORTH_EAST: Direction.SOUTH_WEST,
+    Direction.EAST: Direction.WEST,
+    Direction.SOUTH_EAST: Direction.NORTH_WEST,
+    Direction.SOUTH_WEST: Direction.NORTH_EAST,
+    Direction.WEST: Direction.EAST,
+    Direction.NORTH_WEST: Direction.SOUTH_EAST
+}
+"""The opposite of every `abalone.enums.Direction`."""
+
+_LINE_DIRECTIONS: Tuple[Direction, Direction, Direction] = (Direction.NORTH_WEST, Direction.NORTH_EAST, Direction.EAST)
+"""The directions in which the lines of `abalone.game.Game.generate_own_marble_lines` extend from their first space."""
+
+_SPACE_BITS: Dict[Space, int] = {
+    space: 1 << ((ord(space.value[0]) - ord('A')) * 10 + int(space.value[1]) - 1) for space in SPACES
+}
+"""The bit of every `abalone.enums.Space` except `abalone.enums.Space.OFF`."""
+
+_BIT_SPACES: Dict[int, Space] = {bit.bit_length() - 1: space for space, bit in _SPACE_BITS.items()}
+"""The `abalone.enums.Space` of every bit position that represents a space on the board."""
+
+_VALID: int = sum(_SPACE_BITS.values())
+"""A bitboard with the bits of all spaces on the board."""
+
+_BLACK_KEYS: Dict[int, int] = {_SPACE_BITS[space]: keys[1] for space, keys in zip(SPACES, _ZOBRIST_SPACE_KEYS)}
+"""The Zobrist key of a black marble by the bit of its space."""
+
+_WHITE_KEYS: Dict[int, int] = {_SPACE_BITS[space]: keys[-1] for space, keys in zip(SPACES, _ZOBRIST_SPACE_KEYS)}
+"""The Zobrist key of a white marble by the bit of its space."""
+
+
+def _zobrist_of_bits(bits: int, keys: Dict[int, int]) -> int:
+    """Combines the Zobrist keys of the marbles of a bitboard, see `abalone.bitboard.Bitboard.zobrist`.
+
+    Args:
+        bits: A bitboard.
+        keys: `_BLACK_KEYS` or `_WHITE_KEYS`.
+
+    Returns:
+        The XOR of the keys of all set bits.
+    """
+    zobrist = 0
+    while bits:
+        lowest = bits & -bits
+        zobrist ^= keys[lowest]
+        bits ^= lowest
+    return zobrist
+
+
+_BACK_SHIFTS: Dict[Direction, Tuple[int, int]] = {
+    direction: (max(-shift, 0), max(shift, 0)) for direction, shift in _SHIFTS.items()
+}
+"""The amounts of a left and a right shift that move all bits of a bitboard one space against every\
+`abalone.enums.Direction`, i.e. every space gets the state of its neighbor in that direction. One of the amounts is\
+always 0."""
+
+_SIDEWAYS: Dict[Direction, Tuple[Direction, ...]] = {
+    line_direction: tuple(direction for direction in Direction
+                          if direction is not line_direction and direction is not _OPPOSITES[line_direction])
+    for line_direction in _LINE_DIRECTIONS
+}
+"""The directions of broadside moves of lines that extend in one of the `_LINE_DIRECTIONS`."""
+
+
+def _shift(bitboard: int, direction: Direction) -> int:
+    """Moves all bits of a bitboard one space in a given `abalone.enums.Direction`. Bits that would leave the board are\
+    cleared.
+
+    Args:
+        bitboard: The bitboard to be shifted.
+        direction: The `abalone.enums.Direction` of the shift.
+
+    Returns:
+        The shifted bitboard.
+    """
+    shift = _SHIFTS[direction]
+    return (bitboard << shift if shift > 0 else bitboard >> -shift) & _VALID
+
+
+def _bit_positions(bitboard: int) -> Generator[int, None, None]:
+    """Generates the positions of all set bits of a bitboard, starting with the lowest.
+
+    Args:
+        bitboard: The bitboard whose bits are wanted.
+
+    Yields:
+        The position of a set bit, i.e. `n` for the bit `1 << n`.
+    """
+    while bitboard:
+        lowest = bitboard & -bitboard
+        yield lowest.bit_length() - 1
+        bitboard ^= lowest
+
+
+def _off_ahead(direction: Direction, distance: int) -> int:
+    """Computes the bitboard of all spaces whose neighbor at a given distance in a given `abalone.enums.Direction` is\
+    off the board.
+
+    Args:
+        direction: The `abalone.enums.Direction` in which the neighbor is located.
+        distance: The number of spaces between a space and its neighbor.
+
+    Returns:
+        A bitboard.
+    """
+    valid_ahead = _VALID
+    for _ in range(distance):
+        valid_ahead = _shift(valid_ahead, _OPPOSITES[direction])
+    return _VALID & ~valid_ahead
+
+
+_OFF_AHEAD: Dict[Direction, Tuple[int, int, int]] = {
+    direction: (_off_ahead(direction, 3), _off_ahead(direction, 4), _off_ahead(direction, 5)) for direction in Direction
+}
+"""The bitboards of all spaces whose third, fourth and fifth neighbor in every `abalone.enums.Direction` is off the\
+board, i.e. to which marbles can be pushed off by a sumito."""
+
+_LINE_MASKS: Dict[Tuple[Space, Space], int] = {
+    (line[0], line[-1]): sum(_SPACE_BITS[space] for space in line)
+    for line in (line_from_to(first, last)[0] for first in SPACES for last in SPACES if first is not last)
+    if line is not None and len(line) <= 3
+}
+"""The bitboards of all lines of two or three spaces, by the boundaries of the lines. The bitboards of single spaces\
+are given by `_SPACE_BITS`."""
+
+
+def spaces_to_mask(spaces: Iterable[Space]) -> int:
+    """Computes the bitboard of a collection of `abalone.enums.Space`s, e.g. to evaluate the marbles on these spaces.
+
+    Args:
+        spaces: `abalone.enums.Space`s on the board (i.e. except `abalone.enums.Space.OFF`).
+
+    Returns:
+        A bitboard in which the bits of `spaces` are set.
+    """
+    mask = 0
+    for space in spaces:
+        mask |= _SPACE_BITS[space]
+    return mask
+
+
+def mask_to_spaces(mask: int) -> List[Space]:
+    """Returns the `abalone.enums.Space`s of all set bits of a bitboard.
+
+    Args:
+        mask: A bitboard, e.g. `abalone.bitboard.Bitboard.black`.
+
+    Returns:
+        A list of `abalone.enums.Space`s, ordered like `abalone.utils.SPACES`.
+    """
+    return [_BIT_SPACES[position] for position in _bit_positions(mask & _VALID)]
+
+
+def popcount(mask: int) -> int:
+    """Counts the set bits of a bitboard, e.g. the marbles of a player.
+
+    Args:
+        mask: A bitboard, e.g. `abalone.bitboard.Bitboard.black`.
+
+    Returns:
+        The number of set bits.
+    """
+    return bin(mask).count('1')
+
+
+class Bitboard:
+    """Represents the state of an Abalone game with two bitboards. In contrast to `abalone.game.Game`, instances are\
+    immutable: `abalone.bitboard.Bitboard.move` returns a new instance."""
+
+    __slots__ = ('black', 'white', 'turn', 'zobrist')
+
+    def __init__(self, black: int, white: int, turn: Player = Player.BLACK, zobrist: Union[int, None] = None):
+        self.black = black
+        """The bitboard of the black marbles."""
+        self.white = white
+        """The bitboard of the white marbles."""
+        self.turn = turn
+        """The `abalone.enums.Player` whose turn it is."""
+        if zobrist is None:
+            zobrist = _zobrist_of_bits(black, _BLACK_KEYS) ^ _zobrist_of_bits(white, _WHITE_KEYS)
+            if turn is Player.WHITE:
+                zobrist ^= _ZOBRIST_WHITE_KEY
+        self.zobrist = zobrist
+        """The 64 bit Zobrist hash of the position, which is equal to the `abalone.game.Game.zobrist` of the same\
+        position. `abalone.bitboard.Bitboard.move` updates it incrementally."""
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Bitboard) and (self.black, self.white, self.turn) == (other.black, other.white,
+                                                                                       other.turn)
+
+    def __hash__(self) -> int:
+        return self.zobrist
+
+    @classmethod
+    def from_game(cls, game: Game) -> 'Bitboard':
+        """Converts a `abalone.game.Game` to a `abalone.bitboard.Bitboard`.
+
+        Args:
+            game: The `abalone.game.Game` to be converted.
+
+        Returns:
+            A `abalone.bitboard.Bitboard` with the same position and player in turn as `game`.
+        """
+        black = 0
+        white = 0
+        for space in SPACES:
+            marble = game.get_marble(space)
+            if marble is Marble.BLACK:
+                black |= _SPACE_BITS[space]
+            elif marble is Marble.WHITE:
+                white |= _SPACE_BITS[space]
+        return cls(black, white, game.turn, game.zobrist)
+
+    def to_game(self) -> Game:
+        """Converts this `abalone.bitboard.Bitboard` to a `abalone.game.Game`.
+
+        Returns:
+            A new `abalone.game.Game` with the same position and player in turn.
+        """
+        game = Game(first_turn=self.turn)
+        for space, bit in _SPACE_BITS.items():
+            if self.black & bit:
+                game.set_marble(space, Marble.BLACK)
+            elif self.white & bit:
+                game.set_marble(space, Marble.WHITE)
+            else:
+                game.set_marble(space, Marble.BLANK)
+        return game
+
+    def get_score(self) -> Tuple[int, int]:
+        """Counts how many marbles the players still have on the board.
+
+        Returns:
+            A tuple with the number of marbles of black and white, in that order.
+        """
+        return popcount(self.black), popcount(self.white)
+
+    def _own_and_opp(self) -> Tuple[int, int]:
+        """Returns the bitboards of the player in turn and the opponent, in that order."""
+        return (self.black, self.white) if self.turn is Player.BLACK else (self.white, self.black)
+
+    def inline_move_masks(self) -> Dict[Direction, int]:
+        """Computes the trailing marbles ("cabooses") of all legal inline moves, including sumitos.
+
+        Returns:
+            A bitboard of cabooses for every `abalone.enums.Direction` of movement.
+        """
+        own, opp = self._own_and_opp()
+        empty = _VALID & ~own & ~opp
+        masks = {}
+        for direction in Direction:
+            # shifting by `left` and `right` moves the state of the space ahead (in `direction`) to every space
+            left, right = _BACK_SHIFTS[direction]
+            off3, off4, off5 = _OFF_AHEAD[direction]
+            own1 = own << left >> right & _VALID
+            own2 = own1 << left >> right & _VALID
+            own3 = own2 << left >> right & _VALID
+            empty1 = empty << left >> right & _VALID
+            empty2 = empty1 << left >> right & _VALID
+            empty3 = empty2 << left >> right & _VALID
+            empty4 = empty3 << left >> right & _VALID
+            empty5 = empty4 << left >> right & _VALID
+            opp2 = opp << 2 * left >> 2 * right & _VALID
+            opp3 = opp2 << left >> right & _VALID
+            opp4 = opp3 << left >> right & _VALID
+            # own marbles followed by at least one, two or three own marbles in `direction`
+            line2 = own & own1
+            line3 = line2 & own2
+            line4 = line3 & own3
+            masks[direction] = (own & ~line2 & empty1) \
+                | (line2 & ~line3 & (empty2 | opp2 & (empty3 | off3))) \
+                | (line3 & ~line4 & (empty3 | opp3 & (empty4 | off4 | opp4 & (empty5 | off5))))
+        return masks
+
+    def broadside_move_masks(self) -> Dict[Tuple[Direction, int, Direction], int]:
+        """Computes the first marbles of all legal broadside moves. The first marble is the boundary from which the\
+        line extends in one of the directions used by `abalone.game.Game.generate_own_marble_lines`.
+
+        Returns:
+            A bitboard of first marbles for every tuple of 1. the `abalone.enums.Direction` in which the line extends,\
+            2. the number of marbles in the line (two or three) and 3. the `abalone.enums.Direction` of movement.
+        """
+        own, opp = self._own_and_opp()
+        empty = _VALID & ~own & ~opp
+        masks = {}
+        for line_direction in _LINE_DIRECTIONS:
+            line_left, line_right = _BACK_SHIFTS[line_direction]
+            line2 = own & (own << line_left >> line_right)
+            line3 = line2 & (own << 2 * line_left >> 2 * line_right)
+            for direction in _SIDEWAYS[line_direction]:
+                left, right = _BACK_SHIFTS[direction]
+                destination_empty = empty << left >> right & _VALID
+                destination_empty2 = destination_empty & (destination_empty << line_left >> line_right)
+                masks[line_direction, 2, direction] = line2 & destination_empty2
+                masks[line_direction, 3, direction] = line3 & destination_empty2 \
+                    & (destination_empty << 2 * line_left >> 2 * line_right)
+        return masks
+
+    def generate_own_marble_lines(self) -> Generator[Union[Space, Tuple[Space, Space]], None, None]:
+        """Generates all adjacent straight lines with up to three marbles of the player whose turn it is, like\
+        `abalone.game.Game.generate_own_marble_lines`, but ordered by the length and direction of the lines.
+
+        Yields:
+            Either one or two `abalone.enums.Space`s according to the first parameter of `abalone.game.Game.move`.
+        """
+        own, _ = self._own_and_opp()
+        for position in _bit_positions(own):
+            yield _BIT_SPACES[position]
+        for line_direction in _LINE_DIRECTIONS:
+            back = _OPPOSITES[line_direction]
+            line2 = own & _shift(own, back)
+            line3 = line2 & _shift(_shift(own, back), back)
+            shift = _SHIFTS[line_direction]
+            for length, lines in ((2, line2), (3, line3)):
+                for position in _bit_positions(lines):
+                    yield _BIT_SPACES[position], _BIT_SPACES[position + (length - 1) * shift]
+
+    def generate_legal_moves(self) -> Generator[Tuple[Union[Space, Tuple[Space, Space]], Direction], None, None]:
+        """Generates all possible moves that the player whose turn it is can perform. These are the same moves as\
+        those of `abalone.game.Game.generate_legal_moves`, but ordered by the type and direction of the moves.
+
+        Yields:
+            A tuple of 1. either one or a tuple of two `abalone.enums.Space`s and 2. a `abalone.enums.Direction`
+        """
+        for direction, cabooses in self.inline_move_masks().items():
+            for position in _bit_positions(cabooses):
+                yield _BIT_SPACES[position], direction
+        for (line_direction, length, direction), first_marbles in self.broadside_move_masks().items():
+            shift = (length - 1) * _SHIFTS[line_direction]
+            for position in _bit_positions(first_marbles):
+                yield (_BIT_SPACES[position], _BIT_SPACES[position + shift]), direction
+
+    def move(self, marbles: Union[Space, Tuple[Space, Space]], direction: Direction) -> 'Bitboard':
+        """Performs a legal move and switches the player in turn, without modifying this instance.
+
+        The legality of the move is not fully checked, as this method is intended to be used with moves from\
+        `abalone.bitboard.Bitboard.generate_legal_moves`. Use `abalone.game.Game.move` to validate arbitrary moves.
+
+        Args:
+            marbles: The `abalone.enums.Space`s with the marbles to be moved, in accordance with the parameters of\
+                `abalone.game.Game.move`.
+            direction: The `abalone.enums.Direction` of movement.
+
+        Returns:
+            A new `abalone.bitboard.Bitboard` with the resulting position.
+
+        Raises:
+            IllegalMoveException: Only own marbles may be moved
+        """
+        own, opp = self._own_and_opp()
+        if isinstance(marbles, Space):
+            bit = _SPACE_BITS.get(marbles, 0)
+            if not own & bit:
+                raise IllegalMoveException('Only own marbles may be moved')
+            shift = _SHIFTS[direction]
+            while own & bit:
+                bit = bit << shift if shift > 0 else bit >> -shift
+            own = own & ~_SPACE_BITS[marbles] | bit
+            if opp & bit:
+                while opp & bit:
+                    bit = bit << shift if shift > 0 else bit >> -shift
+                opp = opp & ~(own & opp) | bit & _VALID
+        else:
+            line = _LINE_MASKS.get(marbles, 0)
+            if not line or own & line != line:
+                raise IllegalMoveException('Only own marbles may be moved')
+            own = own & ~line | _shift(line, direction)
+        if self.turn is Player.BLACK:
+            black, white, turn = own, opp, Player.WHITE
+        else:
+            black, white, turn = opp, own, Player.BLACK
+        # only the keys of the changed bits are updated
+        zobrist = self.zobrist ^ _ZOBRIST_WHITE_KEY ^ _zobrist_of_bits(self.black ^ black, _BLACK_KEYS) \
+            ^ _zobrist_of_bits(self.white ^ white, _WHITE_KEYS)
+        return Bitboard(black, white, turn, zobrist)
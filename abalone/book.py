@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module builds opening books from recorded games (see `abalone.records`) and provides a player that plays the\
+moves of a book.
+
+A book stores how often every move has been played in every position of the first plies of the games and how many\
+points it has scored for the player who made it (2 for a win, 1 for a draw and 0 for a loss). Positions that are\
+equivalent under the symmetries of the board or by swapping the colors share their statistics, see\
+`abalone.symmetry`.
+
+A book file starts with the magic bytes `ABOB` and a version byte, followed by the number of entries and the entries,\
+which are sorted by their key and move, so that they can be searched in a memory-mapped file without loading it:
+
+| Bytes | Content |
+| --- | --- |
+| 8 | Key of the position, i.e. the `abalone.game.Game.zobrist` hash of its canonical representative |
+| 2 | Index of the move (in the canonical position) in `abalone.moves.MOVES` |
+| 4 | Number of games in which the move has been played |
+| 4 | Number of points of the move |
+
+All integers are little-endian and unsigned.
+"""
+
+import mmap
+import random
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, NamedTuple, Sequence, Tuple, Union
+
+from abalone.abstract_player import AbstractPlayer
+from abalone.enums import Direction, Space
+from abalone.game import Game
+from abalone.moves import decode_move, encode_move
+from abalone.records import GameRecord, read_games
+from abalone.symmetry import MOVE_PERMUTATIONS, SYMMETRIES, canonical_position, inverse, transform_move, \
+    transform_position
+
+MAGIC = b'ABOB\x01'
+"""The magic bytes at the start of a book file, including the version of the format."""
+
+_COUNT = struct.Struct('<I')
+_ENTRY = struct.Struct('<QHII')
+_KEY = struct.Struct('<Q')
+_HEADER_SIZE = len(MAGIC) + _COUNT.size
+
+
+class BookMove(NamedTuple):
+    """The statistics of a move in an `abalone.book.OpeningBook`."""
+    move: Tuple[Union[Space, Tuple[Space, Space]], Direction]
+    """The move according to the parameters of `abalone.game.Game.move`."""
+    games: int
+    """The number of games in which the move has been played."""
+    points: int
+    """The number of points of the move for the player who made it (2 for a win, 1 for a draw)."""
+
+    @property
+    def score(self) -> float:
+        """The average result of the move for the player who made it, between 0 (always lost) and 1 (always won)."""
+        return self.points / (2 * self.games)
+
+
+def _canonical(game: Game) -> Tuple[int, int, List[int]]:
+    """Computes the key of a position and the symmetries that transform it to its canonical representative.
+
+    Args:
+        game: The position.
+
+    Returns:
+        A tuple of 1. the key of the position in a book, 2. the symmetry returned by\
+        `abalone.symmetry.canonical_position` and 3. all symmetries that result in the canonical position (more than\
+        one if the position is symmetric).
+    """
+    position = game.to_bytes()
+    canonical, symmetry, swapped = canonical_position(position, colors=True)
+    symmetries = [other for other in range(SYMMETRIES) if transform_position(position, other, swapped) == canonical]
+    return Game.from_bytes(canonical).zobrist, symmetry, symmetries
+
+
+def _canonical_move(move: Tuple[Union[Space, Tuple[Space, Space]], Direction], symmetries: List[int]) -> int:
+    """Returns the index of a move in the canonical position. Moves that are equivalent in a symmetric position get\
+    the same index.
+
+    Args:
+        move: The move in the original position.
+        symmetries: All symmetries that transform the original position to the canonical position.
+
+    Returns:
+        The index of the transformed move in `abalone.moves.MOVES`.
+    """
+    index = encode_move(move)
+    return min(MOVE_PERMUTATIONS[symmetry][index] for symmetry in symmetries)
+
+
+class BookBuilder:
+    """Aggregates the statistics of the moves of many games for an `abalone.book.OpeningBook`.
+
+    Example:
+        ```python
+        builder = BookBuilder(max_plies=16)
+        builder.add_records('games.abgr')
+        builder.write('book.abob', min_games=4)
+        ```
+    """
+
+    def __init__(self, max_plies: int = 20):
+        """Creates an empty builder.
+
+        Args:
+            max_plies: The number of moves from the start of every game that are added to the book.
+        """
+        self.max_plies = max_plies
+        self.statistics: Dict[Tuple[int, int], List[int]] = {}
+        """The number of games and points of every move by the key of the position and the canonical move index."""
+
+    def __len__(self) -> int:
+        return len(self.statistics)
+
+    def add_game(self, record: GameRecord) -> None:
+        """Adds the first `max_plies` moves of a game.
+
+        Args:
+            record: An `abalone.records.GameRecord`.
+        """
+        game = Game(record.initial_position, record.first_turn)
+        for move in record.moves[:self.max_plies]:
+            key, _, symmetries = _canonical(game)
+            if record.winner is None:
+                points = 1
+            else:
+                points = 2 if record.winner is game.turn else 0
+            statistics = self.statistics.setdefault((key, _canonical_move(move, symmetries)), [0, 0])
+            statistics[0] += 1
+            statistics[1] += points
+            game.move(*move)
+            game.switch_player()
+
+    def add_records(self, path: str) -> None:
+        """Adds all games of a record file.
+
+        Args:
+            path: The path of the record file.
+        """
+        for record in read_games(path):
+            self.add_game(record)
+
+    def update(self, other: 'BookBuilder') -> None:
+        """Adds the statistics of another builder, e.g. of another process.
+
+        Args:
+            other: An `abalone.book.BookBuilder`.
+        """
+        for entry, (games, points) in other.statistics.items():
+            statistics = self.statistics.setdefault(entry, [0, 0])
+            statistics[0] += games
+            statistics[1] += points
+
+    def write(self, path: str, min_games: int = 1) -> int:
+        """Writes the book to a file, which is overwritten if it exists.
+
+        Args:
+            path: The path of the book file.
+            min_games: The number of games in which a move must have been played to be included.
+
+        Returns:
+            The number of written entries.
+        """
+        entries = sorted(entry for entry, (games, _) in self.statistics.items() if games >= min_games)
+        with open(path, 'wb') as file:
+            file.write(MAGIC + _COUNT.pack(len(entries)))
+            file.write(b''.join(_ENTRY.pack(key, move, *self.statistics[key, move]) for key, move in entries))
+        return len(entries)
+
+
+def _aggregate(path: str, max_plies: int) -> BookBuilder:
+    """Aggregates the games of a record file in a worker process of `abalone.book.build_book`.
+
+    Args:
+        path: The path of the record file.
+        max_plies: The number of plies of every game that are added to the book.
+
+    Returns:
+        A new `abalone.book.BookBuilder` with the statistics of the record file.
+    """
+    builder = BookBuilder(max_plies)
+    builder.add_records(path)
+    return builder
+
+
+def build_book(record_paths: Sequence[str], path: str, max_plies: int = 20, min_games: int = 1,
+               workers: Union[int, None] = None) -> int:
+    """Builds a book from the games of many record files, e.g. of archived or self-play games, which are aggregated\
+    in parallel processes.
+
+    Args:
+        record_paths: The paths of the record files.
+        path: The path of the book file.
+        max_plies: The number of moves from the start of every game that are added to the book.
+        min_games: The number of games in which a move must have been played to be included.
+        workers: The number of processes (`None` for the number of processors). With a single worker, the games are\
+            aggregated in the current process.
+
+    Returns:
+        The number of entries of the book.
+    """
+    aggregate = partial(_aggregate, max_plies=max_plies)
+    builder = BookBuilder(max_plies)
+    if workers == 1:
+        for other in map(aggregate, record_paths):
+            builder.update(other)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for other in executor.map(aggregate, record_paths):
+                builder.update(other)
+    return builder.write(path, min_games)
+
+
+class OpeningBook:
+    """A book file opened for lookups. The file is memory-mapped and searched by bisection, so opening a book takes\
+    constant time and memory and a lookup reads only a few pages of the file.
+
+    Example:
+        ```python
+        with OpeningBook('book.abob') as book:
+            moves = book.lookup(game)
+        ```
+    """
+
+    def __init__(self, path: str):
+        """Opens a book file.
+
+        Args:
+            path: The path of the book file.
+
+        Raises:
+            Exception: Not a book file
+        """
+        with open(path, 'rb') as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise Exception('Not a book file')
+            self._entries = _COUNT.unpack(file.read(_COUNT.size))[0]
+            # an empty file cannot be memory-mapped
+            self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if self._entries else b''
+
+    def __enter__(self) -> 'OpeningBook':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._entries
+
+    def close(self) -> None:
+        """Closes the file."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def _find(self, key: int) -> int:
+        """Finds the first entry of a position by bisection.
+
+        Args:
+            key: The key of the position.
+
+        Returns:
+            The index of the first entry whose key is not less than `key`.
+        """
+        low, high = 0, self._entries
+        while low < high:
+            middle = (low + high) // 2
+            if _KEY.unpack_from(self._data, _HEADER_SIZE + middle * _ENTRY.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def lookup(self, game: Game) -> List[BookMove]:
+        """Looks up the moves of a position.
+
+        Args:
+            game: The position.
+
+        Returns:
+            The `abalone.book.BookMove`s of the position (transformed to `game`), ordered by the number of games or an\
+            empty list if the position is not in the book.
+        """
+        key, symmetry, _ = _canonical(game)
+        back = inverse(symmetry)
+        moves = []
+        for index in range(self._find(key), self._entries):
+            entry_key, move, games, points = _ENTRY.unpack_from(self._data, _HEADER_SIZE + index * _ENTRY.size)
+            if entry_key != key:
+                break
+            moves.append(BookMove(transform_move(decode_move(move), back), games, points))
+        moves.sort(key=lambda book_move: book_move.games, reverse=True)
+        return moves
+
+
+class BookPlayer(AbstractPlayer):
+    """A player that plays the moves of an `abalone.book.OpeningBook` as long as the position is in the book and asks\
+    another player otherwise.
+
+    After every turn, the attribute `in_book` tells whether the move has been taken from the book. The player owns the\
+    `abalone.book.OpeningBook`, which is closed by `abalone.book.BookPlayer.close`.
+    """
+
+    def __init__(self, player: AbstractPlayer, path: str, min_games: int = 1, weighted: bool = False):
+        """Opens the book.
+
+        Args:
+            player: The player for positions that are not in the book.
+            path: The path of the book file.
+            min_games: The number of games in which a move must have been played to be chosen.
+            weighted: Whether a move is chosen randomly with a probability proportional to its number of games\
+                (by the module `random`) instead of the move with the best score.
+        """
+        self.player = player
+        self.book = OpeningBook(path)
+        self.min_games = min_games
+        self.weighted = weighted
+        self.in_book = False
+        """Whether the last move has been taken from the book."""
+
+    def turn(self, game: Game, moves_history: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]) \
+            -> Tuple[Union[Space, Tuple[Space, Space]], Direction]:
+        # moves of another position with the same key are not legal in general
+        candidates = [book_move for book_move in self.book.lookup(game)
+                      if book_move.games >= self.min_games and game.is_legal_move(*book_move.move)]
+        self.in_book = bool(candidates)
+        if not candidates:
+            return self.player.turn(game, moves_history)
+        if self.weighted:
+            return random.choices(candidates, [book_move.games for book_move in candidates])[0].move
+        return max(candidates, key=lambda book_move: (book_move.score, book_move.games)).move
+
+    def close(self) -> None:
+        """Closes the book."""
+        self.book.close()
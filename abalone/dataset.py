@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module exports the positions of recorded games (see `abalone.records`) as NumPy arrays, e.g. for training\
+evaluation functions. It requires NumPy, which can be installed with `pip install abalone-boai[numpy]`.
+
+The positions are stored as `.npy` files of records of the type `abalone.dataset.POSITION_DTYPE`. They can be loaded\
+as memory-mapped arrays with `abalone.dataset.load_positions`, so a training loop can slice them without reading or\
+copying whole files.
+"""
+
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+
+from abalone.records import index_games, read_games, replay
+
+POSITION_DTYPE = np.dtype([('cells', np.int8, (61,)), ('turn', np.int8), ('score', np.int8, (2,)),
+                           ('outcome', np.int8)])
+"""The type of a position record (65 bytes): The values of the `abalone.enums.Marble`s ordered like\
+`abalone.utils.SPACES`, the value of the `abalone.enums.Player` in turn, the score as returned by\
+`abalone.game.Game.get_score` and the value of the `abalone.enums.Player` who won the game (0 if no one has won). The\
+first 62 bytes are equal to `abalone.game.Game.to_bytes`."""
+
+_TAIL = struct.Struct('<bbb')
+
+
+def count_positions(record_path: str, start: int = 0, stop: Union[int, None] = None) -> int:
+    """Counts the positions of recorded games without replaying them. Only the headers of the games are read (see\
+    `abalone.records.index_games`).
+
+    Args:
+        record_path: The path of a record file.
+        start: The index of the first game.
+        stop: The index after the last game or `None` for all remaining games.
+
+    Returns:
+        The number of positions of the games including their initial and final positions.
+    """
+    return sum(moves + 1 for _, moves in index_games(record_path)[start:stop])
+
+
+def _export_task(record_path: str, output_path: str, games: List[Tuple[int, int]]) \
+        -> Tuple[str, str, Union[int, None], int, int]:
+    """Prepares the export of consecutive games of a record file.
+
+    Args:
+        record_path: The path of a record file.
+        output_path: The path of the `.npy` file to be written.
+        games: The offsets and numbers of moves of the games as returned by `abalone.records.index_games`.
+
+    Returns:
+        The arguments of `abalone.dataset._export_games`.
+    """
+    offset = games[0][0] if games else None
+    return record_path, output_path, offset, len(games), sum(moves + 1 for _, moves in games)
+
+
+def _export_games(record_path: str, output_path: str, offset: Union[int, None], games: int, count: int) -> int:
+    """Replays consecutive games of a record file and writes all of their positions to a `.npy` file. Only the games\
+    to be exported are read.
+
+    Args:
+        record_path: The path of a record file.
+        output_path: The path of the `.npy` file to be written.
+        offset: The offset of the first game as returned by `abalone.records.index_games` (`None` if there are no\
+            games).
+        games: The number of games.
+        count: The number of positions of the games.
+
+    Returns:
+        The number of exported positions.
+    """
+    positions = np.lib.format.open_memmap(output_path, mode='w+', dtype=POSITION_DTYPE, shape=(count,))
+    index = 0
+    buffer = bytearray()
+    for record in islice(read_games(record_path, offset), games):
+        outcome = record.winner.value if record.winner is not None else 0
+        for game in replay(record):
+            buffer += game.to_bytes()
+            buffer += _TAIL.pack(*game.get_score(), outcome)
+        game_positions = np.frombuffer(bytes(buffer), dtype=POSITION_DTYPE)
+        positions[index:index + len(game_positions)] = game_positions
+        index += len(game_positions)
+        buffer.clear()
+    positions.flush()
+    del positions
+    return count
+
+
+def export_positions(record_path: str, output_path: str, start: int = 0, stop: Union[int, None] = None) -> int:
+    """Replays recorded games and writes all of their positions to a `.npy` file.
+
+    Args:
+        record_path: The path of a record file.
+        output_path: The path of the `.npy` file to be written.
+        start: The index of the first game.
+        stop: The index after the last game or `None` for all remaining games.
+
+    Returns:
+        The number of exported positions.
+    """
+    return _export_games(*_export_task(record_path, output_path, index_games(record_path)[start:stop]))
+
+
+def _export_shard(task: Tuple[str, str, Union[int, None], int, int]) -> int:
+    """Calls `abalone.dataset._export_games` with the arguments of a task of `abalone.dataset.export_shards`."""
+    return _export_games(*task)
+
+
+def export_shards(record_paths: Sequence[str], directory: str, games_per_shard: Union[int, None] = None,
+                  workers: Union[int, None] = None) -> List[str]:
+    """Exports the positions of many record files to shards of `.npy` files in parallel processes. Every record file\
+    is split into shards of `games_per_shard` games, which are named after the record file and the number of the\
+    shard, e.g. `games-00000.npy`. The record files are split by the offsets of their games (see\
+    `abalone.records.index_games`), so every shard reads only its own games.
+
+    Args:
+        record_paths: The paths of the record files.
+        directory: The directory of the shards, which is created if it does not exist yet.
+        games_per_shard: The maximum number of games per shard or `None` for one shard per record file.
+        workers: The number of processes (`None` for the number of processors). With a single worker, the shards are\
+            exported in the current process.
+
+    Returns:
+        The paths of the shards, ordered by record file and game.
+    """
+    os.makedirs(directory, exist_ok=True)
+    tasks = []
+    for record_path in record_paths:
+        name = os.path.splitext(os.path.basename(record_path))[0]
+        games = index_games(record_path)
+        step = games_per_shard or max(len(games), 1)
+        for shard, start in enumerate(range(0, max(len(games), 1), step)):
+            tasks.append(_export_task(record_path, os.path.join(directory, f'{name}-{shard:05d}.npy'),
+                                      games[start:start + step]))
+
+    if workers == 1:
+        list(map(_export_shard, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_export_shard, tasks))
+    return [task[1] for task in tasks]
+
+
+def load_positions(path: str) -> np.ndarray:
+    """Opens an exported `.npy` file as a read-only memory-mapped array.
+
+    Args:
+        path: The path of the `.npy` file.
+
+    Returns:
+        A one-dimensional array of the type `abalone.dataset.POSITION_DTYPE`.
+    """
+    return np.load(path, mmap_mode='r')
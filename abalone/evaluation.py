@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module provides the evaluation of positions by features that are kept up to date with every change of the\
+board, so that evaluating a position during a search only takes a few lookups instead of a scan of the board.
+
+The features of a player are:
+
+- material: the number of their marbles on the board
+- centrality: the sum of the distances of their marbles to the edge of the board
+- adjacency: the number of pairs of their marbles on neighboring spaces
+- edge: the number of their marbles on the edge of the board
+
+Example:
+    ```python
+    game = EvaluatedGame()
+    game.push(Space.A1, Direction.NORTH_EAST)
+    game.features(Player.BLACK)
+    # Features(material=14, centrality=..., adjacency=..., edge=...)
+    game.evaluate()  # from the perspective of the player in turn
+    game.pop()
+    ```
+"""
+
+from typing import List, NamedTuple, Tuple
+
+from abalone.enums import InitialPosition, Player, Space
+from abalone.game import Game
+from abalone.utils import DIRECTIONS, DISTANCES_TO_EDGE, SPACE_INDICES, SPACES, neighbor
+
+
+class Features(NamedTuple):
+    """The features of the marbles of one player, see `abalone.evaluation`."""
+    material: int
+    """The number of marbles on the board."""
+    centrality: int
+    """The sum of the distances of the marbles to the edge of the board."""
+    adjacency: int
+    """The number of pairs of marbles on neighboring spaces."""
+    edge: int
+    """The number of marbles on the edge of the board."""
+
+
+class Weights(NamedTuple):
+    """The weights of the differences of the `abalone.evaluation.Features` of the two players in\
+    `abalone.evaluation.EvaluatedGame.evaluate`."""
+    material: int = 1000
+    """The weight of a marble, which outweighs all positional features."""
+    centrality: int = 10
+    """The weight of a marble per space of distance to the edge of the board."""
+    adjacency: int = 3
+    """The weight of a pair of neighboring marbles."""
+    edge: int = -5
+    """The weight of a marble on the edge of the board, which is in danger of being pushed off."""
+
+
+_CENTRALITY: Tuple[int, ...] = tuple(DISTANCES_TO_EDGE[space] for space in SPACES)
+"""The distance of every space to the edge of the board, indexed like `abalone.utils.SPACES`."""
+
+_EDGE: Tuple[int, ...] = tuple(int(distance == 0) for distance in _CENTRALITY)
+"""Whether every space is on the edge of the board (1 or 0), indexed like `abalone.utils.SPACES`."""
+
+_NEIGHBOR_INDICES: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(SPACE_INDICES[neighbor(space, direction)] for direction in DIRECTIONS
+          if neighbor(space, direction) is not Space.OFF)
+    for space in SPACES
+)
+"""The indices of the neighbors of every space on the board, indexed like `abalone.utils.SPACES`."""
+
+
+def compute_features(game: Game, player: Player) -> Features:
+    """Computes the features of a player from scratch by scanning the board of any `abalone.game.Game`.
+
+    Args:
+        game: The position.
+        player: The `abalone.enums.Player` whose marbles are evaluated.
+
+    Returns:
+        The `abalone.evaluation.Features` of `player`.
+    """
+    cells = game.to_bytes()[:-1]
+    value = player.value & 0xFF  # the value of the player's marbles as an unsigned byte
+    indices = [index for index, cell in enumerate(cells) if cell == value]
+    return Features(
+        material=len(indices),
+        centrality=sum(_CENTRALITY[index] for index in indices),
+        adjacency=sum(cells[other] == value for index in indices for other in _NEIGHBOR_INDICES[index]) // 2,
+        edge=sum(_EDGE[index] for index in indices)
+    )
+
+
+class EvaluatedGame(Game):
+    """A `abalone.game.Game` that keeps the `abalone.evaluation.Features` of both players up to date with every change\
+    of the board, including the moves performed by `abalone.game.Game.push` and taken back by\
+    `abalone.game.Game.pop`. Evaluating a position therefore takes constant time.
+    """
+
+    __slots__ = ('weights', '_centrality', '_adjacency', '_edge')
+
+    def __init__(self, initial_position: InitialPosition = InitialPosition.DEFAULT, first_turn: Player = Player.BLACK,
+                 weights: Weights = Weights()):
+        """Initializes the game and computes the features of the initial position.
+
+        Args:
+            initial_position: The `abalone.enums.InitialPosition` of the game.
+            first_turn: The `abalone.enums.Player` who is in turn first.
+            weights: The `abalone.evaluation.Weights` of `abalone.evaluation.EvaluatedGame.evaluate`.
+        """
+        super().__init__(initial_position, first_turn)
+        self.weights = weights
+        # all lists are indexed by the values of `Marble` (including the blank spaces, which are never evaluated)
+        self._centrality: List[int] = [0, 0, 0]
+        self._adjacency: List[int] = [0, 0, 0]
+        self._edge: List[int] = [0, 0, 0]
+        cells = self._cells
+        for index, value in enumerate(cells):
+            self._centrality[value] += _CENTRALITY[index]
+            self._edge[value] += _EDGE[index]
+            for other in _NEIGHBOR_INDICES[index]:
+                if other > index and cells[other] == value:
+                    self._adjacency[value] += 1
+
+    @classmethod
+    def from_game(cls, game: Game, weights: Weights = Weights()) -> 'EvaluatedGame':
+        """Creates an `abalone.evaluation.EvaluatedGame` with the position and the captured marbles of a\
+        `abalone.game.Game`. The moves of `game` cannot be taken back by `abalone.game.Game.pop`.
+
+        Args:
+            game: The `abalone.game.Game` to be copied.
+            weights: The `abalone.evaluation.Weights` of `abalone.evaluation.EvaluatedGame.evaluate`.
+
+        Returns:
+            A new `abalone.evaluation.EvaluatedGame` instance.
+        """
+        evaluated = cls.from_bytes(game.to_bytes())
+        evaluated.weights = weights
+        evaluated._captured = [0, game.captured(Player.BLACK), game.captured(Player.WHITE)]
+        return evaluated
+
+    def _set_cell(self, index: int, value: int) -> None:
+        previous_value = self._cells[index]
+        if previous_value != value:
+            self._centrality[previous_value] -= _CENTRALITY[index]
+            self._centrality[value] += _CENTRALITY[index]
+            self._edge[previous_value] -= _EDGE[index]
+            self._edge[value] += _EDGE[index]
+            cells, adjacency = self._cells, self._adjacency
+            for other in _NEIGHBOR_INDICES[index]:
+                other_value = cells[other]
+                if other_value == previous_value:
+                    adjacency[previous_value] -= 1
+                elif other_value == value:
+                    adjacency[value] += 1
+        super()._set_cell(index, value)
+
+    def features(self, player: Player) -> Features:
+        """Returns the features of a player in the current position.
+
+        Args:
+            player: The `abalone.enums.Player` whose marbles are evaluated.
+
+        Returns:
+            The `abalone.evaluation.Features` of `player`, which are equal to those computed by\
+            `abalone.evaluation.compute_features`.
+        """
+        value = player.value
+        return Features(self._marble_counts[value], self._centrality[value], self._adjacency[value],
+                        self._edge[value])
+
+    def evaluate(self) -> int:
+        """Evaluates the current position by the weighted differences of the features of the two players.
+
+        Returns:
+            The score of the position from the perspective of the player in turn (positive if the player in turn is\
+            ahead).
+        """
+        own = self._turn.value
+        opp = -own
+        weights = self.weights
+        return weights.material * (self._marble_counts[own] - self._marble_counts[opp]) \
+            + weights.centrality * (self._centrality[own] - self._centrality[opp]) \
+            + weights.adjacency * (self._adjacency[own] - self._adjacency[opp]) \
+            + weights.edge * (self._edge[own] - self._edge[opp])
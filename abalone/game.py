@@ -18,14 +18,18 @@
 
 """This module serves the representation of game states and the performing of game moves."""
 
-from copy import deepcopy
+from array import array
+from collections.abc import Sequence
+from random import Random
 from typing import Generator, List, Tuple, Union
 
 import colorama
 from colorama import Style
 
 from abalone.enums import Direction, InitialPosition, Marble, Player, Space
-from abalone.utils import line_from_to, line_to_edge, neighbor
+from abalone.moves import MOVE_INDICES, MOVES
+from abalone.symmetry import canonical_position
+from abalone.utils import SPACE_INDICES, SPACES, line_from_to, line_to_edge, neighbor
 
 colorama.init(autoreset=True)
 
@@ -53,6 +57,54 @@ def _space_to_board_indices(space: Space) -> Tuple[int, int]:
     return x, y
 
 
+_BOARD_INDICES: List[List[int]] = [
+    [index for index, space in enumerate(SPACES) if _space_to_board_indices(space)[0] == x] for x in range(9)
+]
+"""The index in the flat board of `abalone.game.Game` for every pair of indices of the nested\
+`abalone.game.Game.board` view, i.e. `_BOARD_INDICES[x][y]`."""
+
+_MARBLES: Tuple[Marble, Marble, Marble] = (Marble.BLANK, Marble.BLACK, Marble.WHITE)
+"""The `abalone.enums.Marble`s indexed by their values (`abalone.enums.Marble.WHITE` being the element at index -1)."""
+
+
+_ZOBRIST_SEED = 0x4ABA10E
+"""The seed of the random numbers of the Zobrist hash, which is fixed so that hashes are the same in every process."""
+
+
+def _zobrist_keys() -> Tuple[List[List[int]], int]:
+    """Generates the random 64 bit numbers of the Zobrist hash of `abalone.game.Game`.
+
+    Returns:
+        A tuple of 1. a list with three numbers for every space, indexed by the values of the `abalone.enums.Marble`s\
+        (the number for `abalone.enums.Marble.BLANK` being 0), and 2. a number for `abalone.enums.Player.WHITE` being\
+        in turn.
+    """
+    rng = Random(_ZOBRIST_SEED)
+    space_keys = [[0, rng.getrandbits(64), rng.getrandbits(64)] for _ in SPACES]
+    return space_keys, rng.getrandbits(64)
+
+
+_ZOBRIST_SPACE_KEYS, _ZOBRIST_WHITE_KEY = _zobrist_keys()
+
+
+def _board_to_cells(board: Sequence[Sequence[Marble]]) -> array:
+    """Converts a board in the nested format of `abalone.enums.InitialPosition` to the flat format used by\
+    `abalone.game.Game`.
+
+    Args:
+        board: A list of rows of `abalone.enums.Marble`s, starting with row I.
+
+    Returns:
+        An array of the values of the `abalone.enums.Marble`s, ordered like `abalone.utils.SPACES`.
+    """
+
+    cells = array('b', bytes(len(SPACES)))
+    for x, row in enumerate(board):
+        for y, marble in enumerate(row):
+            cells[_BOARD_INDICES[x][y]] = marble.value
+    return cells
+
+
 def _marble_of_player(player: Player) -> Marble:
     """Returns the corresponding `abalone.enums.Marble` for a given `abalone.enums.Player`.
 
@@ -66,12 +118,207 @@ def _marble_of_player(player: Player) -> Marble:
     return Marble.WHITE if player is Player.WHITE else Marble.BLACK
 
 
+class _BoardRowView(Sequence):
+    """A mutable view of a single row of the flat board of a `abalone.game.Game`, see `abalone.game.Game.board`."""
+
+    __slots__ = ('_game', '_indices')
+
+    def __init__(self, game: 'Game', indices: List[int]):
+        self._game = game
+        self._indices = indices
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, y: Union[int, slice]) -> Union[Marble, List[Marble]]:
+        if isinstance(y, slice):
+            return [_MARBLES[self._game._cells[index]] for index in self._indices[y]]
+        return _MARBLES[self._game._cells[self._indices[y]]]
+
+    def __setitem__(self, y: int, marble: Marble) -> None:
+        self._game._set_cell(self._indices[y], marble.value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Sequence) and list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __deepcopy__(self, memo: dict) -> List[Marble]:
+        return list(self)
+
+
+class _BoardView(Sequence):
+    """A mutable view of the flat board of a `abalone.game.Game` as a list of rows, see `abalone.game.Game.board`."""
+
+    __slots__ = ('_game',)
+
+    def __init__(self, game: 'Game'):
+        self._game = game
+
+    def __len__(self) -> int:
+        return len(_BOARD_INDICES)
+
+    def __getitem__(self, x: Union[int, slice]) -> Union[_BoardRowView, List[_BoardRowView]]:
+        if isinstance(x, slice):
+            return [_BoardRowView(self._game, indices) for indices in _BOARD_INDICES[x]]
+        return _BoardRowView(self._game, _BOARD_INDICES[x])
+
+    def __setitem__(self, x: int, row: Sequence[Marble]) -> None:
+        for index, marble in zip(_BOARD_INDICES[x], row):
+            self._game._set_cell(index, marble.value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Sequence) and list(map(list, self)) == list(map(list, other))
+
+    def __repr__(self) -> str:
+        return repr(list(map(list, self)))
+
+    def __deepcopy__(self, memo: dict) -> List[List[Marble]]:
+        return list(map(list, self))
+
+
+_UNDO_WHITE = 1
+"""The bit of the undo flags of a move of `abalone.game.Game.push` that is set if `abalone.enums.Player.WHITE` has\
+performed the move (and not set for `abalone.enums.Player.BLACK`)."""
+
+_UNDO_CAPTURE = 2
+"""The bit of the undo flags of a move of `abalone.game.Game.push` that is set if the move has pushed a marble off the\
+board."""
+
+_MAX_CHANGES = 6
+"""The maximum number of spaces changed by a move (by a broadside move of three marbles)."""
+
+_INITIAL_UNDO_CAPACITY = 64
+"""The number of moves of `abalone.game.Game.push` for which the undo arrays are allocated initially."""
+
+
 class Game:
-    """Represents the mutable state of an Abalone game."""
+    """Represents the mutable state of an Abalone game.
+
+    The board is stored as a flat array with the values of the `abalone.enums.Marble`s on the 61 spaces, ordered like\
+    `abalone.utils.SPACES`. It is accessed via `abalone.game.Game.get_marble` and `abalone.game.Game.set_marble`.\
+    `abalone.game.Game.board` provides a view in the nested format of `abalone.enums.InitialPosition`.
+    """
+
+    __slots__ = ('_cells', '_turn', '_zobrist', '_marble_counts', '_captured', '_depth', '_change_position',
+                 '_change_indices', '_change_values', '_change_counts', '_undo_marbles', '_undo_directions',
+                 '_undo_flags')
 
     def __init__(self, initial_position: InitialPosition = InitialPosition.DEFAULT, first_turn: Player = Player.BLACK):
-        self.board = deepcopy(initial_position.value)
-        self.turn = first_turn
+        self._cells = _board_to_cells(initial_position.value)
+        self._turn = first_turn
+        self._zobrist = _ZOBRIST_WHITE_KEY if first_turn is Player.WHITE else 0
+        for index, value in enumerate(self._cells):
+            self._zobrist ^= _ZOBRIST_SPACE_KEYS[index][value]
+        # both lists are indexed by the values of `Marble` resp. `Player`, like `_MARBLES`
+        self._marble_counts = [self._cells.count(marble.value) for marble in _MARBLES]
+        self._captured = [0, 0, 0]
+        # the undo information of the moves of `push` is stored in arrays indexed by the number of pushed moves, which
+        # are only reallocated when they are full, so that `push` and `pop` do not allocate any objects
+        self._depth = 0
+        self._change_position = -1  # the next slot of the changes while `push` performs a move, otherwise -1
+        self._change_indices = array('b', bytes(_INITIAL_UNDO_CAPACITY * _MAX_CHANGES))
+        self._change_values = array('b', bytes(_INITIAL_UNDO_CAPACITY * _MAX_CHANGES))
+        self._change_counts = array('b', bytes(_INITIAL_UNDO_CAPACITY))
+        self._undo_marbles: List[Union[Space, Tuple[Space, Space], None]] = [None] * _INITIAL_UNDO_CAPACITY
+        self._undo_directions: List[Union[Direction, None]] = [None] * _INITIAL_UNDO_CAPACITY
+        # a combination of `_UNDO_WHITE` and `_UNDO_CAPTURE` for every move
+        self._undo_flags = array('b', bytes(_INITIAL_UNDO_CAPACITY))
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Game) and self._turn is other._turn and self._cells == other._cells
+
+    def __hash__(self) -> int:
+        return self._zobrist
+
+    @property
+    def turn(self) -> Player:
+        """The `abalone.enums.Player` whose turn it is."""
+        return self._turn
+
+    @turn.setter
+    def turn(self, turn: Player) -> None:
+        if turn is not self._turn:
+            self._zobrist ^= _ZOBRIST_WHITE_KEY
+            self._turn = turn
+
+    @property
+    def zobrist(self) -> int:
+        """The 64 bit Zobrist hash of the current position, i.e. of the board and the player in turn. It is kept up to\
+        date with every change, so this takes constant time. `hash(game)` is derived from this hash. Note that\
+        `abalone.game.Game` is mutable, so a game that is used as a dictionary key must not be changed afterwards.\
+        Use a copy or `abalone.game.Game.to_bytes` instead."""
+        return self._zobrist
+
+    @property
+    def board(self) -> _BoardView:
+        """A list of rows of `abalone.enums.Marble`s, starting with row I, like the values of\
+        `abalone.enums.InitialPosition`. This is a view of the flat board, i.e. `game.board[x][y] = marble` changes\
+        the state of the game. Assigning nested lists to this property replaces the state of all spaces."""
+        return _BoardView(self)
+
+    @board.setter
+    def board(self, board: Sequence[Sequence[Marble]]) -> None:
+        for index, value in enumerate(_board_to_cells(board)):
+            self._set_cell(index, value)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Game':
+        """Restores a `abalone.game.Game` from the representation returned by `abalone.game.Game.to_bytes`.
+
+        Args:
+            data: The 62 bytes returned by `abalone.game.Game.to_bytes`.
+
+        Returns:
+            A new `abalone.game.Game` instance.
+
+        Raises:
+            Exception: Invalid length of position bytes
+        """
+        if len(data) != len(SPACES) + 1:
+            raise Exception('Invalid length of position bytes')
+        values = array('b', data)
+        game = cls(first_turn=Player(values[-1]))
+        for index, value in enumerate(values[:-1]):
+            game._set_cell(index, value)
+        return game
+
+    def to_bytes(self) -> bytes:
+        """Returns a compact representation of the current position, which is suitable as a dictionary key or for\
+        transferring a position to another process.
+
+        Returns:
+            61 bytes with the values of the `abalone.enums.Marble`s, ordered like `abalone.utils.SPACES`, followed by\
+            one byte with the value of the `abalone.enums.Player` in turn (all as signed bytes).
+        """
+        return self._cells.tobytes() + array('b', (self.turn.value,)).tobytes()
+
+    def canonical(self, colors: bool = False) -> 'Game':
+        """Returns the canonical representative of all positions that are equivalent to the current position under the\
+        rotations and reflections of the board, see `abalone.symmetry.canonical_position`. Use\
+        `abalone.symmetry.canonical_position` directly to also get the symmetry for transforming moves.
+
+        Args:
+            colors: Whether positions with swapped colors (of the marbles and the player in turn) are also equivalent.
+
+        Returns:
+            A new `abalone.game.Game` instance.
+        """
+        return Game.from_bytes(canonical_position(self.to_bytes(), colors)[0])
+
+    def canonical_zobrist(self, colors: bool = False) -> int:
+        """Returns a 64 bit hash that is equal for all positions that are equivalent under the rotations and\
+        reflections of the board, e.g. as the key of a transposition table or an opening book. Unlike\
+        `abalone.game.Game.zobrist`, this is computed from scratch.
+
+        Args:
+            colors: Whether positions with swapped colors (of the marbles and the player in turn) are also equivalent.
+
+        Returns:
+            The `abalone.game.Game.zobrist` hash of `abalone.game.Game.canonical`.
+        """
+        return self.canonical(colors).zobrist
 
     def __str__(self) -> str:  # pragma: no cover
         board_lines = list(map(lambda line: ' '.join(map(str, line)), self.board))
@@ -117,8 +364,27 @@ class Game:
         if space is Space.OFF:
             raise Exception('Cannot set state of `Space.OFF`')
 
-        x, y = _space_to_board_indices(space)
-        self.board[x][y] = marble
+        self._set_cell(SPACE_INDICES[space], marble.value)
+
+    def _set_cell(self, index: int, value: int) -> None:
+        """Updates the state of a space on the flat board. Every change of the board is performed by this method, so\
+        that it can be recorded for `abalone.game.Game.pop` and the Zobrist hash and the numbers of marbles are kept\
+        up to date.
+
+        Args:
+            index: The index of the space, see `abalone.utils.SPACES`.
+            value: The value of the new `abalone.enums.Marble` of the space.
+        """
+        previous_value = self._cells[index]
+        position = self._change_position
+        if position >= 0:
+            self._change_indices[position] = index
+            self._change_values[position] = previous_value
+            self._change_position = position + 1
+        self._cells[index] = value
+        self._zobrist ^= _ZOBRIST_SPACE_KEYS[index][previous_value] ^ _ZOBRIST_SPACE_KEYS[index][value]
+        self._marble_counts[previous_value] -= 1
+        self._marble_counts[value] += 1
 
     def get_marble(self, space: Space) -> Marble:
         """Returns the state of a `abalone.enums.Space`.
@@ -136,25 +402,27 @@ class Game:
         if space is Space.OFF:
             raise Exception('Cannot get state of `Space.OFF`')
 
-        x, y = _space_to_board_indices(space)
-
-        return self.board[x][y]
+        return _MARBLES[self._cells[SPACE_INDICES[space]]]
 
     def get_score(self) -> Tuple[int, int]:
-        """Counts how many marbles the players still have on the board.
+        """Counts how many marbles the players still have on the board. The numbers are kept up to date with every\
+        change of the board, so this takes constant time.
 
         Returns:
             A tuple with the number of marbles of black and white, in that order.
         """
-        black = 0
-        white = 0
-        for row in self.board:
-            for space in row:
-                if space is Marble.BLACK:
-                    black += 1
-                elif space is Marble.WHITE:
-                    white += 1
-        return black, white
+        return self._marble_counts[Marble.BLACK.value], self._marble_counts[Marble.WHITE.value]
+
+    def captured(self, player: Player) -> int:
+        """Counts how many marbles of the opponent a player has pushed off the board in this game so far.
+
+        Args:
+            player: The `abalone.enums.Player` whose captures are counted.
+
+        Returns:
+            The number of the opponent's marbles pushed off the board by `player`.
+        """
+        return self._captured[player.value]
 
     def _inline_marbles_nums(self, line: List[Space]) -> Tuple[int, int]:
         """Counts the number of own and enemy marbles that are in the given line. First the directly adjacent marbles\
@@ -178,6 +446,70 @@ class Game:
             opp_marbles_num += 1
         return own_marbles_num, opp_marbles_num
 
+    def _inline_move_error(self, caboose: Space, direction: Direction) \
+            -> Tuple[Union[str, None], List[Space], int, int]:
+        """Checks whether an inline move is legal without performing it. This method serves as a helper method for\
+        `abalone.game.Game.move_inline` and `abalone.game.Game.is_legal_move`.
+
+        Args:
+            caboose: The `abalone.enums.Space` of the trailing marble of a straight line of up to three marbles.
+            direction: The `abalone.enums.Direction` of movement.
+
+        Returns:
+            A tuple of 1. the reason why the move is illegal or `None` if the move is legal, 2. the line from\
+            `caboose` to the edge of the board and 3. and 4. the numbers of own and opponent marbles in that line as\
+            returned by `abalone.game.Game._inline_marbles_nums`, so that `abalone.game.Game.move_inline` does not\
+            compute them again. The line is empty if `caboose` is not an own marble.
+        """
+        if self.get_marble(caboose) is not _marble_of_player(self.turn):
+            return 'Only own marbles may be moved', [], 0, 0
+
+        line = line_to_edge(caboose, direction)
+        own_marbles_num, opp_marbles_num = self._inline_marbles_nums(line)
+        error = None
+
+        if own_marbles_num > 3:
+            error = 'Only lines of up to three marbles may be moved'
+        elif own_marbles_num == len(line):
+            error = 'Own marbles must not be moved off the board'
+        # sumito
+        elif opp_marbles_num > 0:
+            if opp_marbles_num >= own_marbles_num:
+                error = 'Only lines that are shorter than the player\'s line can be pushed'
+            else:
+                push_to = neighbor(line[own_marbles_num + opp_marbles_num - 1], direction)
+                if push_to is not Space.OFF and self.get_marble(push_to) is _marble_of_player(self.turn):
+                    error = 'Marbles must be pushed to an empty space or off the board'
+
+        return error, line, own_marbles_num, opp_marbles_num
+
+    def _broadside_move_error(self, boundaries: Tuple[Space, Space], direction: Direction) -> Union[str, None]:
+        """Checks whether a broadside move is legal without performing it. This method serves as a helper method for\
+        `abalone.game.Game.move_broadside` and `abalone.game.Game.is_legal_move`.
+
+        Args:
+            boundaries: A tuple of the two outermost `abalone.enums.Space`s of a line of two or three marbles.
+            direction: The `abalone.enums.Direction` of movement.
+
+        Returns:
+            The reason why the move is illegal or `None` if the move is legal.
+        """
+        if boundaries[0] is Space.OFF or boundaries[1] is Space.OFF:
+            return 'Elements of boundaries must not be `Space.OFF`'
+        marbles, direction1 = line_from_to(boundaries[0], boundaries[1])
+        if marbles is None or not (len(marbles) == 2 or len(marbles) == 3):
+            return 'Only two or three neighboring marbles may be moved with a broadside move'
+        _, direction2 = line_from_to(boundaries[1], boundaries[0])
+        if direction is direction1 or direction is direction2:
+            return 'The direction of a broadside move must be sideways'
+        for marble in marbles:
+            if self.get_marble(marble) is not _marble_of_player(self.turn):
+                return 'Only own marbles may be moved'
+            destination_space = neighbor(marble, direction)
+            if destination_space is Space.OFF or self.get_marble(destination_space) is not Marble.BLANK:
+                return 'With a broadside move, marbles can only be moved to empty spaces'
+        return None
+
     def move_inline(self, caboose: Space, direction: Direction) -> None:
         """Performs an inline move. An inline move is denoted by the trailing marble ("caboose") of a straight line of\
         marbles. Marbles of the opponent can only be pushed with an inline move (as opposed to a broadside move). This\
@@ -196,27 +528,17 @@ class Game:
             IllegalMoveException: Marbles must be pushed to an empty space or off the board
         """
 
-        if self.get_marble(caboose) is not _marble_of_player(self.turn):
-            raise IllegalMoveException('Only own marbles may be moved')
-
-        line = line_to_edge(caboose, direction)
-        own_marbles_num, opp_marbles_num = self._inline_marbles_nums(line)
-
-        if own_marbles_num > 3:
-            raise IllegalMoveException('Only lines of up to three marbles may be moved')
-
-        if own_marbles_num == len(line):
-            raise IllegalMoveException('Own marbles must not be moved off the board')
+        error, line, own_marbles_num, opp_marbles_num = self._inline_move_error(caboose, direction)
+        if error is not None:
+            raise IllegalMoveException(error)
 
         # sumito
         if opp_marbles_num > 0:
-            if opp_marbles_num >= own_marbles_num:
-                raise IllegalMoveException('Only lines that are shorter than the player\'s line can be pushed')
             push_to = neighbor(line[own_marbles_num + opp_marbles_num - 1], direction)
             if push_to is not Space.OFF:
-                if self.get_marble(push_to) is _marble_of_player(self.turn):
-                    raise IllegalMoveException('Marbles must be pushed to an empty space or off the board')
                 self.set_marble(push_to, _marble_of_player(self.not_in_turn_player()))
+            else:
+                self._captured[self.turn.value] += 1
 
         self.set_marble(line[own_marbles_num], _marble_of_player(self.turn))
         self.set_marble(caboose, Marble.BLANK)
@@ -239,20 +561,11 @@ class Game:
             IllegalMoveException: Only own marbles may be moved
             IllegalMoveException: With a broadside move, marbles can only be moved to empty spaces
         """
-        if boundaries[0] is Space.OFF or boundaries[1] is Space.OFF:
-            raise IllegalMoveException('Elements of boundaries must not be `Space.OFF`')
-        marbles, direction1 = line_from_to(boundaries[0], boundaries[1])
-        if marbles is None or not (len(marbles) == 2 or len(marbles) == 3):
-            raise IllegalMoveException('Only two or three neighboring marbles may be moved with a broadside move')
-        _, direction2 = line_from_to(boundaries[1], boundaries[0])
-        if direction is direction1 or direction is direction2:
-            raise IllegalMoveException('The direction of a broadside move must be sideways')
-        for marble in marbles:
-            if self.get_marble(marble) is not _marble_of_player(self.turn):
-                raise IllegalMoveException('Only own marbles may be moved')
-            destination_space = neighbor(marble, direction)
-            if destination_space is Space.OFF or self.get_marble(destination_space) is not Marble.BLANK:
-                raise IllegalMoveException('With a broadside move, marbles can only be moved to empty spaces')
+        error = self._broadside_move_error(boundaries, direction)
+        if error is not None:
+            raise IllegalMoveException(error)
+
+        marbles, _ = line_from_to(boundaries[0], boundaries[1])
         for marble in marbles:
             self.set_marble(marble, Marble.BLANK)
             self.set_marble(neighbor(marble, direction), _marble_of_player(self.turn))
@@ -279,6 +592,93 @@ class Game:
             # only there to prevent a silent failure in such a case.
             raise Exception('Invalid arguments')
 
+    def push(self, marbles: Union[Space, Tuple[Space, Space]], direction: Direction) -> None:
+        """Performs a move like `abalone.game.Game.move`, switches the player in turn and records how to undo both.\
+        The move can be taken back by `abalone.game.Game.pop`. Together these methods allow to search a tree of moves\
+        on a single `abalone.game.Game` instance instead of on copies.
+
+        Args:
+            marbles: The `abalone.enums.Space`s with the marbles to be moved, in accordance with the parameters of\
+                `abalone.game.Game.move`.
+            direction: The `abalone.enums.Direction` of movement.
+
+        Raises:
+            IllegalMoveException: See `abalone.game.Game.move_inline` and `abalone.game.Game.move_broadside`
+        """
+        turn = self._turn
+        captured = self._captured[turn.value]
+        depth = self._depth
+        if depth == len(self._change_counts):
+            self._grow_undo_arrays()
+        start = depth * _MAX_CHANGES
+        self._change_position = start
+        try:
+            self.move(marbles, direction)
+        finally:
+            end, self._change_position = self._change_position, -1
+        self._change_counts[depth] = end - start
+        self._undo_marbles[depth] = marbles
+        self._undo_directions[depth] = direction
+        self._undo_flags[depth] = (_UNDO_WHITE if turn is Player.WHITE else 0) \
+            | (_UNDO_CAPTURE if self._captured[turn.value] != captured else 0)
+        self._depth = depth + 1
+        self.switch_player()
+
+    def pop(self) -> Tuple[Union[Space, Tuple[Space, Space]], Direction]:
+        """Takes back the last move performed by `abalone.game.Game.push`, i.e. restores the changed spaces (including\
+        a marble that has been pushed off the board) and the player in turn.
+
+        Returns:
+            The move that has been taken back, as passed to `abalone.game.Game.push`.
+
+        Raises:
+            Exception: No move to take back
+        """
+        if self._depth == 0:
+            raise Exception('No move to take back')
+        depth = self._depth = self._depth - 1
+        start = depth * _MAX_CHANGES
+        indices, values = self._change_indices, self._change_values
+        for position in range(start + self._change_counts[depth] - 1, start - 1, -1):
+            self._set_cell(indices[position], values[position])
+        flags = self._undo_flags[depth]
+        turn = Player.WHITE if flags & _UNDO_WHITE else Player.BLACK
+        if flags & _UNDO_CAPTURE:
+            self._captured[turn.value] -= 1
+        self.turn = turn
+        return self._undo_marbles[depth], self._undo_directions[depth]
+
+    def _grow_undo_arrays(self) -> None:
+        """Doubles the number of moves that can be recorded by `abalone.game.Game.push`."""
+        capacity = len(self._change_counts)
+        self._change_indices.extend(bytes(capacity * _MAX_CHANGES))
+        self._change_values.extend(bytes(capacity * _MAX_CHANGES))
+        self._change_counts.extend(bytes(capacity))
+        self._undo_marbles.extend([None] * capacity)
+        self._undo_directions.extend([None] * capacity)
+        self._undo_flags.extend(bytes(capacity))
+
+    def is_legal_move(self, marbles: Union[Space, Tuple[Space, Space]], direction: Direction) -> bool:
+        """Checks whether a move could be performed by `abalone.game.Game.move`, without modifying the board.
+
+        Args:
+            marbles: The `abalone.enums.Space`s with the marbles to be moved, in accordance with the parameters of\
+                `abalone.game.Game.move`.
+            direction: The `abalone.enums.Direction` of movement.
+
+        Returns:
+            `True` if the move is legal, `False` if `abalone.game.Game.move` would raise an\
+            `abalone.game.IllegalMoveException`.
+
+        Raises:
+            Exception: Invalid arguments
+        """
+        if isinstance(marbles, Space):
+            return self._inline_move_error(marbles, direction)[0] is None
+        if isinstance(marbles, tuple) and isinstance(marbles[0], Space) and isinstance(marbles[1], Space):
+            return self._broadside_move_error(marbles, direction) is None
+        raise Exception('Invalid arguments')  # pragma: no cover
+
     def generate_own_marble_lines(self) -> Generator[Union[Space, Tuple[Space, Space]], None, None]:
         """Generates all adjacent straight lines with up to three marbles of the player whose turn it is.
 
@@ -306,12 +706,21 @@ class Game:
         """
         for marbles in self.generate_own_marble_lines():
             for direction in Direction:
-                copy = deepcopy(self)
-                try:
-                    copy.move(marbles, direction)
-                except IllegalMoveException:
-                    continue
-                yield marbles, direction
+                if self.is_legal_move(marbles, direction):
+                    yield marbles, direction
+
+    def legal_move_mask(self) -> bytearray:
+        """Returns which moves of the fixed move index space `abalone.moves.MOVES` are legal for the player whose turn\
+        it is. The mask can be used to index arrays directly, e.g. with `numpy.frombuffer(mask, dtype=bool)`.
+
+        Returns:
+            A `bytearray` of the length `len(abalone.moves.MOVES)`, which is 1 at the index of every move yielded by\
+            `abalone.game.Game.generate_legal_moves` and 0 otherwise.
+        """
+        mask = bytearray(len(MOVES))
+        for move in self.generate_legal_moves():
+            mask[MOVE_INDICES[move]] = 1
+        return mask
 
 
 class IllegalMoveException(Exception):
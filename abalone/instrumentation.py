@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module provides opt-in instrumentation of the engine for profiling: It counts and times the calls of the most\
+frequently called functions and the turns of the players in `abalone.run_game.run_game`, and it can profile every game\
+with `cProfile`.
+
+The functions are instrumented by replacing them with wrappers while the instrumentation is enabled. Disabling it\
+restores the original functions, so that there is no overhead at all when the instrumentation is not used. The\
+statistics are collected per process, i.e. games of `abalone.tournament.run_tournament` with several workers are not\
+included.
+
+Example:
+    ```python
+    with instrument(profile_directory='profiles') as statistics:
+        list(run_game(black, white, []))
+    print(statistics)
+    # the profile of a game can be analyzed with `pstats.Stats('profiles/game-00000.prof')`
+    ```
+"""
+
+import cProfile
+import os
+import sys
+from contextlib import contextmanager
+from functools import wraps
+from inspect import isgeneratorfunction
+from time import perf_counter
+from typing import Callable, Dict, Generator, List, Tuple, Union
+
+from abalone import utils
+from abalone.enums import Player
+from abalone.game import Game
+
+INSTRUMENTED: Tuple[Tuple[object, str], ...] = (
+    (Game, 'move'),
+    (Game, 'move_inline'),
+    (Game, 'move_broadside'),
+    (Game, 'generate_legal_moves'),
+    (Game, 'generate_own_marble_lines'),
+    (utils, 'neighbor')
+)
+"""The instrumented functions as tuples of the class or module and the name of the function."""
+
+
+class CallStatistics:
+    """The number and total duration of the calls of a function or of the turns of a player."""
+
+    def __init__(self):
+        self.calls = 0
+        """The number of calls."""
+        self.time = 0.0
+        """The total duration of the calls in seconds. For generators, this is the time spent in the generator until\
+        it is exhausted or discarded. The duration of a call includes the durations of nested instrumented calls."""
+
+    def __repr__(self) -> str:
+        return f'{self.calls} calls, {self.time:.3f} s, {self.time_per_call * 1e6:.1f} µs/call'
+
+    @property
+    def time_per_call(self) -> float:
+        """The average duration of a call in seconds."""
+        return self.time / self.calls if self.calls else 0.0
+
+
+class Statistics:
+    """The statistics collected while the instrumentation is enabled, see `abalone.instrumentation.enable`."""
+
+    def __init__(self, profile_directory: Union[str, None] = None):
+        """Initializes empty statistics.
+
+        Args:
+            profile_directory: The directory of the `cProfile` dumps of the games or `None` to not profile the games.
+        """
+        self.calls: Dict[str, CallStatistics] = {
+            f'{owner.__name__.rsplit(".", 1)[-1]}.{name}': CallStatistics() for owner, name in INSTRUMENTED
+        }
+        """The statistics of the calls of every instrumented function by the name of its class or module and its\
+        name, e.g. `'Game.move'` or `'utils.neighbor'`."""
+        self.turns: Dict[Player, CallStatistics] = {player: CallStatistics() for player in Player}
+        """The statistics of the turns of each player in `abalone.run_game.run_game` (including performing the\
+        move)."""
+        self.games = 0
+        """The number of games started by `abalone.run_game.run_game`."""
+        self.profile_directory = profile_directory
+        """The directory of the `cProfile` dumps of the games or `None` if the games are not profiled."""
+
+    def __repr__(self) -> str:
+        lines = [f'{name}: {call_statistics}' for name, call_statistics in self.calls.items()]
+        lines += [f'{player.name} turns: {turn_statistics}' for player, turn_statistics in self.turns.items()]
+        return '\n'.join(lines)
+
+    def start_game(self) -> Union[cProfile.Profile, None]:
+        """Counts a new game of `abalone.run_game.run_game`.
+
+        Returns:
+            A new `cProfile.Profile` of the game or `None` if the games are not profiled.
+        """
+        self.games += 1
+        return cProfile.Profile() if self.profile_directory is not None else None
+
+    def end_game(self, profile: Union[cProfile.Profile, None]) -> None:
+        """Writes the profile of a game to a file in the profile directory, which can be read with `pstats.Stats`.
+
+        Args:
+            profile: The profile returned by `abalone.instrumentation.Statistics.start_game`.
+        """
+        if profile is not None:
+            os.makedirs(self.profile_directory, exist_ok=True)
+            profile.dump_stats(os.path.join(self.profile_directory, f'game-{self.games - 1:05d}.prof'))
+
+
+statistics: Union[Statistics, None] = None
+"""The `abalone.instrumentation.Statistics` that are currently collected or `None` if the instrumentation is\
+disabled."""
+
+_originals: List[Tuple[object, str, Callable]] = []
+"""The replaced functions as tuples of the class or module, the name of the function and the original function."""
+
+
+def _instrument(function: Callable, call_statistics: CallStatistics) -> Callable:
+    """Creates a wrapper of a function that counts and times its calls.
+
+    Args:
+        function: The function to be wrapped.
+        call_statistics: The `abalone.instrumentation.CallStatistics` of the function.
+
+    Returns:
+        The wrapper.
+    """
+    if isgeneratorfunction(function):
+        @wraps(function)
+        def generator_wrapper(*args, **kwargs):
+            call_statistics.calls += 1
+            generator = function(*args, **kwargs)
+            while True:
+                # only the time spent in the generator is measured, not the time of the caller between the items
+                start = perf_counter()
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    return
+                finally:
+                    call_statistics.time += perf_counter() - start
+                yield item
+        return generator_wrapper
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        call_statistics.calls += 1
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            call_statistics.time += perf_counter() - start
+    return wrapper
+
+
+def _replace_imported(name: str, function: Callable, replacement: Callable) -> None:
+    """Replaces a function of `abalone.utils` in all loaded modules that have imported it by name.
+
+    Args:
+        name: The name of the function.
+        function: The function to be replaced.
+        replacement: The new function.
+    """
+    for module in list(sys.modules.values()):
+        # the dictionary of the module is used, so that the `__getattr__` of a module is not called
+        if module is not utils and getattr(module, '__dict__', {}).get(name) is function:
+            setattr(module, name, replacement)
+
+
+def enable(profile_directory: Union[str, None] = None) -> Statistics:
+    """Enables the instrumentation with new statistics. Functions that have been imported by name from\
+    `abalone.utils` (e.g. `abalone.utils.neighbor` in `abalone.game`) are replaced in the importing modules as well.\
+    Modules that are imported while the instrumentation is enabled import the wrappers, which are replaced by\
+    `abalone.instrumentation.disable` as well.
+
+    Args:
+        profile_directory: The directory in which the `cProfile` dump of every game of `abalone.run_game.run_game`\
+            is written or `None` to not profile the games.
+
+    Returns:
+        The new `abalone.instrumentation.Statistics`.
+
+    Raises:
+        Exception: The instrumentation is already enabled
+    """
+    global statistics
+    if statistics is not None:
+        raise Exception('The instrumentation is already enabled')
+    statistics = Statistics(profile_directory)
+    for (owner, name), call_statistics in zip(INSTRUMENTED, statistics.calls.values()):
+        function = getattr(owner, name)
+        wrapper = _instrument(function, call_statistics)
+        _originals.append((owner, name, function))
+        setattr(owner, name, wrapper)
+        if owner is utils:
+            _replace_imported(name, function, wrapper)
+    return statistics
+
+
+def disable() -> Union[Statistics, None]:
+    """Disables the instrumentation and restores all instrumented functions, including the wrappers that have been\
+    imported by name from `abalone.utils` by any module.
+
+    Returns:
+        The collected `abalone.instrumentation.Statistics` or `None` if the instrumentation was not enabled.
+    """
+    global statistics
+    collected, statistics = statistics, None
+    while _originals:
+        owner, name, function = _originals.pop()
+        wrapper = getattr(owner, name)
+        setattr(owner, name, function)
+        if owner is utils:
+            _replace_imported(name, wrapper, function)
+    return collected
+
+
+@contextmanager
+def instrument(profile_directory: Union[str, None] = None) -> Generator[Statistics, None, None]:
+    """Enables the instrumentation within a `with` block, see `abalone.instrumentation.enable`.
+
+    Args:
+        profile_directory: The directory of the `cProfile` dumps of the games or `None` to not profile the games.
+
+    Yields:
+        The `abalone.instrumentation.Statistics`, which are complete after the block.
+    """
+    collected = enable(profile_directory)
+    try:
+        yield collected
+    finally:
+        disable()
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module provides an artificial intelligence that searches the tree of moves with Monte Carlo Tree Search. It\
+requires NumPy, which can be installed with `pip install abalone-boai[numpy]`."""
+
+from array import array
+from math import log, sqrt
+from time import perf_counter
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from abalone.abstract_player import AbstractPlayer
+from abalone.batch import legal_move_masks
+from abalone.enums import Direction, InitialPosition, Marble, Player, Space
+from abalone.game import Game
+from abalone.moves import MOVES, encode_move
+from abalone.playouts import play_random
+from abalone.utils import LOSING_MARBLES
+
+_WINNING_MARBLES = sum(row.count(Marble.BLACK) for row in InitialPosition.DEFAULT.value) - LOSING_MARBLES
+"""The number of marbles that have to be pushed off the board to win the game."""
+
+
+class MCTSPlayer(AbstractPlayer):
+    """A player that searches the tree of moves by Monte Carlo Tree Search with UCT selection. Every iteration\
+    descends the tree to a leaf, expands it and evaluates one of its children by a batch of random playouts with\
+    `abalone.playouts.play_random`. Playouts that are not finished within `rollout_depth` moves are scored by their\
+    marble difference. The move that has been visited most often is played.
+
+    The tree is stored in parallel arrays indexed by node: the index of the move in `abalone.moves.MOVES` that leads to\
+    the node, the index of its first child (the children of a node are stored contiguously), the number of children,\
+    the number of visits and the sum of the rewards for the player who made the move. The subtree of the moves that\
+    have been played since the last turn is reused.
+
+    After every turn, the attributes `iterations`, `playouts`, `playouts_per_second` and `nodes` describe the search.
+    """
+
+    def __init__(self, time_limit: Union[float, None] = 1.0, iterations: Union[int, None] = None,
+                 rollouts: int = 32, rollout_depth: int = 20, exploration: float = 1.4, max_nodes: int = 1000000,
+                 seed: Union[int, None] = None, verbose: bool = False):
+        """Initializes the player.
+
+        Args:
+            time_limit: The wall-clock time per move in seconds or `None` for no limit.
+            iterations: The number of iterations per move or `None` for no limit.
+            rollouts: The number of random playouts per iteration.
+            rollout_depth: The maximum number of moves of a random playout.
+            exploration: The exploration constant of UCT.
+            max_nodes: The maximum number of nodes of the tree. Leafs other than the root are not expanded anymore if\
+                the tree is full.
+            seed: The seed of the random number generator.
+            verbose: Whether to print the statistics of every search.
+
+        Raises:
+            Exception: Either a time limit or a number of iterations must be given
+        """
+        if time_limit is None and iterations is None:
+            raise Exception('Either a time limit or a number of iterations must be given')
+        self.time_limit = time_limit
+        self.max_iterations = iterations
+        self.rollouts = rollouts
+        self.rollout_depth = rollout_depth
+        self.exploration = exploration
+        self.max_nodes = max_nodes
+        self.verbose = verbose
+        self.rng = np.random.default_rng(seed)
+        self.iterations = 0
+        """The number of iterations of the last search."""
+        self.playouts = 0
+        """The number of random playouts of the last search."""
+        self.playouts_per_second = 0.0
+        """The number of random playouts per second of the last search."""
+        self.nodes = 0
+        """The number of nodes of the tree after the last search, including reused nodes."""
+        self.reused_nodes = 0
+        """The number of nodes that have been reused from the previous search."""
+        self._root_position = b''
+        self._history_length = 0
+        self._clear()
+
+    def _clear(self) -> None:
+        """Resets the tree to a single unexpanded root node."""
+        self._moves = array('h', [-1])
+        self._first_children = array('i', [-1])
+        self._child_counts = array('h', [0])
+        self._visits = array('i', [0])
+        self._values = array('d', [0.0])
+
+    def turn(self, game: Game, moves_history: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]) \
+            -> Tuple[Union[Space, Tuple[Space, Space]], Direction]:
+        start = perf_counter()
+        self._reuse(game, moves_history)
+        self.reused_nodes = len(self._moves) - 1
+        self.iterations = 0
+        self.playouts = 0
+
+        position = Game.from_bytes(game.to_bytes())
+        self._expand(0, position)
+        while (self.max_iterations is None or self.iterations < self.max_iterations) \
+                and (self.time_limit is None or perf_counter() - start < self.time_limit):
+            self._iterate(position)
+            self.iterations += 1
+
+        elapsed = perf_counter() - start
+        self.playouts_per_second = self.playouts / elapsed if elapsed > 0 else 0.0
+        self.nodes = len(self._moves)
+        if self.verbose:  # pragma: no cover
+            print(f'{self.iterations} iterations, {self.playouts} playouts, {self.playouts_per_second:.0f} playouts/s, '
+                  f'{self.nodes} nodes ({self.reused_nodes} reused)')
+
+        best = max(self.root_statistics(), key=lambda statistics: statistics[1])
+        return MOVES[best[0]]
+
+    def root_statistics(self) -> List[Tuple[int, int, float]]:
+        """Returns the statistics of the moves of the current position after a search, e.g. for merging the results of\
+        several searches.
+
+        Returns:
+            A list of tuples of the index of a move in `abalone.moves.MOVES`, its number of visits and the sum of its\
+            rewards.
+        """
+        first = self._first_children[0]
+        return [(self._moves[child], self._visits[child], self._values[child])
+                for child in range(first, first + self._child_counts[0])]
+
+    def _reuse(self, game: Game, moves_history: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]) -> None:
+        """Moves the root of the tree to the current position by following the moves that have been played since the\
+        last search. If the current position is not a successor of the previous root, the tree is cleared.
+
+        Args:
+            game: The current position.
+            moves_history: All moves of the game so far.
+        """
+        node = 0
+        if self._root_position and len(moves_history) >= self._history_length:
+            position = Game.from_bytes(self._root_position)
+            for move in moves_history[self._history_length:]:
+                index = encode_move(move)
+                first = self._first_children[node]
+                node = next((child for child in range(first, first + self._child_counts[node])
+                             if self._moves[child] == index), -1)
+                if node < 0:
+                    break
+                position.move(*move)
+                position.switch_player()
+            if node >= 0 and position.to_bytes() != game.to_bytes():
+                node = -1
+        else:
+            node = -1
+
+        self._root_position = game.to_bytes()
+        self._history_length = len(moves_history)
+        if node < 0:
+            self._clear()
+        elif node > 0:
+            self._reroot(node)
+
+    def _reroot(self, node: int) -> None:
+        """Replaces the tree by the subtree of a node, which becomes the root. The nodes are copied in breadth-first\
+        order, so that the children of every node remain contiguous.
+
+        Args:
+            node: The index of the new root.
+        """
+        moves, first_children, child_counts, visits, values = \
+            self._moves, self._first_children, self._child_counts, self._visits, self._values
+        self._moves = array('h', [-1])
+        self._first_children = array('i', [-1])
+        self._child_counts = array('h', [child_counts[node]])
+        self._visits = array('i', [visits[node]])
+        self._values = array('d', [values[node]])
+        queue = [(node, 0)]
+        for old, new in queue:
+            count = child_counts[old]
+            if count == 0:
+                continue
+            self._first_children[new] = len(self._moves)
+            first = first_children[old]
+            for child in range(first, first + count):
+                queue.append((child, len(self._moves)))
+                self._moves.append(moves[child])
+                self._first_children.append(-1)
+                self._child_counts.append(child_counts[child])
+                self._visits.append(visits[child])
+                self._values.append(values[child])
+
+    def _expand(self, node: int, position: Game) -> bool:
+        """Adds the legal moves of a leaf as its children.
+
+        Args:
+            node: The index of the leaf.
+            position: The position of the leaf.
+
+        Returns:
+            `True` if children have been added, `False` if the leaf is already expanded, the game is over, there is no\
+            legal move or the tree is full. The root is expanded even if the tree is full, so that there is always a\
+            move to play.
+        """
+        if self._child_counts[node] > 0 or (node > 0 and len(self._moves) >= self.max_nodes) \
+                or min(position.get_score()) <= LOSING_MARBLES:
+            return False
+        board = np.frombuffer(position.to_bytes(), dtype=np.int8)
+        children = np.flatnonzero(legal_move_masks(board[None, :61], board[61:])[0])
+        if len(children) == 0:
+            return False
+        self._first_children[node] = len(self._moves)
+        self._child_counts[node] = len(children)
+        self._moves.extend(children.astype(np.int16).tolist())
+        self._first_children.extend([-1] * len(children))
+        self._child_counts.extend([0] * len(children))
+        self._visits.extend([0] * len(children))
+        self._values.extend([0.0] * len(children))
+        return True
+
+    def _select(self, node: int) -> int:
+        """Selects the child of a node with the highest upper confidence bound (UCT). Unvisited children are selected\
+        first.
+
+        Args:
+            node: The index of an expanded node.
+
+        Returns:
+            The index of the selected child.
+        """
+        visits, values = self._visits, self._values
+        log_visits = log(max(visits[node], 1))
+        best, best_score = -1, -1.0
+        first = self._first_children[node]
+        for child in range(first, first + self._child_counts[node]):
+            child_visits = visits[child]
+            if child_visits == 0:
+                return child
+            score = values[child] / child_visits + self.exploration * sqrt(log_visits / child_visits)
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+    def _iterate(self, position: Game) -> None:
+        """Performs one iteration of the search: selection, expansion, random playouts and backpropagation. The\
+        position is changed by `abalone.game.Game.push` and restored by `abalone.game.Game.pop`.
+
+        Args:
+            position: The position of the root.
+        """
+        path = [0]
+        node = 0
+        while self._child_counts[node] > 0:
+            node = self._select(node)
+            position.push(*MOVES[self._moves[node]])
+            path.append(node)
+        if self._visits[node] > 0 and self._expand(node, position):
+            node = self._first_children[node] + int(self.rng.integers(self._child_counts[node]))
+            position.push(*MOVES[self._moves[node]])
+            path.append(node)
+
+        # the reward of black: 1 for a win, 0 for a loss, and between 0 and 1 depending on the marble difference for
+        # playouts that have not been finished
+        board = np.frombuffer(position.to_bytes(), dtype=np.int8)
+        _, result = play_random(np.repeat(board[None, :61], self.rollouts, axis=0),
+                                np.repeat(board[61:], self.rollouts), self.rollout_depth, self.rng)
+        rewards = np.where(result.winners != 0, result.winners > 0,
+                           0.5 + 0.5 * np.clip(result.marble_differences / _WINNING_MARBLES, -1, 1))
+        black_reward = float(rewards.mean())
+        self.playouts += self.rollouts
+
+        # the player who made the move to a node is the opponent of the player in turn at the node
+        mover = position.not_in_turn_player()
+        for node in reversed(path):
+            self._visits[node] += 1
+            self._values[node] += black_reward if mover is Player.BLACK else 1 - black_reward
+            mover = Player.WHITE if mover is Player.BLACK else Player.BLACK
+            if node != 0:
+                position.pop()
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module defines a fixed index space of all moves, e.g. for legal move masks of many positions at once (see\
+`abalone.batch` and `abalone.game.Game.legal_move_mask`), for the outputs of policy networks or for move ordering\
+tables. `abalone.moves.encode_move` and `abalone.moves.decode_move` convert between moves and their indices.
+
+`abalone.moves.MOVES` contains every move in the notation of `abalone.game.Game.generate_legal_moves` that can be legal\
+in some position: first all inline moves, ordered by space and direction, then all broadside moves, ordered by the\
+first space, the direction of the line (`NORTH_WEST`, `NORTH_EAST`, `EAST`), the length of the line and the direction\
+of movement. Moves that would always move a marble off the board are omitted.
+"""
+
+from typing import Dict, List, Tuple, Union
+
+from abalone.enums import Direction, Space
+from abalone.utils import DIRECTION_INDICES, DIRECTIONS, SPACE_INDICES, SPACES, line_to_edge, neighbor
+
+_OFF = len(SPACES)
+"""The index that denotes `abalone.enums.Space.OFF` in the gather tables of this module."""
+
+
+def _compute_moves() -> Tuple[List[Tuple[Union[Space, Tuple[Space, Space]], Direction]], List[List[int]],
+                              List[List[int]], List[List[int]]]:
+    """Computes the move index space and the indices of the spaces that are relevant for each move. This function is\
+    only used to build the tables of this module.
+
+    Returns:
+        A tuple of 1. the list of all moves, 2. the indices of the first six spaces of the line in the direction of\
+        every inline move, 3. the indices of the marbles and 4. the indices of the destinations of every broadside\
+        move. Missing spaces are denoted by `len(abalone.utils.SPACES)`, lines of two marbles repeat their first\
+        marble and its destination.
+    """
+    moves = []
+    inline_lines = []
+    for space in SPACES:
+        for direction in DIRECTIONS:
+            if neighbor(space, direction) is Space.OFF:
+                continue
+            line = [SPACE_INDICES[line_space] for line_space in line_to_edge(space, direction)[:6]]
+            moves.append((space, direction))
+            inline_lines.append(line + [_OFF] * (6 - len(line)))
+
+    broadside_marbles = []
+    broadside_destinations = []
+    for space in SPACES:
+        for line_direction in (Direction.NORTH_WEST, Direction.NORTH_EAST, Direction.EAST):
+            line = line_to_edge(space, line_direction)
+            for length in (2, 3):
+                if len(line) < length:
+                    continue
+                marbles = line[:length]
+                for direction in DIRECTIONS:
+                    destinations = [neighbor(marble, direction) for marble in marbles]
+                    opposite = DIRECTIONS[(DIRECTION_INDICES[line_direction] + 3) % len(DIRECTIONS)]
+                    if direction is line_direction or direction is opposite or Space.OFF in destinations:
+                        continue
+                    moves.append(((marbles[0], marbles[-1]), direction))
+                    broadside_marbles.append([SPACE_INDICES[marble] for marble in (marbles[0], *marbles)][-3:])
+                    broadside_destinations.append(
+                        [SPACE_INDICES[destination] for destination in (destinations[0], *destinations)][-3:])
+    return moves, inline_lines, broadside_marbles, broadside_destinations
+
+
+_MOVES, _INLINE_LINES, _BROADSIDE_MARBLES, _BROADSIDE_DESTINATIONS = _compute_moves()
+
+MOVES: Tuple[Tuple[Union[Space, Tuple[Space, Space]], Direction], ...] = tuple(_MOVES)
+"""All moves that can be legal, in the order of their index."""
+
+INLINE_MOVES = len(_INLINE_LINES)
+"""The number of inline moves, which precede the broadside moves in `abalone.moves.MOVES`."""
+
+MOVE_INDICES: Dict[Tuple[Union[Space, Tuple[Space, Space]], Direction], int] = {
+    move: index for index, move in enumerate(MOVES)
+}
+"""The index of every move of `abalone.moves.MOVES`."""
+
+
+def encode_move(move: Tuple[Union[Space, Tuple[Space, Space]], Direction]) -> int:
+    """Returns the index of a move in `abalone.moves.MOVES`. The two spaces of a broadside move may be given in any\
+    order.
+
+    This index is the encoding of moves within the package, e.g. in `abalone.transposition` and `abalone.parallel`.\
+    Only `abalone.utils.pack_move` is used where a move must be reproduced exactly, even if it can never be legal (game\
+    records and the moves of the players in `abalone.run_game.run_game`).
+
+    Example:
+        ```python
+        encode_move(((Space.C5, Space.C3), Direction.NORTH_WEST))
+        # 557
+        decode_move(557)
+        # ((Space.C3, Space.C5), Direction.NORTH_WEST)
+        ```
+
+    Args:
+        move: A tuple of 1. either one or a tuple of two `abalone.enums.Space`s and 2. a `abalone.enums.Direction`,\
+            according to the parameters of `abalone.game.Game.move`.
+
+    Returns:
+        An integer between 0 and `len(abalone.moves.MOVES) - 1`.
+
+    Raises:
+        Exception: The move can never be legal
+    """
+    index = MOVE_INDICES.get(move)
+    if index is None and isinstance(move[0], tuple):
+        index = MOVE_INDICES.get(((move[0][1], move[0][0]), move[1]))
+    if index is None:
+        raise Exception('The move can never be legal')
+    return index
+
+
+def decode_move(index: int) -> Tuple[Union[Space, Tuple[Space, Space]], Direction]:
+    """Returns the move with a given index, see `abalone.moves.encode_move`.
+
+    Args:
+        index: An integer between 0 and `len(abalone.moves.MOVES) - 1`.
+
+    Returns:
+        A tuple of 1. either one or a tuple of two `abalone.enums.Space`s and 2. a `abalone.enums.Direction`,\
+        according to the parameters of `abalone.game.Game.move`.
+    """
+    return MOVES[index]
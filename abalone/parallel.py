@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module runs the searches of the built-in search players in several processes.
+
+* `abalone.parallel.RootParallelMCTSPlayer` runs independent Monte Carlo Tree Searches (see\
+  `abalone.mcts_player.MCTSPlayer`) with different seeds in every process and merges the visits of the moves of the\
+  current position (root parallelization).
+* `abalone.parallel.LazySMPPlayer` runs alpha-beta searches (see `abalone.alpha_beta_player.AlphaBetaPlayer`) in every\
+  process that share one `abalone.transposition.TranspositionTable` in shared memory (lazy SMP). The searches of the\
+  helper processes fill the table with results that the other searches can use. Concurrent writes are not\
+  synchronized, so an entry can occasionally be mixed from two writes, which is tolerated like in other lazy SMP\
+  implementations.
+
+The worker processes are started with the first turn and keep running (and e.g. reuse their search trees) until the\
+player is closed. Every turn, the position is sent to them as `abalone.game.Game.to_bytes` and the moves history as\
+move indices (see `abalone.moves.encode_move`).
+"""
+
+import os
+from collections import defaultdict
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from time import perf_counter
+from typing import Any, Callable, DefaultDict, List, Tuple, Union
+
+from abalone.abstract_player import AbstractPlayer
+from abalone.alpha_beta_player import AlphaBetaPlayer
+from abalone.enums import Direction, Space
+from abalone.game import Game
+from abalone.moves import decode_move, encode_move
+from abalone.transposition import TranspositionTable
+
+
+class _WorkerPool:
+    """Worker processes that are connected by pipes, so that every request is handled by every worker."""
+
+    def __init__(self, target: Callable[..., None], worker_args: List[Tuple[Any, ...]]):
+        """Starts the workers.
+
+        Args:
+            target: The function of a worker, which is called with its end of the pipe and its arguments.
+            worker_args: The arguments of every worker.
+        """
+        self._connections: List[Connection] = []
+        self._processes: List[Process] = []
+        for args in worker_args:
+            connection, worker_connection = Pipe()
+            process = Process(target=target, args=(worker_connection, *args), daemon=True)
+            process.start()
+            worker_connection.close()
+            self._connections.append(connection)
+            self._processes.append(process)
+
+    def request(self, request: Any) -> List[Any]:
+        """Sends a request to all workers and waits for their responses.
+
+        Args:
+            request: The request, which must be picklable.
+
+        Returns:
+            The responses of the workers in their order.
+        """
+        for connection in self._connections:
+            connection.send(request)
+        return [connection.recv() for connection in self._connections]
+
+    def close(self) -> None:
+        """Stops the workers."""
+        for connection in self._connections:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):  # pragma: no cover
+                pass
+            connection.close()
+        for process in self._processes:
+            process.join(1)
+            if process.is_alive():  # pragma: no cover
+                process.terminate()
+
+
+def _request(game: Game, moves_history: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]) \
+        -> Tuple[bytes, List[int]]:
+    """Converts the arguments of `abalone.abstract_player.AbstractPlayer.turn` into a compact request."""
+    return game.to_bytes(), [encode_move(move) for move in moves_history]
+
+
+def _mcts_worker(connection: Connection, seed: Union[int, None], kwargs: dict) -> None:
+    """Runs the searches of a `abalone.parallel.RootParallelMCTSPlayer` in a worker process. NumPy is only imported\
+    here, so that `abalone.parallel.LazySMPPlayer` does not require it."""
+    from abalone.mcts_player import MCTSPlayer
+
+    player = MCTSPlayer(seed=seed, **kwargs)
+    for position, moves_history in iter(connection.recv, None):
+        player.turn(Game.from_bytes(position), [decode_move(move) for move in moves_history])
+        connection.send((player.root_statistics(), player.iterations, player.playouts))
+
+
+def _lazy_smp_worker(connection: Connection, buffer: Any, table_size_mb: float, min_depth: int, kwargs: dict) -> None:
+    """Runs the searches of a `abalone.parallel.LazySMPPlayer` in a worker process."""
+    player = AlphaBetaPlayer(table=TranspositionTable(table_size_mb, buffer), min_depth=min_depth, **kwargs)
+    for position, moves_history in iter(connection.recv, None):
+        move = player.turn(Game.from_bytes(position), [decode_move(move) for move in moves_history])
+        connection.send((encode_move(move), player.depth, player.nodes))
+
+
+class RootParallelMCTSPlayer(AbstractPlayer):
+    """A player that runs an `abalone.mcts_player.MCTSPlayer` in every worker process and plays the move with the most\
+    visits of all searches. It requires NumPy.
+
+    After every turn, the attributes `iterations`, `playouts` and `playouts_per_second` describe the searches of all\
+    workers together.
+    """
+
+    def __init__(self, workers: Union[int, None] = None, seed: Union[int, None] = None, **kwargs):
+        """Initializes the player.
+
+        Args:
+            workers: The number of worker processes or `None` for the number of processors.
+            seed: The seed of the random number generator of the first worker. The other workers use the following\
+                seeds.
+            **kwargs: These arguments are passed to `abalone.mcts_player.MCTSPlayer.__init__`, e.g. `time_limit`.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.kwargs = kwargs
+        self.iterations = 0
+        """The number of iterations of all searches of the last turn."""
+        self.playouts = 0
+        """The number of random playouts of all searches of the last turn."""
+        self.playouts_per_second = 0.0
+        """The number of random playouts per second of all searches of the last turn."""
+        self._pool: Union[_WorkerPool, None] = None
+
+    def turn(self, game: Game, moves_history: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]) \
+            -> Tuple[Union[Space, Tuple[Space, Space]], Direction]:
+        start = perf_counter()
+        if self._pool is None:
+            self._pool = _WorkerPool(_mcts_worker, [(None if self.seed is None else self.seed + index, self.kwargs)
+                                                    for index in range(self.workers)])
+        results = self._pool.request(_request(game, moves_history))
+
+        visits: DefaultDict[int, int] = defaultdict(int)
+        for root_statistics, _, _ in results:
+            for move, move_visits, _ in root_statistics:
+                visits[move] += move_visits
+        self.iterations = sum(result[1] for result in results)
+        self.playouts = sum(result[2] for result in results)
+        elapsed = perf_counter() - start
+        self.playouts_per_second = self.playouts / elapsed if elapsed > 0 else 0.0
+        return decode_move(max(visits, key=visits.__getitem__))
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def __del__(self):
+        self.close()
+
+
+class LazySMPPlayer(AbstractPlayer):
+    """A player that runs an `abalone.alpha_beta_player.AlphaBetaPlayer` in every worker process, which all share one\
+    transposition table. Half of the workers start iterative deepening one level deeper, so that the searches diverge.\
+    The move of the deepest completed search is played (the first worker wins ties).
+
+    After every turn, the attributes `depth`, `nodes` and `nodes_per_second` describe the searches of all workers\
+    together.
+    """
+
+    def __init__(self, workers: Union[int, None] = None, table_size_mb: float = 16, **kwargs):
+        """Initializes the player.
+
+        Args:
+            workers: The number of worker processes or `None` for the number of processors.
+            table_size_mb: The memory of the shared `abalone.transposition.TranspositionTable` in megabytes.
+            **kwargs: These arguments are passed to `abalone.alpha_beta_player.AlphaBetaPlayer.__init__`, e.g.\
+                `time_limit`.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.table_size_mb = table_size_mb
+        self.kwargs = kwargs
+        self.depth = 0
+        """The depth of the search whose move has been played in the last turn."""
+        self.nodes = 0
+        """The number of positions visited by all searches of the last turn."""
+        self.nodes_per_second = 0.0
+        """The number of positions visited per second by all searches of the last turn."""
+        self._pool: Union[_WorkerPool, None] = None
+
+    def turn(self, game: Game, moves_history: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]) \
+            -> Tuple[Union[Space, Tuple[Space, Space]], Direction]:
+        start = perf_counter()
+        if self._pool is None:
+            buffer = TranspositionTable.shared(self.table_size_mb).buffer
+            self._pool = _WorkerPool(_lazy_smp_worker, [(buffer, self.table_size_mb, 1 + index % 2, self.kwargs)
+                                                        for index in range(self.workers)])
+        results = self._pool.request(_request(game, moves_history))
+
+        move, self.depth, _ = max(results, key=lambda result: result[1])
+        self.nodes = sum(result[2] for result in results)
+        elapsed = perf_counter() - start
+        self.nodes_per_second = self.nodes / elapsed if elapsed > 0 else 0.0
+        return decode_move(move)
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def __del__(self):
+        self.close()
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module plays many random games at once with NumPy, e.g. for Monte Carlo evaluation of positions. It requires\
+NumPy, which can be installed with `pip install abalone-boai[numpy]`.
+
+All games are played in lockstep: In every step, the legal moves of all unfinished games are computed with\
+`abalone.batch.legal_move_masks`, one of them is chosen uniformly at random for each game and all moves are performed\
+with `abalone.batch.apply_moves`.
+"""
+
+from typing import NamedTuple, Tuple, Union
+
+import numpy as np
+
+from abalone.batch import apply_moves, legal_move_masks, stack_games
+from abalone.enums import Marble, Player
+from abalone.game import Game
+from abalone.utils import LOSING_MARBLES
+
+
+class PlayoutResult(NamedTuple):
+    """The results of random playouts, see `abalone.playouts.random_playouts`."""
+    winners: np.ndarray
+    """The value of the `abalone.enums.Player` who won each game, or 0 if the game was not finished."""
+    marble_differences: np.ndarray
+    """The number of black marbles minus the number of white marbles at the end of each game."""
+    plies: np.ndarray
+    """The number of moves of each game."""
+
+    def win_rate(self, player: Player) -> float:
+        """Returns the share of the games that a player has won.
+
+        Args:
+            player: An `abalone.enums.Player`.
+
+        Returns:
+            A number between 0 and 1.
+        """
+        return float(np.mean(self.winners == player.value)) if len(self.winners) else 0.0
+
+    def draw_rate(self) -> float:
+        """Returns the share of the games that were not finished within the maximum number of moves.
+
+        Returns:
+            A number between 0 and 1.
+        """
+        return float(np.mean(self.winners == 0)) if len(self.winners) else 0.0
+
+    def average_marble_difference(self, player: Player) -> float:
+        """Returns the average number of own marbles minus the number of opponent marbles at the end of the games.
+
+        Args:
+            player: The `abalone.enums.Player` from whose perspective the difference is computed.
+
+        Returns:
+            The average marble difference.
+        """
+        return float(np.mean(self.marble_differences)) * player.value if len(self.marble_differences) else 0.0
+
+
+def play_random(boards: np.ndarray, turns: np.ndarray, max_plies: Union[int, None] = 200,
+                rng: Union[np.random.Generator, int, None] = None) -> Tuple[np.ndarray, PlayoutResult]:
+    """Plays random moves in many positions until each game is won or `max_plies` moves have been made. A game also\
+    ends if the player in turn has no legal move.
+
+    Args:
+        boards: An integer array of shape `(N, 61)` with the values of the `abalone.enums.Marble`s, see\
+            `abalone.batch`.
+        turns: An integer array of shape `(N,)` with the values of the `abalone.enums.Player`s in turn.
+        max_plies: The maximum number of moves per game or `None` for no limit.
+        rng: A NumPy random number generator or a seed.
+
+    Returns:
+        A tuple of the final boards (shape `(N, 61)`) and the `abalone.playouts.PlayoutResult`.
+    """
+    rng = np.random.default_rng(rng)
+    boards = np.array(boards, dtype=np.int8)
+    turns = np.array(turns, dtype=np.int8)
+    plies = np.zeros(len(boards), dtype=np.int32)
+    active = np.ones(len(boards), dtype=bool)
+
+    ply = 0
+    while max_plies is None or ply < max_plies:
+        active &= ((boards == Marble.BLACK.value).sum(axis=1) > LOSING_MARBLES) \
+            & ((boards == Marble.WHITE.value).sum(axis=1) > LOSING_MARBLES)
+        rows = np.flatnonzero(active)
+        masks = legal_move_masks(boards[rows], turns[rows])
+        has_moves = masks.any(axis=1)
+        active[rows[~has_moves]] = False
+        rows, masks = rows[has_moves], masks[has_moves]
+        if len(rows) == 0:
+            break
+
+        # the legal moves of all games in one array, from which a random move of each game is chosen
+        move_rows, legal_moves = np.nonzero(masks)
+        counts = np.bincount(move_rows, minlength=len(rows))
+        moves = legal_moves[np.cumsum(counts) - counts + (rng.random(len(rows)) * counts).astype(np.intp)]
+        boards[rows] = apply_moves(boards[rows], turns[rows], moves)
+        turns[rows] = -turns[rows]
+        plies[rows] += 1
+        ply += 1
+
+    black = (boards == Marble.BLACK.value).sum(axis=1)
+    white = (boards == Marble.WHITE.value).sum(axis=1)
+    winners = np.where(white <= LOSING_MARBLES, Player.BLACK.value,
+                       np.where(black <= LOSING_MARBLES, Player.WHITE.value, 0)).astype(np.int8)
+    return boards, PlayoutResult(winners, (black - white).astype(np.int16), plies)
+
+
+def random_playouts(game: Game, playouts: int = 1000, max_plies: Union[int, None] = 200,
+                    rng: Union[np.random.Generator, int, None] = None) -> PlayoutResult:
+    """Plays many random games from the current position of a `abalone.game.Game`, which is not modified.
+
+    Example:
+        ```python
+        result = random_playouts(game, 1000)
+        print(result.win_rate(game.turn), result.average_marble_difference(game.turn))
+        ```
+
+    Args:
+        game: The `abalone.game.Game` from which the games are played.
+        playouts: The number of games.
+        max_plies: The maximum number of moves per game or `None` for no limit.
+        rng: A NumPy random number generator or a seed.
+
+    Returns:
+        The `abalone.playouts.PlayoutResult`.
+    """
+    boards, turns = stack_games([game])
+    return play_random(np.repeat(boards, playouts, axis=0), np.repeat(turns, playouts), max_plies, rng)[1]
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module reads and writes compact binary records of games, e.g. for archiving many games of\
+`abalone.tournament` or for creating datasets.
+
+A record file starts with the magic bytes `ABGR` and a version byte, followed by any number of games. Every game\
+consists of a header and its moves:
+
+| Bytes | Content |
+| --- | --- |
+| 1 | Index of the `abalone.enums.InitialPosition` in the enumeration |
+| 1 | Value of the `abalone.enums.Player` who moves first (signed) |
+| 1 | Value of the `abalone.enums.Player` who won or 0 if no one has won (signed) |
+| 2 | Number of bytes of the name of the black player |
+| 2 | Number of bytes of the name of the white player |
+| 4 | Number of moves |
+| * | Names of the black and white player (UTF-8) |
+| 2 per move | Moves packed by `abalone.utils.pack_move` |
+
+All integers are little-endian. Since the games are simply concatenated, a file can be extended by opening it in\
+append mode, and the games can be read one after another without loading the whole file.
+"""
+
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Generator, List, NamedTuple, Tuple, Union
+
+from abalone.enums import Direction, InitialPosition, Player, Space
+from abalone.game import Game
+from abalone.run_game import GameObserver
+from abalone.utils import pack_move, unpack_move
+
+MAGIC = b'ABGR\x01'
+"""The magic bytes at the start of a record file, including the version of the format."""
+
+_HEADER = struct.Struct('<BbbHHI')
+_INITIAL_POSITIONS = list(InitialPosition)
+
+
+class GameRecord(NamedTuple):
+    """A recorded game."""
+    initial_position: InitialPosition
+    """The `abalone.enums.InitialPosition` of the game."""
+    first_turn: Player
+    """The `abalone.enums.Player` who moves first."""
+    black: str
+    """The name of the black player."""
+    white: str
+    """The name of the white player."""
+    winner: Union[Player, None]
+    """The `abalone.enums.Player` who won the game or `None` if no one has won."""
+    moves: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]
+    """The moves of the game like the `moves_history` of `abalone.run_game.run_game`."""
+
+
+def _pack_moves(moves: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]) -> bytes:
+    """Packs moves by `abalone.utils.pack_move` into two little-endian bytes each.
+
+    Args:
+        moves: The moves like the `moves_history` of `abalone.run_game.run_game`.
+
+    Returns:
+        The packed moves.
+    """
+    packed = array('H', map(pack_move, moves))
+    if sys.byteorder == 'big':  # pragma: no cover
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack_moves(data: bytes) -> List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]:
+    """Reverses `abalone.records._pack_moves`.
+
+    Args:
+        data: The packed moves.
+
+    Returns:
+        The list of moves.
+    """
+    packed = array('H', data)
+    if sys.byteorder == 'big':  # pragma: no cover
+        packed.byteswap()
+    return list(map(unpack_move, packed))
+
+
+class GameRecordWriter:
+    """Appends games to a record file. The file is created if it does not exist yet.
+
+    Example:
+        ```python
+        with GameRecordWriter('games.abgr') as writer:
+            writer.write(GameRecord(InitialPosition.DEFAULT, Player.BLACK, 'black', 'white', None, moves_history))
+        ```
+    """
+
+    def __init__(self, path: str):
+        """Opens a record file for appending.
+
+        Args:
+            path: The path of the record file.
+
+        Raises:
+            Exception: Not a record file
+        """
+        self._file: BinaryIO = open(path, 'ab+')
+        self._file.seek(0)
+        magic = self._file.read(len(MAGIC))
+        if not magic:
+            self._file.write(MAGIC)
+        elif magic != MAGIC:
+            self._file.close()
+            raise Exception('Not a record file')
+
+    def __enter__(self) -> 'GameRecordWriter':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def write(self, record: GameRecord) -> None:
+        """Appends a game to the file.
+
+        Args:
+            record: The `abalone.records.GameRecord` to be written.
+        """
+        black, white = record.black.encode(), record.white.encode()
+        self._file.write(_HEADER.pack(_INITIAL_POSITIONS.index(record.initial_position), record.first_turn.value,
+                                      record.winner.value if record.winner is not None else 0, len(black), len(white),
+                                      len(record.moves)))
+        self._file.write(black + white + _pack_moves(record.moves))
+
+    def flush(self) -> None:
+        """Flushes the written games to the file."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Closes the file."""
+        self._file.close()
+
+
+class RecordObserver(GameObserver):
+    """An `abalone.run_game.GameObserver` that appends every finished game to a record file. The\
+    `abalone.enums.InitialPosition` and the first player are taken from the game at its start.
+
+    Example:
+        ```python
+        with GameRecordWriter('games.abgr') as writer:
+            list(run_game(black, white, [RecordObserver(writer, 'black', 'white')]))
+        ```
+    """
+
+    def __init__(self, writer: GameRecordWriter, black: str, white: str):
+        """Creates the observer.
+
+        Args:
+            writer: The `abalone.records.GameRecordWriter` of the record file.
+            black: The name of the black player.
+            white: The name of the white player.
+        """
+        self.writer = writer
+        """The `abalone.records.GameRecordWriter` of the record file."""
+        self.black = black
+        """The name of the black player."""
+        self.white = white
+        """The name of the white player."""
+        self.initial_position = InitialPosition.DEFAULT
+        """The `abalone.enums.InitialPosition` of the current game."""
+        self._first_turn = Player.BLACK
+
+    def on_start(self, game: Game) -> None:
+        """Determines the `abalone.enums.InitialPosition` of the game.
+
+        Args:
+            game: The `abalone.game.Game` in its initial state
+
+        Raises:
+            Exception: The game does not start from an `abalone.enums.InitialPosition`
+        """
+        position = game.to_bytes()
+        for initial_position in InitialPosition:
+            if Game(initial_position, game.turn).to_bytes() == position:
+                self.initial_position = initial_position
+                self._first_turn = game.turn
+                return
+        raise Exception('The game does not start from an initial position')
+
+    def on_end(self, game: Game, moves_history: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]],
+               winner: Union[Player, None], error: Union[Exception, None]) -> None:
+        self.writer.write(GameRecord(self.initial_position, self._first_turn, self.black, self.white, winner,
+                                     moves_history))
+
+
+def index_games(path: str) -> List[Tuple[int, int]]:
+    """Reads only the headers of the games of a record file and skips their names and moves, e.g. to split the file\
+    into parts that are read by `abalone.records.read_games` independently.
+
+    Args:
+        path: The path of the record file.
+
+    Returns:
+        A list of the offset in bytes and the number of moves of every game in the file.
+
+    Raises:
+        Exception: Not a record file
+        Exception: Truncated record file
+    """
+    games = []
+    with open(path, 'rb') as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise Exception('Not a record file')
+        end = file.seek(0, 2)
+        offset = file.seek(len(MAGIC))
+        while offset < end:
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise Exception('Truncated record file')
+            _, _, _, black_length, white_length, moves = _HEADER.unpack(header)
+            games.append((offset, moves))
+            offset = file.seek(black_length + white_length + 2 * moves, 1)
+        if offset > end:
+            raise Exception('Truncated record file')
+    return games
+
+
+def read_games(path: str, offset: Union[int, None] = None) -> Generator[GameRecord, None, None]:
+    """Reads the games of a record file one after another.
+
+    Args:
+        path: The path of the record file.
+        offset: The offset of the first game to be read as returned by `abalone.records.index_games` or `None` to\
+            start with the first game in the file.
+
+    Yields:
+        An `abalone.records.GameRecord` for every game in the file.
+
+    Raises:
+        Exception: Not a record file
+        Exception: Truncated record file
+    """
+    with open(path, 'rb') as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise Exception('Not a record file')
+        if offset is not None:
+            file.seek(offset)
+        while True:
+            header = file.read(_HEADER.size)
+            if not header:
+                return
+            if len(header) < _HEADER.size:
+                raise Exception('Truncated record file')
+            initial_position, first_turn, winner, black_length, white_length, moves = _HEADER.unpack(header)
+            size = black_length + white_length + 2 * moves
+            data = file.read(size)
+            if len(data) < size:
+                raise Exception('Truncated record file')
+            yield GameRecord(_INITIAL_POSITIONS[initial_position], Player(first_turn),
+                             data[:black_length].decode(), data[black_length:black_length + white_length].decode(),
+                             Player(winner) if winner else None, _unpack_moves(data[black_length + white_length:]))
+
+
+def replay(record: GameRecord) -> Generator[Game, None, None]:
+    """Replays a recorded game. The same `abalone.game.Game` instance is updated for all positions, so it must be\
+    copied (e.g. with `abalone.game.Game.to_bytes`) if it is needed after the next iteration.
+
+    Args:
+        record: An `abalone.records.GameRecord`.
+
+    Yields:
+        The `abalone.game.Game` at every position, from the initial position to the final position.
+    """
+    game = Game(record.initial_position, record.first_turn)
+    yield game
+    for move in record.moves:
+        game.move(*move)
+        game.switch_player()
+        yield game
+
+
+def read_positions(path: str) -> Generator[Tuple[Game, GameRecord], None, None]:
+    """Replays the games of a record file and yields every position, from the initial position to the final position\
+    of each game. Like for `abalone.records.replay`, the same `abalone.game.Game` instance is updated for all\
+    positions of a game.
+
+    Args:
+        path: The path of the record file.
+
+    Yields:
+        A tuple of the current `abalone.game.Game` and the `abalone.records.GameRecord` that it belongs to.
+    """
+    for record in read_games(path):
+        for game in replay(record):
+            yield game, record
@@ -19,13 +19,19 @@
 
 """This module runs a `abalone.game.Game`."""
 
-from traceback import format_exc
-from typing import Generator, List, Tuple, Union
+import signal
+import sys
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from time import perf_counter
+from traceback import format_exception
+from typing import Generator, Iterable, List, Tuple, Union
 
+from abalone import instrumentation
 from abalone.abstract_player import AbstractPlayer
 from abalone.enums import Direction, Player, Space
 from abalone.game import Game, IllegalMoveException
-from abalone.utils import line_from_to
+from abalone.utils import LOSING_MARBLES, line_from_to, pack_move, unpack_move
 
 
 def _get_winner(score: Tuple[int, int]) -> Union[Player, None]:
@@ -37,8 +43,8 @@ def _get_winner(score: Tuple[int, int]) -> Union[Player, None]:
     Returns:
         Either the `abalone.enums.Player` who won the game or `None` if no one has won yet.
     """
-    if 8 in score:
-        return Player.WHITE if score[0] == 8 else Player.BLACK
+    if LOSING_MARBLES in score:
+        return Player.WHITE if score[0] == LOSING_MARBLES else Player.BLACK
     return None
 
 
@@ -55,49 +61,247 @@ def _format_move(turn: Player, move: Tuple[Union[Space, Tuple[Space, Space]], Di
     return f'{moves + 1}: {turn.name} moves {", ".join(marbles)} in direction {move[1].name}'
 
 
-def run_game(black: AbstractPlayer, white: AbstractPlayer, **kwargs) \
+class GameObserver:
+    """An observer of the games run by `abalone.run_game.run_game`. The methods of this base class do nothing, so\
+    subclasses only need to override the callbacks they are interested in."""
+
+    def on_start(self, game: Game) -> None:
+        """Called once before the first move.
+
+        Args:
+            game: The `abalone.game.Game` in its initial state
+        """
+
+    def on_move(self, game: Game, move: Tuple[Union[Space, Tuple[Space, Space]], Direction],
+                moves_history: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]) -> None:
+        """Called after every legal move.
+
+        Args:
+            game: The `abalone.game.Game` after the move, i. e. the opponent of the moving player is in turn
+            move: The move as returned by `abalone.abstract_player.AbstractPlayer.turn`
+            moves_history: The moves made so far (including this move)
+        """
+
+    def on_end(self, game: Game, moves_history: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]],
+               winner: Union[Player, None], error: Union[Exception, None]) -> None:
+        """Called once after the game has ended.
+
+        Args:
+            game: The `abalone.game.Game` in its final state
+            moves_history: All moves of the game
+            winner: The `abalone.enums.Player` who won the game or `None` in case of a draw or an error
+            error: The `abalone.game.IllegalMoveException` or other exception by which the player in turn has ended\
+                the game or `None`
+        """
+
+
+class ConsoleObserver(GameObserver):
+    """Prints the progress / current state of a game at every turn."""
+
+    def on_start(self, game: Game) -> None:
+        self._print_state(game)
+
+    def on_move(self, game: Game, move: Tuple[Union[Space, Tuple[Space, Space]], Direction],
+                moves_history: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]) -> None:
+        print(_format_move(game.not_in_turn_player(), move, len(moves_history) - 1), end='\n\n')
+        self._print_state(game)
+
+    def on_end(self, game: Game, moves_history: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]],
+               winner: Union[Player, None], error: Union[Exception, None]) -> None:
+        if winner is not None:
+            print(f'{winner.name} won!')
+        elif error is None:
+            print('Draw!')
+        elif isinstance(error, IllegalMoveException):
+            print(f'{game.turn.name}\'s tried to perform an illegal move ({error})\n')
+        elif isinstance(error, TimeoutError):
+            print(f'{error}\n')
+        elif error is not None:
+            print(f'{game.turn.name}\'s move caused an exception\n')
+            print(''.join(format_exception(type(error), error, error.__traceback__)))
+
+    @staticmethod
+    def _print_state(game: Game) -> None:
+        score = game.get_score()
+        score_str = f'BLACK {score[0]} - WHITE {score[1]}'
+        print(score_str, game, '', sep='\n')
+
+
+def _serve_turns(connection: Connection, player: AbstractPlayer) -> None:
+    """Runs the turns of a player in the worker process of a `abalone.run_game._TimedPlayer` until it receives `None`.\
+    When the worker process is terminated, it exits like after `None`, so that `multiprocessing` also stops the\
+    processes started by the player.
+
+    Args:
+        connection: The end of the pipe of the worker process
+        player: The `abalone.abstract_player.AbstractPlayer`
+    """
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit())
+    for position, moves_history in iter(connection.recv, None):
+        try:
+            move = player.turn(Game.from_bytes(position), [unpack_move(move) for move in moves_history])
+            connection.send((True, pack_move(move)))
+        except Exception as ex:
+            connection.send((False, ex))
+
+
+class _TimedPlayer:
+    """Runs the turns of a player in a worker process, which is terminated when the player exceeds its time. Unlike a\
+    thread, a terminated process does not keep computing and slow down the following games. The player is passed to\
+    the worker process once, so it keeps its state between turns like in the main process, but it must be picklable\
+    if processes are not forked. The worker process is not a daemon, so that the player may start processes of its own\
+    (e.g. `abalone.parallel.LazySMPPlayer`)."""
+
+    def __init__(self, player: AbstractPlayer):
+        """Starts the worker process.
+
+        Args:
+            player: The `abalone.abstract_player.AbstractPlayer`
+        """
+        self._connection, worker_connection = Pipe()
+        self._process = Process(target=_serve_turns, args=(worker_connection, player))
+        self._process.start()
+        worker_connection.close()
+
+    def turn(self, game: Game, moves_history: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]],
+             timeout: float) -> Tuple[Tuple[Union[Space, Tuple[Space, Space]], Direction], float]:
+        """Waits at most `timeout` seconds for the move of the player. The game is copied before the clock starts, so\
+        a player who exceeds the timeout cannot change the actual game and the copy is not charged to the player.
+
+        Args:
+            game: The current `abalone.game.Game`
+            moves_history: The moves made so far
+            timeout: The remaining time of the player in seconds
+
+        Returns:
+            A tuple of the move as returned by `abalone.abstract_player.AbstractPlayer.turn` and the time in seconds\
+            that the player has taken.
+
+        Raises:
+            TimeoutError: The player has exceeded the timeout
+            Exception: Any exception raised by the player
+        """
+        request = game.to_bytes(), [pack_move(move) for move in moves_history]
+        start = perf_counter()
+        self._connection.send(request)
+        if not self._connection.poll(max(timeout, 0)):
+            self.close()
+            raise TimeoutError(f'{game.turn.name} has run out of time')
+        success, value = self._connection.recv()
+        elapsed = perf_counter() - start
+        if not success:
+            raise value
+        return unpack_move(value), elapsed
+
+    def close(self) -> None:
+        """Stops the worker process, even if the player is still computing."""
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process.join()
+        self._connection.close()
+
+
+def run_game(black: AbstractPlayer, white: AbstractPlayer, observers: Union[Iterable[GameObserver], None] = None,
+             max_moves: Union[int, None] = None, repetitions: Union[int, None] = None,
+             time_control: Union[Tuple[float, float], None] = None, **kwargs) \
         -> Generator[Tuple[Game, List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]], None, None]:
-    """Runs a game instance and prints the progress / current state at every turn.
+    """Runs a game instance and notifies the observers at every turn. By default, the progress / current state is\
+    printed at every turn. Pass an empty sequence of observers to run the game headless without any string formatting\
+    or output.
+
+    A game ends in a draw after `max_moves` moves or if the same position (including the player in turn) occurs for the\
+    `repetitions`th time. The positions are tracked by their `abalone.game.Game.zobrist` hashes. With a\
+    `time_control`, every player has a clock that is decreased by the duration of each of their turns and increased by\
+    a fixed increment after each of their moves. A player whose clock runs out loses the game like a player who makes\
+    an illegal move. With a time control, the turns are run in a worker process per player (see\
+    `abalone.run_game._TimedPlayer`), which is terminated when the player runs out of time.
+
+    While `abalone.instrumentation` is enabled, the turns of the players are timed and optionally profiled (the profile\
+    does not include the players' code with a `time_control`, because their turns then run in other processes).
 
     Args:
         black: An `abalone.abstract_player.AbstractPlayer`
         white: An `abalone.abstract_player.AbstractPlayer`
+        observers: The `abalone.run_game.GameObserver`s of the game or `None` for an\
+            `abalone.run_game.ConsoleObserver`
+        max_moves: The number of moves after which the game is a draw or `None` for no limit
+        repetitions: The number of occurrences of a position after which the game is a draw or `None` for no limit
+        time_control: A tuple of the initial time and the increment per move of each player in seconds or `None` for\
+            unlimited time
         **kwargs: These arguments are passed to `abalone.game.Game.__init__`
 
     Yields:
         A tuple of the current `abalone.game.Game` instance and the move history at the start of the game and after\
         every legal turn.
     """
-    game = Game()
+    observers = [ConsoleObserver()] if observers is None else list(observers)
+    game = Game(**kwargs)
     moves_history = []
-    yield game, moves_history
+    positions = {game.zobrist: 1}
+    clocks = [time_control[0], time_control[0]] if time_control is not None else None
+    timed_players = [_TimedPlayer(black), _TimedPlayer(white)] if time_control is not None else None
+    statistics = instrumentation.statistics
+    profile = statistics.start_game() if statistics is not None else None
+    for observer in observers:
+        observer.on_start(game)
+    try:
+        yield game, moves_history
 
-    while True:
-        score = game.get_score()
-        score_str = f'BLACK {score[0]} - WHITE {score[1]}'
-        print(score_str, game, '', sep='\n')
-
-        winner = _get_winner(score)
-        if winner is not None:
-            print(f'{winner.name} won!')
-            break
-
-        try:
-            move = black.turn(game, moves_history) if game.turn is Player.BLACK else white.turn(game, moves_history)
-            print(_format_move(game.turn, move, len(moves_history)), end='\n\n')
-
-            game.move(*move)
+        error = None
+        winner = _get_winner(game.get_score())
+        while winner is None:
+            player = black if game.turn is Player.BLACK else white
+            if statistics is not None:
+                turn_start = perf_counter()
+                if profile is not None:
+                    profile.enable()
+            try:
+                if clocks is None:
+                    move = player.turn(game, moves_history)
+                else:
+                    clock = 0 if game.turn is Player.BLACK else 1
+                    move, elapsed = timed_players[clock].turn(game, moves_history, clocks[clock])
+                    clocks[clock] -= elapsed
+                    if clocks[clock] < 0:
+                        raise TimeoutError(f'{game.turn.name} has run out of time')
+                    clocks[clock] += time_control[1]
+                game.move(*move)
+            except Exception as ex:
+                error = ex
+                break
+            finally:
+                if statistics is not None:
+                    if profile is not None:
+                        profile.disable()
+                    turn_statistics = statistics.turns[game.turn]
+                    turn_statistics.calls += 1
+                    turn_statistics.time += perf_counter() - turn_start
             game.switch_player()
             moves_history.append(move)
 
+            for observer in observers:
+                observer.on_move(game, move, moves_history)
             yield game, moves_history
-        except IllegalMoveException as ex:
-            print(f'{game.turn.name}\'s tried to perform an illegal move ({ex})\n')
-            break
-        except:
-            print(f'{game.turn.name}\'s move caused an exception\n')
-            print(format_exc())
-            break
+
+            # a win on the last allowed move or with a repeated position is not a draw
+            winner = _get_winner(game.get_score())
+            if winner is not None:
+                break
+            if max_moves is not None and len(moves_history) >= max_moves:
+                break
+            occurrences = positions.get(game.zobrist, 0) + 1
+            positions[game.zobrist] = occurrences
+            if repetitions is not None and occurrences >= repetitions:
+                break
+    finally:
+        if timed_players is not None:
+            for timed_player in timed_players:
+                timed_player.close()
+
+    if statistics is not None:
+        statistics.end_game(profile)
+    for observer in observers:
+        observer.on_end(game, moves_history, winner, error)
 
 
 if __name__ == '__main__':  # pragma: no cover
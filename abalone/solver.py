@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module provides a tactical solver for the end of a game, when a player is about to lose their sixth marble.
+
+The solver proves that a player (the "attacker") can push off enough marbles of the opponent within a number of plies,\
+no matter how the opponent defends. To keep the search small, the attacker only plays forcing moves, i.e. sumitos that\
+push off a marble or push the opponent's marbles onto the edge of the board, while every legal move of the defender is\
+searched. A proof therefore shows a forced win, but the absence of a proof does not show that there is none.
+
+Example:
+    ```python
+    solver = PushOffSolver()
+    solution = solver.solve(game, max_plies=5)
+    if solution is not None and solution.winner is game.turn:
+        move = solution.moves[0]
+    ```
+"""
+
+from time import perf_counter
+from typing import Dict, List, NamedTuple, Tuple, Union
+
+from abalone.bitboard import Bitboard, mask_to_spaces, popcount, spaces_to_mask
+from abalone.enums import Direction, Player, Space
+from abalone.game import Game
+from abalone.utils import DISTANCES_TO_EDGE, LOSING_MARBLES, SPACES
+
+_EDGE: int = spaces_to_mask(space for space in SPACES if DISTANCES_TO_EDGE[space] == 0)
+"""The bitboard of the spaces on the edge of the board."""
+
+
+class _Timeout(Exception):
+    """Exception that is raised to abort a search when the deadline has passed."""
+
+
+class Solution(NamedTuple):
+    """A forced win found by `abalone.solver.PushOffSolver.solve`."""
+    winner: Player
+    """The `abalone.enums.Player` who wins by force."""
+    moves: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]
+    """A sequence of moves of both players that ends with the winning push-off, starting with the player in turn. The\
+    moves of the loser are the defenses that delay the loss the longest."""
+
+    @property
+    def plies(self) -> int:
+        """The number of moves (of both players) until the game is won."""
+        return len(self.moves)
+
+
+class PushOffSolver:
+    """A solver for forced push-offs, see `abalone.solver`. Solved positions are cached, so that positions which\
+    reoccur in the same or in later searches (e.g. during a game) are not searched again.
+
+    After every call of `abalone.solver.PushOffSolver.solve` or `abalone.solver.PushOffSolver.prove`, the attribute\
+    `nodes` is the number of positions that have been searched. A search that is aborted at its deadline does not\
+    cache any incomplete results.
+    """
+
+    def __init__(self, max_entries: int = 1000000):
+        """Initializes the solver with an empty cache.
+
+        Args:
+            max_entries: The number of cached positions after which the cache is cleared.
+        """
+        self.max_entries = max_entries
+        self.nodes = 0
+        """The number of positions searched by the last call."""
+        self._wins: Dict[Tuple[int, int, Player, bool], Tuple[int, Tuple[Union[Space, Tuple[Space, Space]],
+                                                                         Direction]]] = {}
+        self._failures: Dict[Tuple[int, int, Player, bool], int] = {}
+        self._deadline: Union[float, None] = None
+
+    def clear(self) -> None:
+        """Clears the cache."""
+        self._wins.clear()
+        self._failures.clear()
+
+    def solve(self, game: Union[Game, Bitboard], max_plies: int = 5, deadline: Union[float, None] = None) \
+            -> Union[Solution, None]:
+        """Searches a forced win of the player in turn and, if there is none, a forced win of the opponent (which\
+        requires to search all moves of the player in turn and is therefore more expensive).
+
+        Args:
+            game: The position as `abalone.game.Game` or `abalone.bitboard.Bitboard`.
+            max_plies: The maximum number of moves of both players until the win.
+            deadline: The value of `time.perf_counter` at which the search is aborted or `None` for no limit.
+
+        Returns:
+            The shortest proven `abalone.solver.Solution` or `None` if no win has been proven (before the deadline).
+        """
+        board = game if isinstance(game, Bitboard) else Bitboard.from_game(game)
+        opponent = Player.WHITE if board.turn is Player.BLACK else Player.BLACK
+        nodes = 0
+        for attacker in (board.turn, opponent):
+            solution = self.prove(board, attacker, max_plies, deadline)
+            nodes += self.nodes
+            if solution is not None:
+                self.nodes = nodes
+                return solution
+        self.nodes = nodes
+        return None
+
+    def prove(self, game: Union[Game, Bitboard], attacker: Player, max_plies: int = 5,
+              deadline: Union[float, None] = None) -> Union[Solution, None]:
+        """Searches a forced win of a given player by iterative deepening, so that the shortest win is found.
+
+        Args:
+            game: The position as `abalone.game.Game` or `abalone.bitboard.Bitboard`.
+            attacker: The `abalone.enums.Player` whose win is searched.
+            max_plies: The maximum number of moves of both players until the win.
+            deadline: The value of `time.perf_counter` at which the search is aborted or `None` for no limit.
+
+        Returns:
+            The proven `abalone.solver.Solution` or `None` if no win of `attacker` has been proven (before the\
+            deadline).
+        """
+        board = game if isinstance(game, Bitboard) else Bitboard.from_game(game)
+        self.nodes = 0
+        if len(self._wins) + len(self._failures) > self.max_entries:
+            self.clear()
+        self._deadline = deadline
+        # the attacker wins with their own moves, so the number of plies is odd if the attacker is in turn
+        try:
+            for plies in range(1 if board.turn is attacker else 2, max_plies + 1, 2):
+                if deadline is not None and perf_counter() > deadline:
+                    break
+                if self._search(board, attacker, plies) is not None:
+                    return Solution(attacker, self._principal_variation(board, attacker, plies))
+        except _Timeout:
+            pass
+        return None
+
+    def _search(self, board: Bitboard, attacker: Player, plies: int) -> Union[int, None]:
+        """Searches a forced win of the attacker within a number of plies.
+
+        Args:
+            board: The position.
+            attacker: The `abalone.enums.Player` whose win is searched.
+            plies: The maximum number of moves of both players until the win.
+
+        Returns:
+            The number of plies of the longest defense against the fastest win or `None` if no win has been proven.
+
+        Raises:
+            _Timeout: The deadline has passed
+        """
+        self.nodes += 1
+        if self._deadline is not None and self.nodes & 1023 == 0 and perf_counter() > self._deadline:
+            raise _Timeout()
+        attacker_marbles, defender = (board.black, board.white) if attacker is Player.BLACK \
+            else (board.white, board.black)
+        defender_marbles = popcount(defender)
+        if defender_marbles <= LOSING_MARBLES:
+            return 0
+        if popcount(attacker_marbles) <= LOSING_MARBLES:
+            return None
+        attacking = board.turn is attacker
+        # every move of the attacker pushes off at most one marble
+        if defender_marbles - LOSING_MARBLES > (plies + attacking) // 2:
+            return None
+
+        key = (board.black, board.white, board.turn, attacking)
+        win = self._wins.get(key)
+        if win is not None and win[0] <= plies:
+            return win[0]
+        if self._failures.get(key, -1) >= plies:
+            return None
+
+        best: Union[Tuple[int, Tuple[Union[Space, Tuple[Space, Space]], Direction]], None] = None
+        if attacking:
+            for move, child in self._forcing_moves(board, defender):
+                result = self._search(child, attacker, plies - 1)
+                if result is not None and (best is None or result + 1 < best[0]):
+                    best = result + 1, move
+                    if result == 0:
+                        break
+        else:
+            for move in board.generate_legal_moves():
+                result = self._search(board.move(*move), attacker, plies - 1)
+                if result is None:
+                    best = None
+                    break
+                if best is None or result + 1 > best[0]:
+                    best = result + 1, move
+
+        if best is None:
+            self._failures[key] = plies
+            return None
+        self._wins[key] = best
+        return best[0]
+
+    @staticmethod
+    def _forcing_moves(board: Bitboard, defender: int) \
+            -> List[Tuple[Tuple[Union[Space, Tuple[Space, Space]], Direction], Bitboard]]:
+        """Generates the forcing moves of the player in turn, pushing off marbles first.
+
+        Args:
+            board: The position.
+            defender: The bitboard of the opponent of the player in turn.
+
+        Returns:
+            A list of the forcing moves and the resulting positions.
+        """
+        push_offs, edge_pushes = [], []
+        defender_marbles = popcount(defender)
+        defender_edge = popcount(defender & _EDGE)
+        for direction, cabooses in board.inline_move_masks().items():
+            for caboose in mask_to_spaces(cabooses):
+                move = caboose, direction
+                child = board.move(*move)
+                child_defender = child.white if board.turn is Player.BLACK else child.black
+                if child_defender == defender:
+                    continue
+                if popcount(child_defender) < defender_marbles:
+                    push_offs.append((move, child))
+                elif popcount(child_defender & _EDGE) > defender_edge:
+                    edge_pushes.append((move, child))
+        return push_offs + edge_pushes
+
+    def _principal_variation(self, board: Bitboard, attacker: Player, plies: int) \
+            -> List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]:
+        """Follows the cached best moves of a proven position.
+
+        Args:
+            board: The proven position.
+            attacker: The `abalone.enums.Player` who wins.
+            plies: The number of plies for which the position has been proven.
+
+        Returns:
+            The moves from `board` to the win.
+        """
+        moves = []
+        while plies > 0:
+            win = self._wins.get((board.black, board.white, board.turn, board.turn is attacker))
+            if win is None:
+                break
+            moves.append(win[1])
+            board = board.move(*win[1])
+            plies = win[0] - 1
+        return moves
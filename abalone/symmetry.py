@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module transforms positions and moves by the 12 symmetries of the hexagonal board (6 rotations, each with or\
+without a reflection) and by swapping the colors, e.g. to store only one of the equivalent positions in a table.
+
+A symmetry is identified by an integer between 0 and `abalone.symmetry.SYMMETRIES - 1`: The symmetry `k` (for\
+`k < 6`) rotates the board `k` times by 60 degrees clockwise around `abalone.enums.Space.E5`. The symmetry `k + 6`\
+first reflects the board at the line from `abalone.enums.Space.A1` to `abalone.enums.Space.I9` (which swaps the\
+letters and the numbers of the spaces) and then rotates it `k` times. Symmetry 0 is the identity.
+
+Positions are given in the representation of `abalone.game.Game.to_bytes`.
+"""
+
+from operator import itemgetter
+from typing import Callable, Dict, List, Tuple, Union
+
+from abalone.enums import Direction, Space
+from abalone.moves import MOVES, encode_move
+from abalone.utils import DIRECTION_INDICES, DIRECTIONS, SPACE_INDICES, SPACES
+
+SYMMETRIES = 12
+"""The number of symmetries of the board."""
+
+_COORDINATES = 'ABCDEFGHI'
+"""The letters of the rows of the board, whose indices are the first coordinate of a space."""
+
+_DIRECTION_VECTORS: Dict[Direction, Tuple[int, int]] = {
+    Direction.NORTH_EAST: (1, 1),
+    Direction.EAST: (0, 1),
+    Direction.SOUTH_EAST: (-1, 0),
+    Direction.SOUTH_WEST: (-1, -1),
+    Direction.WEST: (0, -1),
+    Direction.NORTH_WEST: (1, 0)
+}
+"""The change of the coordinates of a space (the index of the letter and of the number) in every\
+`abalone.enums.Direction`, like in `abalone.utils.neighbor`."""
+
+
+def _transform_vector(vector: Tuple[int, int], symmetry: int) -> Tuple[int, int]:
+    """Applies a symmetry to coordinates relative to the center of the board. This function is only used to build the\
+    tables of this module.
+
+    Args:
+        vector: The coordinates relative to `abalone.enums.Space.E5` or a direction vector.
+        symmetry: The index of the symmetry.
+
+    Returns:
+        The transformed vector.
+    """
+    x, y = vector
+    if symmetry >= 6:
+        x, y = y, x
+    for _ in range(symmetry % 6):
+        # maps NORTH_EAST to EAST, EAST to SOUTH_EAST and so on
+        x, y = x - y, x
+    return x, y
+
+
+def _compute_tables() -> Tuple[List[Tuple[Space, ...]], List[Tuple[Direction, ...]]]:
+    """Computes the images of all spaces and directions under every symmetry. This function is only used to build the\
+    tables of this module.
+
+    Returns:
+        A tuple of 1. the images of `abalone.utils.SPACES` and 2. the images of `abalone.utils.DIRECTIONS` for every\
+        symmetry.
+    """
+    vectors = {direction_vector: direction for direction, direction_vector in _DIRECTION_VECTORS.items()}
+    spaces, directions = [], []
+    for symmetry in range(SYMMETRIES):
+        images = []
+        for space in SPACES:
+            x, y = _transform_vector((_COORDINATES.index(space.value[0]) - 4, int(space.value[1]) - 5), symmetry)
+            images.append(Space[_COORDINATES[x + 4] + str(y + 5)])
+        spaces.append(tuple(images))
+        directions.append(tuple(vectors[_transform_vector(_DIRECTION_VECTORS[direction], symmetry)]
+                                for direction in DIRECTIONS))
+    return spaces, directions
+
+
+_SPACE_IMAGES, _DIRECTION_IMAGES = _compute_tables()
+"""The image of every space of `abalone.utils.SPACES` and every direction of `abalone.utils.DIRECTIONS` under every\
+symmetry."""
+
+SPACE_PERMUTATIONS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(SPACE_INDICES[image] for image in images) for images in _SPACE_IMAGES
+)
+"""The index of the image of every space (by its index in `abalone.utils.SPACES`) under every symmetry."""
+
+_GATHERS: List[Callable[[bytes], Tuple[int, ...]]] = []
+"""Functions that gather the bytes of a transformed position from the bytes of a position for every symmetry."""
+for _permutation in SPACE_PERMUTATIONS:
+    _inverse = [0] * len(SPACES)
+    for _index, _image in enumerate(_permutation):
+        _inverse[_image] = _index
+    # the player in turn is not changed
+    _GATHERS.append(itemgetter(*_inverse, len(SPACES)))
+
+_SWAP_COLORS = bytes.maketrans(b'\x01\xff', b'\xff\x01')
+"""A translation table that swaps the values of the black and white marbles and players (1 and -1 as signed bytes)."""
+
+
+def inverse(symmetry: int) -> int:
+    """Returns the symmetry that reverts a given symmetry.
+
+    Args:
+        symmetry: The index of a symmetry.
+
+    Returns:
+        The index of the inverse symmetry.
+    """
+    # reflections are their own inverse
+    return symmetry if symmetry >= 6 else -symmetry % 6
+
+
+def transform_space(space: Space, symmetry: int) -> Space:
+    """Applies a symmetry to a space.
+
+    Example:
+        ```python
+        transform_space(Space.A1, 1)
+        # Space.A5
+        ```
+
+    Args:
+        space: An `abalone.enums.Space` (`abalone.enums.Space.OFF` is not changed).
+        symmetry: The index of the symmetry.
+
+    Returns:
+        The transformed `abalone.enums.Space`.
+    """
+    return space if space is Space.OFF else _SPACE_IMAGES[symmetry][SPACE_INDICES[space]]
+
+
+def transform_direction(direction: Direction, symmetry: int) -> Direction:
+    """Applies a symmetry to a direction.
+
+    Args:
+        direction: An `abalone.enums.Direction`.
+        symmetry: The index of the symmetry.
+
+    Returns:
+        The transformed `abalone.enums.Direction`.
+    """
+    return _DIRECTION_IMAGES[symmetry][DIRECTION_INDICES[direction]]
+
+
+def transform_move(move: Tuple[Union[Space, Tuple[Space, Space]], Direction], symmetry: int) \
+        -> Tuple[Union[Space, Tuple[Space, Space]], Direction]:
+    """Applies a symmetry to a move, such that the transformed move is legal in the transformed position if and only if\
+    the move is legal in the original position. The spaces of a broadside move are not reordered, see\
+    `abalone.moves.encode_move` for a unique representation.
+
+    Args:
+        move: A tuple of 1. either one or a tuple of two `abalone.enums.Space`s and 2. a `abalone.enums.Direction`,\
+            according to the parameters of `abalone.game.Game.move`.
+        symmetry: The index of the symmetry.
+
+    Returns:
+        The transformed move.
+    """
+    marbles, direction = move
+    if isinstance(marbles, Space):
+        return transform_space(marbles, symmetry), transform_direction(direction, symmetry)
+    return (transform_space(marbles[0], symmetry), transform_space(marbles[1], symmetry)), \
+        transform_direction(direction, symmetry)
+
+
+MOVE_PERMUTATIONS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(encode_move(transform_move(move, symmetry)) for move in MOVES) for symmetry in range(SYMMETRIES)
+)
+"""The index of the image of every move of `abalone.moves.MOVES` under every symmetry, e.g. for transforming the\
+masks of `abalone.game.Game.legal_move_mask`."""
+
+
+def transform_position(position: bytes, symmetry: int, swap_colors: bool = False) -> bytes:
+    """Applies a symmetry to a position and optionally swaps the colors of the marbles and the player in turn.
+
+    Args:
+        position: A position as returned by `abalone.game.Game.to_bytes`.
+        symmetry: The index of the symmetry.
+        swap_colors: Whether the black and white marbles and the player in turn are swapped.
+
+    Returns:
+        The transformed position in the same representation.
+    """
+    transformed = bytes(_GATHERS[symmetry](position))
+    return transformed.translate(_SWAP_COLORS) if swap_colors else transformed
+
+
+def canonical_position(position: bytes, colors: bool = False) -> Tuple[bytes, int, bool]:
+    """Returns the canonical representative of all positions that are equivalent under the symmetries of the board,\
+    which is the one with the smallest bytes. Equivalent positions have the same canonical representative.
+
+    Example:
+        ```python
+        canonical, symmetry, swapped = canonical_position(game.to_bytes())
+        canonical_move = transform_move(move, symmetry)
+        move = transform_move(canonical_move, inverse(symmetry))
+        ```
+
+    Args:
+        position: A position as returned by `abalone.game.Game.to_bytes`.
+        colors: Whether positions with swapped colors (of the marbles and the player in turn) are also equivalent.
+
+    Returns:
+        A tuple of 1. the canonical position, 2. the index of the symmetry and 3. whether the colors have been swapped\
+        to obtain it from `position`.
+    """
+    positions = [position.translate(_SWAP_COLORS), position] if colors else [position]
+    return min((bytes(gather(candidate)), symmetry, swapped)
+               for swapped, candidate in zip((colors, False), positions) for symmetry, gather in enumerate(_GATHERS))
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module runs tournaments of many games between artificial intelligences in parallel processes."""
+
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, NamedTuple, Sequence, Tuple, Union
+
+from abalone.abstract_player import AbstractPlayer
+from abalone.enums import Direction, InitialPosition, Player, Space
+from abalone.game import Game
+from abalone.run_game import GameObserver, run_game
+
+PlayerFactory = Callable[[], AbstractPlayer]
+"""A picklable callable that creates a player, e.g. a subclass of `abalone.abstract_player.AbstractPlayer` or a\
+`functools.partial` of it."""
+
+
+class GameSpec(NamedTuple):
+    """The configuration of a single game of a tournament."""
+    index: int
+    """The number of the game within the tournament."""
+    black: PlayerFactory
+    """The factory of the black player."""
+    white: PlayerFactory
+    """The factory of the white player."""
+    initial_position: InitialPosition
+    """The `abalone.enums.InitialPosition` of the game."""
+    seed: str
+    """The seed of the module `random` at the start of the game."""
+    max_moves: Union[int, None]
+    """The number of moves after which the game is a draw or `None` for no limit."""
+    repetitions: Union[int, None]
+    """The number of occurrences of a position after which the game is a draw or `None` for no limit."""
+    time_control: Union[Tuple[float, float], None]
+    """The initial time and the increment per move of each player in seconds or `None` for unlimited time."""
+
+
+class GameResult(NamedTuple):
+    """The result of a single game of a tournament."""
+    spec: GameSpec
+    """The configuration of the game."""
+    winner: Union[Player, None]
+    """The `abalone.enums.Player` who won the game or `None` in case of a draw."""
+    reason: str
+    """Why the game ended: `'score'`, `'forfeit'` (the loser made an illegal move or caused an exception), `'time'`\
+    (the loser has run out of time), `'move limit'` or `'repetition'`."""
+    score: Tuple[int, int]
+    """The final score as returned by `abalone.game.Game.get_score`."""
+    moves: int
+    """The number of moves of the game."""
+    move_times: Tuple[float, float]
+    """The total time of the moves of black and white in seconds."""
+
+
+class PlayerStatistics:
+    """The aggregated results of a player in a tournament, see `abalone.tournament.summarize`."""
+
+    def __init__(self):
+        self.games = 0
+        """The number of games played."""
+        self.wins = 0
+        """The number of games won."""
+        self.losses = 0
+        """The number of games lost."""
+        self.draws = 0
+        """The number of games that ended in a draw."""
+        self.moves = 0
+        """The number of moves made by the player."""
+        self.time = 0.0
+        """The total time of the moves made by the player in seconds."""
+
+    def __repr__(self) -> str:
+        return f'{self.wins} wins, {self.losses} losses, {self.draws} draws in {self.games} games, ' \
+               f'{self.time_per_move * 1000:.1f} ms/move'
+
+    @property
+    def time_per_move(self) -> float:
+        """The average time per move in seconds."""
+        return self.time / self.moves if self.moves else 0.0
+
+
+def player_name(factory: PlayerFactory) -> str:
+    """Returns a name for a player factory, which is used to aggregate the results of a tournament.
+
+    Args:
+        factory: A `abalone.tournament.PlayerFactory`.
+
+    Returns:
+        The qualified name of a class or function or the representation of other callables.
+    """
+    name = getattr(factory, '__qualname__', None)
+    return f'{factory.__module__}.{name}' if name is not None else repr(factory)
+
+
+def schedule(pairings: Iterable[Tuple[PlayerFactory, PlayerFactory]], games_per_pairing: int = 1,
+             initial_positions: Sequence[InitialPosition] = (InitialPosition.DEFAULT,), swap_colors: bool = True,
+             seed: int = 0, max_moves: Union[int, None] = 1000, repetitions: Union[int, None] = 3,
+             time_control: Union[Tuple[float, float], None] = None) -> List[GameSpec]:
+    """Creates the configurations of the games of a tournament. Every game gets its own seed, which only depends on\
+    `seed` and the index of the game. Therefore the results are reproducible no matter how many processes play the\
+    games or in which order.
+
+    Args:
+        pairings: Tuples of the factories of the black and the white player.
+        games_per_pairing: The number of games per pairing and initial position (and color, see `swap_colors`).
+        initial_positions: The `abalone.enums.InitialPosition`s to be played.
+        swap_colors: Whether every pairing is also played with swapped colors.
+        seed: The seed of the tournament.
+        max_moves: The number of moves after which a game is a draw or `None` for no limit.
+        repetitions: The number of occurrences of a position after which a game is a draw or `None` for no limit.
+        time_control: The initial time and the increment per move of each player in seconds or `None` for unlimited\
+            time, see `abalone.run_game.run_game`.
+
+    Returns:
+        A list of `abalone.tournament.GameSpec`s.
+    """
+    games = []
+    for black, white in pairings:
+        colors = [(black, white), (white, black)] if swap_colors else [(black, white)]
+        for initial_position in initial_positions:
+            for _ in range(games_per_pairing):
+                for black_factory, white_factory in colors:
+                    index = len(games)
+                    games.append(GameSpec(index, black_factory, white_factory, initial_position, f'{seed}:{index}',
+                                          max_moves, repetitions, time_control))
+    return games
+
+
+class _ResultObserver(GameObserver):
+    """Records the time per move and the end of a game."""
+
+    def __init__(self):
+        self.move_times = [0.0, 0.0]
+        self.winner = None
+        self.error = None
+        self._start = 0.0
+
+    def on_start(self, game: Game) -> None:
+        self._start = perf_counter()
+
+    def on_move(self, game: Game, move: Tuple[Union[Space, Tuple[Space, Space]], Direction],
+                moves_history: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]) -> None:
+        now = perf_counter()
+        # the player who has just moved is not in turn anymore
+        self.move_times[0 if game.turn is Player.WHITE else 1] += now - self._start
+        self._start = now
+
+    def on_end(self, game: Game, moves_history: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]],
+               winner: Union[Player, None], error: Union[Exception, None]) -> None:
+        self.winner = winner
+        self.error = error
+
+
+def play_game(spec: GameSpec) -> GameResult:
+    """Plays a single game of a tournament by means of `abalone.run_game.run_game` without any output.
+
+    Args:
+        spec: The configuration of the game.
+
+    Returns:
+        The `abalone.tournament.GameResult`.
+    """
+    random.seed(spec.seed)
+    observer = _ResultObserver()
+    game, moves_history = deque(run_game(spec.black(), spec.white(), [observer], spec.max_moves, spec.repetitions,
+                                         spec.time_control, initial_position=spec.initial_position), maxlen=1)[0]
+
+    winner = observer.winner
+    if winner is not None:
+        reason = 'score'
+    elif isinstance(observer.error, TimeoutError):
+        reason = 'time'
+        winner = game.not_in_turn_player()
+    elif observer.error is not None:
+        reason = 'forfeit'
+        winner = game.not_in_turn_player()
+    elif spec.max_moves is not None and len(moves_history) >= spec.max_moves:
+        reason = 'move limit'
+    else:
+        reason = 'repetition'
+    return GameResult(spec, winner, reason, game.get_score(), len(moves_history),
+                      (observer.move_times[0], observer.move_times[1]))
+
+
+def run_tournament(games: Sequence[GameSpec], workers: Union[int, None] = None) -> List[GameResult]:
+    """Plays the games of a tournament in a pool of processes.
+
+    Example:
+        ```python
+        games = schedule([(AlphaBetaPlayer, RandomPlayer)], games_per_pairing=10, initial_positions=InitialPosition)
+        print(summarize(run_tournament(games)))
+        ```
+
+    Args:
+        games: The configurations of the games, see `abalone.tournament.schedule`.
+        workers: The number of processes (`None` for the number of processors). With a single worker, the games are\
+            played in the current process.
+
+    Returns:
+        The `abalone.tournament.GameResult`s in the order of `games`.
+    """
+    if workers == 1:
+        return list(map(play_game, games))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(play_game, games))
+
+
+def summarize(results: Iterable[GameResult]) -> Dict[str, PlayerStatistics]:
+    """Aggregates the results of a tournament per player.
+
+    Args:
+        results: The `abalone.tournament.GameResult`s of the tournament.
+
+    Returns:
+        A dictionary of the `abalone.tournament.PlayerStatistics` by the names of the players (see\
+        `abalone.tournament.player_name`).
+    """
+    statistics: Dict[str, PlayerStatistics] = {}
+    for result in results:
+        for player, factory, move_time in ((Player.BLACK, result.spec.black, result.move_times[0]),
+                                           (Player.WHITE, result.spec.white, result.move_times[1])):
+            player_statistics = statistics.setdefault(player_name(factory), PlayerStatistics())
+            player_statistics.games += 1
+            if result.winner is None:
+                player_statistics.draws += 1
+            elif result.winner is player:
+                player_statistics.wins += 1
+            else:
+                player_statistics.losses += 1
+            # black makes the first move
+            player_statistics.moves += (result.moves + (player is Player.BLACK)) // 2
+            player_statistics.time += move_time
+    return statistics
+
+
+if __name__ == '__main__':  # pragma: no cover
+    # Run a tournament from the command line.
+    import argparse
+    import importlib
+
+    def _load_player(path: str) -> PlayerFactory:
+        module, name = path.rsplit('.', 1)
+        return getattr(importlib.import_module(module), name)
+
+    parser = argparse.ArgumentParser(description='Run a tournament between two players.')
+    parser.add_argument('black', help='the first player as <module>.<class>')
+    parser.add_argument('white', help='the second player as <module>.<class>')
+    parser.add_argument('--games', type=int, default=10, help='the number of games per initial position and color')
+    parser.add_argument('--workers', type=int, default=None, help='the number of processes')
+    parser.add_argument('--seed', type=int, default=0, help='the seed of the tournament')
+    parser.add_argument('--max-moves', type=int, default=1000, help='the number of moves until a draw')
+    parser.add_argument('--time', type=float, nargs=2, default=None, metavar=('CLOCK', 'INCREMENT'),
+                        help='the time control of each player in seconds')
+    args = parser.parse_args()
+
+    tournament = schedule([(_load_player(args.black), _load_player(args.white))], args.games, list(InitialPosition),
+                          seed=args.seed, max_moves=args.max_moves,
+                          time_control=tuple(args.time) if args.time else None)
+    for name, player_statistics in summarize(run_tournament(tournament, args.workers)).items():
+        print(f'{name}: {player_statistics}')
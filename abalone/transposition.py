@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module provides a transposition table for search algorithms, i.e. a cache of search results by position."""
+
+import ctypes
+from enum import Enum
+from multiprocessing import RawArray
+from typing import NamedTuple, Tuple, Union
+
+from abalone.enums import Direction, Space
+from abalone.moves import decode_move, encode_move
+
+
+class Bound(Enum):
+    """Enumeration of the kinds of scores stored in a `abalone.transposition.TranspositionTable`."""
+    value: int
+    EXACT = 0
+    """The score is the exact value of the position."""
+    LOWER = 1
+    """The search failed high, the value of the position is at least the score."""
+    UPPER = 2
+    """The search failed low, the value of the position is at most the score."""
+
+
+_BOUNDS: Tuple[Bound, Bound, Bound] = (Bound.EXACT, Bound.LOWER, Bound.UPPER)
+"""The `abalone.transposition.Bound`s indexed by their values."""
+
+_NO_MOVE = 0xFFFF
+"""The best move index of an entry without a best move (see `abalone.moves.encode_move`)."""
+
+_EMPTY = -1
+"""The depth of an empty slot."""
+
+_EMPTY_BYTE = _EMPTY.to_bytes(1, 'little', signed=True)
+"""The byte of the depth of an empty slot."""
+
+ENTRY_SIZE = 16
+"""The number of bytes needed for an entry: 8 for the key, 4 for the score, 2 for the best move and 1 each for the\
+depth and the bound."""
+
+
+class TranspositionEntry(NamedTuple):
+    """An entry of a `abalone.transposition.TranspositionTable`."""
+    depth: int
+    """The remaining search depth for which the score has been computed."""
+    score: int
+    """The score of the position."""
+    bound: Bound
+    """Whether the score is exact or a lower or upper bound."""
+    best_move: Union[Tuple[Union[Space, Tuple[Space, Space]], Direction], None]
+    """The best move found in the position or `None`."""
+
+
+class TranspositionTable:
+    """A transposition table with a fixed amount of memory.
+
+    Entries are stored in a buffer, which is allocated once. The table consists of buckets of two slots, which are\
+    selected by the key of a position (e.g. `abalone.game.Game.zobrist`). The first slot of a bucket is\
+    depth-preferred: it is only replaced by an entry with at least the same depth (its previous entry then moves to the\
+    second slot). The second slot is always replaced.
+
+    Example:
+        ```python
+        table = TranspositionTable(size_mb=64)
+        table.store(game.zobrist, depth, score, Bound.EXACT, best_move)
+        entry = table.probe(game.zobrist)
+        ```
+    """
+
+    def __init__(self, size_mb: float = 16, buffer=None):
+        """Allocates the table.
+
+        Args:
+            size_mb: The amount of memory of the table in megabytes (2 ** 20 bytes).
+            buffer: An optional writable buffer of `abalone.transposition.TranspositionTable.size` bytes in which the\
+                entries are stored instead of in memory allocated by the table, e.g. a `multiprocessing.RawArray`\
+                that is shared by the tables of several processes. The buffer is not cleared, so that several tables\
+                can be attached to the same entries. A new buffer has to be initialized with\
+                `abalone.transposition.TranspositionTable.clear` by one of the tables.
+
+        Raises:
+            Exception: The size must be large enough for at least one bucket
+            Exception: The buffer must have the size of the table
+        """
+        self.buckets = int(size_mb * 2 ** 20) // (2 * ENTRY_SIZE)
+        """The number of buckets of two slots."""
+        if self.buckets < 1:
+            raise Exception('The size must be large enough for at least one bucket')
+        slots = 2 * self.buckets
+        self.buffer = buffer if buffer is not None else bytearray(slots * ENTRY_SIZE)
+        """The memory of the entries."""
+        self._bytes = memoryview(self.buffer).cast('B')
+        if len(self._bytes) != slots * ENTRY_SIZE:
+            raise Exception('The buffer must have the size of the table')
+        # the fields of the entries are stored in consecutive sections of the buffer, ordered by their alignment
+        self._keys = self._bytes[:8 * slots].cast('Q')
+        self._scores = self._bytes[8 * slots:12 * slots].cast('i')
+        self._best_moves = self._bytes[12 * slots:14 * slots].cast('H')
+        self._depths = self._bytes[14 * slots:15 * slots].cast('b')
+        self._bounds = self._bytes[15 * slots:].cast('b')
+        if buffer is None:
+            self.clear()
+        self.hits = 0
+        """The number of successful calls of `abalone.transposition.TranspositionTable.probe`."""
+        self.misses = 0
+        """The number of unsuccessful calls of `abalone.transposition.TranspositionTable.probe`."""
+        self.collisions = 0
+        """The number of entries of other positions that have been overwritten or displaced by\
+        `abalone.transposition.TranspositionTable.store`."""
+
+    @classmethod
+    def shared(cls, size_mb: float = 16) -> 'TranspositionTable':
+        """Creates an empty table in shared memory. Its `abalone.transposition.TranspositionTable.buffer` can be passed\
+        to processes when they are started, which can then attach tables of the same size to it.
+
+        Example:
+            ```python
+            table = TranspositionTable.shared(size_mb=64)
+            Process(target=search, args=(table.buffer,)).start()
+            # in the new process
+            table = TranspositionTable(64, buffer)
+            ```
+
+        Args:
+            size_mb: The amount of memory of the table in megabytes (2 ** 20 bytes).
+
+        Returns:
+            A new `abalone.transposition.TranspositionTable` whose buffer is a `multiprocessing.RawArray`.
+        """
+        table = cls(size_mb, RawArray(ctypes.c_ubyte, int(size_mb * 2 ** 20) // (2 * ENTRY_SIZE) * 2 * ENTRY_SIZE))
+        table.clear()
+        return table
+
+    def __len__(self) -> int:
+        return 2 * self.buckets - self._depths.tobytes().count(_EMPTY_BYTE)
+
+    @property
+    def size(self) -> int:
+        """The amount of memory used by the entries in bytes."""
+        return 2 * self.buckets * ENTRY_SIZE
+
+    def clear(self) -> None:
+        """Removes all entries and resets the counters."""
+        slots = 2 * self.buckets
+        self._bytes[14 * slots:15 * slots] = _EMPTY_BYTE * slots
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+
+    def probe(self, key: int) -> Union[TranspositionEntry, None]:
+        """Looks up the entry of a position.
+
+        Args:
+            key: The 64 bit hash of the position, e.g. `abalone.game.Game.zobrist`.
+
+        Returns:
+            The `abalone.transposition.TranspositionEntry` of the position or `None` if there is none.
+        """
+        slot = key % self.buckets * 2
+        if self._keys[slot] != key or self._depths[slot] == _EMPTY:
+            slot += 1
+            if self._keys[slot] != key or self._depths[slot] == _EMPTY:
+                self.misses += 1
+                return None
+        self.hits += 1
+        best_move = self._best_moves[slot]
+        return TranspositionEntry(self._depths[slot], self._scores[slot], _BOUNDS[self._bounds[slot]],
+                                  None if best_move == _NO_MOVE else decode_move(best_move))
+
+    def store(self, key: int, depth: int, score: int, bound: Bound,
+              best_move: Union[Tuple[Union[Space, Tuple[Space, Space]], Direction], None] = None) -> None:
+        """Stores the result of a search. If there is already an entry for the position, it is replaced.
+
+        Args:
+            key: The 64 bit hash of the position, e.g. `abalone.game.Game.zobrist`.
+            depth: The remaining search depth for which the score has been computed (0 to 127).
+            score: The score of the position (a 32 bit integer).
+            bound: Whether the score is exact or a lower or upper bound.
+            best_move: The best move found in the position or `None`. It is stored by its index in\
+                `abalone.moves.MOVES`.
+
+        Raises:
+            Exception: The depth must be between 0 and 127
+            Exception: The move can never be legal
+        """
+        if not 0 <= depth <= 127:
+            # negative depths are reserved for empty slots
+            raise Exception('The depth must be between 0 and 127')
+        slot = key % self.buckets * 2
+        keys, depths = self._keys, self._depths
+        if keys[slot] == key or depths[slot] == _EMPTY:
+            pass
+        elif keys[slot + 1] == key:
+            if depth < depths[slot]:
+                slot += 1
+            else:
+                # the previous entry of the position is replaced by the one of the first slot
+                self._move_slot(slot, slot + 1)
+        elif depth >= depths[slot]:
+            if depths[slot + 1] != _EMPTY:
+                self.collisions += 1
+            self._move_slot(slot, slot + 1)
+        else:
+            slot += 1
+            if depths[slot] != _EMPTY:
+                self.collisions += 1
+        keys[slot] = key
+        depths[slot] = depth
+        self._scores[slot] = score
+        self._bounds[slot] = bound.value
+        self._best_moves[slot] = _NO_MOVE if best_move is None else encode_move(best_move)
+
+    def _move_slot(self, source: int, target: int) -> None:
+        """Copies an entry to another slot.
+
+        Args:
+            source: The index of the slot to be copied.
+            target: The index of the slot to be overwritten.
+        """
+        self._keys[target] = self._keys[source]
+        self._depths[target] = self._depths[source]
+        self._scores[target] = self._scores[source]
+        self._bounds[target] = self._bounds[source]
+        self._best_moves[target] = self._best_moves[source]
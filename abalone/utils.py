@@ -18,10 +18,115 @@
 
 """This module provides some functions to simplify various operations."""
 
-from typing import List, Tuple, Union
+from typing import Dict, List, Tuple, Union
 
 from abalone.enums import Direction, Space
 
+SPACES: Tuple[Space, ...] = tuple(space for space in Space if space is not Space.OFF)
+"""All 61 `abalone.enums.Space`s on the board (i.e. except `abalone.enums.Space.OFF`) in the order of their\
+declaration. The position of a space in this tuple is its index, e.g. in the flat board of `abalone.game.Game`."""
+
+SPACE_INDICES: Dict[Space, int] = {space: index for index, space in enumerate(SPACES)}
+"""The index of every `abalone.enums.Space` in `abalone.utils.SPACES`."""
+
+DIRECTIONS: Tuple[Direction, ...] = tuple(Direction)
+"""All six `abalone.enums.Direction`s (without aliases) in the order of their declaration. The position of a direction\
+in this tuple is its index."""
+
+DIRECTION_INDICES: Dict[Direction, int] = {direction: index for index, direction in enumerate(DIRECTIONS)}
+"""The index of every `abalone.enums.Direction` in `abalone.utils.DIRECTIONS`."""
+
+LOSING_MARBLES = 8
+"""The number of marbles with which a player has lost the game, i.e. after six of their marbles have been pushed off\
+the board."""
+
+
+def _compute_neighbor(space: Space, direction: Direction) -> Space:
+    """Computes the neighboring `abalone.enums.Space` of a given space in a given `abalone.enums.Direction` from the\
+    coordinates of the space. This function is only used to build the lookup tables of this module, see\
+    `abalone.utils.neighbor`.
+
+    Args:
+        space: The `abalone.enums.Space` of which the neighbour is returned.
+        direction: The `abalone.enums.Direction` in which the neighbour is located.
+
+    Returns:
+        The neighboring `abalone.enums.Space` of `space` in `direction` or `abalone.enums.Space.OFF`.
+    """
+
+    if space is Space.OFF:
+        return Space.OFF
+
+    xs = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I']
+    ys = ['1', '2', '3', '4', '5', '6', '7', '8', '9']
+
+    xi = xs.index(space.value[0])
+    yi = ys.index(space.value[1])
+
+    if direction is Direction.NORTH_EAST:
+        xi += 1
+        yi += 1
+    elif direction is Direction.EAST:
+        yi += 1
+    elif direction is Direction.SOUTH_EAST:
+        xi -= 1
+    elif direction is Direction.SOUTH_WEST:
+        xi -= 1
+        yi -= 1
+    elif direction is Direction.WEST:
+        yi -= 1
+    elif direction is Direction.NORTH_WEST:
+        xi += 1
+
+    if xi < 0 or xi >= len(xs) or yi < 0 or yi >= len(ys) or xs[xi] + ys[yi] not in Space.__members__:
+        return Space.OFF
+
+    return Space[xs[xi] + ys[yi]]
+
+
+_NEIGHBORS: Dict[Space, Dict[Direction, Space]] = {
+    space: {direction: _compute_neighbor(space, direction) for direction in Direction} for space in Space
+}
+"""The neighbor of every `abalone.enums.Space` (including `abalone.enums.Space.OFF`) in every\
+`abalone.enums.Direction`."""
+
+
+def _compute_line_to_edge(from_space: Space, direction: Direction) -> Tuple[Space, ...]:
+    """Computes the line from a `abalone.enums.Space` to the edge of the board in a given `abalone.enums.Direction`.\
+    This function is only used to build the lookup tables of this module, see `abalone.utils.line_to_edge`.
+
+    Args:
+        from_space: The starting `abalone.enums.Space`.
+        direction: The `abalone.enums.Direction` of the line.
+
+    Returns:
+        A tuple of `abalone.enums.Space`s starting with `from_space`.
+    """
+    line = [from_space]
+    while _NEIGHBORS[line[-1]][direction] is not Space.OFF:
+        line.append(_NEIGHBORS[line[-1]][direction])
+    return tuple(line)
+
+
+_LINES_TO_EDGE: Dict[Space, Dict[Direction, Tuple[Space, ...]]] = {
+    space: {direction: _compute_line_to_edge(space, direction) for direction in Direction}
+    for space in Space if space is not Space.OFF
+}
+"""The line to the edge of the board from every `abalone.enums.Space` in every `abalone.enums.Direction`."""
+
+_LINES_FROM_TO: Dict[Tuple[Space, Space], Tuple[Tuple[Space, ...], Direction]] = {
+    (line[0], line[i]): (line[:i + 1], direction)
+    for lines in _LINES_TO_EDGE.values() for direction, line in lines.items() for i in range(1, len(line))
+}
+"""The line and its `abalone.enums.Direction` between every two different `abalone.enums.Space`s which are in a\
+straight line."""
+
+DISTANCES_TO_EDGE: Dict[Space, int] = {
+    space: min(len(line) for line in lines.values()) - 1 for space, lines in _LINES_TO_EDGE.items()
+}
+"""The number of moves from every `abalone.enums.Space` (except `abalone.enums.Space.OFF`) to the edge of the board,\
+which is 0 on the edge and 4 in the center."""
+
 
 def line_from_to(from_space: Space, to_space: Space) -> Union[Tuple[List[Space], Direction], Tuple[None, None]]:
     """Returns all `abalone.enums.Space`s in a straight line from a given starting space to a given ending space. The\
@@ -59,14 +164,10 @@ def line_from_to(from_space: Space, to_space: Space) -> Union[Tuple[List[Space],
     """
     if from_space is Space.OFF or to_space is Space.OFF:
         raise Exception('Spaces must not be `Space.OFF`')
-    for direction in Direction:
-        line = [from_space]
-        while line[-1] is not Space.OFF:
-            next_space = neighbor(line[-1], direction)
-            line.append(next_space)
-            if next_space is to_space:
-                return line, direction
-    return None, None
+    line, direction = _LINES_FROM_TO.get((from_space, to_space), (None, None))
+    if line is None:
+        return None, None
+    return list(line), direction
 
 
 def line_to_edge(from_space: Space, direction: Direction) -> List[Space]:
@@ -103,11 +204,7 @@ def line_to_edge(from_space: Space, direction: Direction) -> List[Space]:
     """
     if from_space is Space.OFF:
         raise Exception('`from_space` must not be `Space.OFF`')
-    line = [from_space]
-    while line[-1] is not Space.OFF:
-        line.append(neighbor(line[-1], direction))
-    line.pop()  # remove Space.OFF
-    return line
+    return list(_LINES_TO_EDGE[from_space][direction])
 
 
 def neighbor(space: Space, direction: Direction) -> Space:
@@ -140,31 +237,65 @@ def neighbor(space: Space, direction: Direction) -> Space:
         any given `direction`, `abalone.enums.Space.OFF` is returned.
     """
 
-    if space is Space.OFF:
-        return Space.OFF
+    return _NEIGHBORS[space][direction]
 
-    xs = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I']
-    ys = ['1', '2', '3', '4', '5', '6', '7', '8', '9']
 
-    xi = xs.index(space.value[0])
-    yi = ys.index(space.value[1])
+def pack_move(move: Tuple[Union[Space, Tuple[Space, Space]], Direction]) -> int:
+    """Packs a move into an integer of 16 bits, e.g. for storing it in a file.
 
-    if direction is Direction.NORTH_EAST:
-        xi += 1
-        yi += 1
-    elif direction is Direction.EAST:
-        yi += 1
-    elif direction is Direction.SOUTH_EAST:
-        xi -= 1
-    elif direction is Direction.SOUTH_WEST:
-        xi -= 1
-        yi -= 1
-    elif direction is Direction.WEST:
-        yi -= 1
-    elif direction is Direction.NORTH_WEST:
-        xi += 1
+    Unlike the index of `abalone.moves.encode_move`, the packed move keeps the order of the spaces of a broadside move,\
+    also encodes moves that can never be legal and does not depend on the order of `abalone.moves.MOVES`. Therefore, it\
+    is used where a move must be reproduced exactly, even if it is illegal, e.g. in game records (see\
+    `abalone.records`) and for the moves of the players in `abalone.run_game.run_game`. Use\
+    `abalone.moves.encode_move` for indexing arrays by legal moves, e.g. in a transposition table.
 
-    if xi < 0 or xi >= len(xs) or yi < 0 or yi >= len(ys) or xs[xi] + ys[yi] not in Space.__members__:
-        return Space.OFF
+    The bits 0 to 5 contain the index of the (first) `abalone.enums.Space` of the move, the bits 6 to 8 contain the\
+    index of the `abalone.enums.Direction` of movement and the bits 9 and 10 contain the type of the move (0 for an\
+    inline move, 1 for a broadside move of two marbles and 2 for a broadside move of three marbles). For broadside\
+    moves, the bits 11 to 13 contain the index of the direction from the first to the second space.
 
-    return Space[xs[xi] + ys[yi]]
+    Example:
+        ```python
+        pack_move(((Space.C3, Space.C5), Direction.NORTH_WEST))
+        # 3405
+        unpack_move(3405)
+        # ((Space.C3, Space.C5), Direction.NORTH_WEST)
+        ```
+
+    Args:
+        move: A tuple of 1. either one or a tuple of two `abalone.enums.Space`s and 2. a `abalone.enums.Direction`,\
+            according to the parameters of `abalone.game.Game.move`.
+
+    Returns:
+        An integer between 0 and 2 ** 14 - 1.
+
+    Raises:
+        Exception: Invalid move
+    """
+    marbles, direction = move
+    if isinstance(marbles, Space):
+        if marbles is Space.OFF:
+            raise Exception('Invalid move')
+        return SPACE_INDICES[marbles] | DIRECTION_INDICES[direction] << 6
+    line, line_direction = _LINES_FROM_TO.get(marbles, (None, None))
+    if line is None or len(line) > 3:
+        raise Exception('Invalid move')
+    return SPACE_INDICES[marbles[0]] | DIRECTION_INDICES[direction] << 6 | (len(line) - 1) << 9 \
+        | DIRECTION_INDICES[line_direction] << 11
+
+
+def unpack_move(packed_move: int) -> Tuple[Union[Space, Tuple[Space, Space]], Direction]:
+    """Unpacks a move packed by `abalone.utils.pack_move`.
+
+    Args:
+        packed_move: An integer returned by `abalone.utils.pack_move`.
+
+    Returns:
+        A tuple of 1. either one or a tuple of two `abalone.enums.Space`s and 2. a `abalone.enums.Direction`.
+    """
+    first_space = SPACES[packed_move & 0x3F]
+    direction = DIRECTIONS[packed_move >> 6 & 0x7]
+    length = (packed_move >> 9 & 0x3) + 1
+    if length == 1:
+        return first_space, direction
+    return (first_space, _LINES_TO_EDGE[first_space][DIRECTIONS[packed_move >> 11 & 0x7]][length - 1]), direction
@@ -0,0 +1 @@
+"""The benchmark module for abalone."""
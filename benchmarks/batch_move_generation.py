@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of the batched legal move masks of `abalone.batch.legal_move_masks` compared to
+`abalone.game.Game.generate_legal_moves`, measured in positions per second. It requires NumPy. Run it from the project
+root using:
+
+    $ python -m benchmarks.batch_move_generation
+"""
+
+from timeit import timeit
+
+from abalone.batch import legal_move_masks, stack_games
+from benchmarks.move_generation import random_positions
+
+
+def main(number: int = 5) -> None:
+    """Runs the benchmark and prints the results.
+
+    Args:
+        number: How often the moves of all positions are generated.
+    """
+    games = random_positions(plies=200) * 4
+    boards, turns = stack_games(games)
+
+    game_speed = len(games) * number / timeit(lambda: [list(game.generate_legal_moves()) for game in games],
+                                              number=number)
+    batch_speed = len(games) * number / timeit(lambda: legal_move_masks(boards, turns), number=number)
+    converted_speed = len(games) * number / timeit(lambda: legal_move_masks(*stack_games(games)), number=number)
+
+    print(f'positions:              {len(games):10d}')
+    print(f'Game:                   {game_speed:10.0f} positions/s')
+    print(f'batch:                  {batch_speed:10.0f} positions/s ({batch_speed / game_speed:.1f}x)')
+    print(f'batch incl. conversion: {converted_speed:10.0f} positions/s ({converted_speed / game_speed:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Microbenchmark of `abalone.game.Game.get_marble` and `abalone.game.Game.set_marble`.
+
+It compares the flat board of `abalone.game.Game` with the former nested lists, whose indices were computed on every
+call by means of `abalone.game._space_to_board_indices`. The raw access to the flat board is measured separately from
+`abalone.game.Game.set_marble`, which additionally updates the Zobrist hash, the marble counts and the undo log. Run it
+from the project root using:
+
+    $ python -m benchmarks.board_access
+"""
+
+from copy import deepcopy
+from timeit import timeit
+
+from abalone.enums import InitialPosition, Marble, Space
+from abalone.game import _MARBLES, Game, _space_to_board_indices
+from abalone.utils import SPACE_INDICES
+
+
+class _NestedListsGame(Game):
+    """A `abalone.game.Game` that stores the board as nested lists and computes the indices of a space on every\
+    access."""
+
+    def __init__(self):
+        super().__init__()
+        self.rows = deepcopy(InitialPosition.DEFAULT.value)
+
+    def set_marble(self, space: Space, marble: Marble) -> None:
+        x, y = _space_to_board_indices(space)
+        self.rows[x][y] = marble
+
+    def get_marble(self, space: Space) -> Marble:
+        x, y = _space_to_board_indices(space)
+        return self.rows[x][y]
+
+
+class _FlatCellsGame(Game):
+    """A `abalone.game.Game` that accesses the cells of the flat board without any bookkeeping."""
+
+    def set_marble(self, space: Space, marble: Marble) -> None:
+        self._cells[SPACE_INDICES[space]] = marble.value
+
+    def get_marble(self, space: Space) -> Marble:
+        return _MARBLES[self._cells[SPACE_INDICES[space]]]
+
+
+_SPACES = [space for space in Space if space is not Space.OFF]
+
+
+def _access_all_spaces(game: Game) -> None:
+    """Reads and writes back the state of every space on the board."""
+    for space in _SPACES:
+        game.set_marble(space, game.get_marble(space))
+
+
+def main(number: int = 2000) -> None:
+    """Runs the benchmark and prints the results.
+
+    Args:
+        number: How often all 61 spaces are read and written.
+    """
+    accesses = number * len(_SPACES)
+    nested_game = _NestedListsGame()
+    cells_game = _FlatCellsGame()
+    flat_game = Game()
+    nested = timeit(lambda: _access_all_spaces(nested_game), number=number)
+    cells = timeit(lambda: _access_all_spaces(cells_game), number=number)
+    flat = timeit(lambda: _access_all_spaces(flat_game), number=number)
+    print(f'nested lists:                  {nested / accesses * 1e9:8.1f} ns per get/set')
+    print(f'flat board (raw cells):        {cells / accesses * 1e9:8.1f} ns per get/set ({nested / cells:.2f}x)')
+    print(f'flat board (with bookkeeping): {flat / accesses * 1e9:8.1f} ns per get/set ({nested / flat:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of performing and taking back moves with `abalone.game.Game.push` and `abalone.game.Game.pop` compared to
+performing every move on a copy of the game. Run it from the project root using:
+
+    $ python -m benchmarks.make_unmake
+"""
+
+from copy import deepcopy
+from timeit import timeit
+
+from abalone.game import Game
+from benchmarks.move_generation import random_positions
+
+
+def _copy_and_move(game: Game, moves: list) -> None:
+    """Performs every move on a copy of the game."""
+    for move in moves:
+        copy = deepcopy(game)
+        copy.move(*move)
+        copy.switch_player()
+
+
+def _push_and_pop(game: Game, moves: list) -> None:
+    """Performs and takes back every move on the game itself."""
+    for move in moves:
+        game.push(*move)
+        game.pop()
+
+
+def main(number: int = 5) -> None:
+    """Runs the benchmark and prints the results.
+
+    Args:
+        number: How often the moves of all positions are performed.
+    """
+    positions = [(game, list(game.generate_legal_moves())) for game in random_positions()]
+    moves = sum(len(legal_moves) for _, legal_moves in positions) * number
+    copy = timeit(lambda: [_copy_and_move(game, legal_moves) for game, legal_moves in positions], number=number)
+    push_pop = timeit(lambda: [_push_and_pop(game, legal_moves) for game, legal_moves in positions], number=number)
+    print(f'copy and move: {moves / copy:8.0f} moves/s')
+    print(f'push and pop:  {moves / push_pop:8.0f} moves/s ({copy / push_pop:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of the legal move generators `abalone.game.Game.generate_legal_moves` and
+`abalone.bitboard.Bitboard.generate_legal_moves`, measured in generated moves per second. Run it from the project root
+using:
+
+    $ python -m benchmarks.move_generation
+"""
+
+from random import Random
+from timeit import timeit
+from typing import Callable, List
+
+from abalone.bitboard import Bitboard
+from abalone.enums import InitialPosition
+from abalone.game import Game
+
+
+def random_positions(plies: int = 30, seed: int = 0) -> List[Game]:
+    """Plays random moves from every `abalone.enums.InitialPosition` and collects the positions that occur.
+
+    Args:
+        plies: The number of moves played from every initial position.
+        seed: The seed of the random number generator.
+
+    Returns:
+        A list of `abalone.game.Game`s.
+    """
+    rng = Random(seed)
+    positions = []
+    for initial_position in InitialPosition:
+        game = Game(initial_position)
+        for _ in range(plies):
+            positions.append(Game.from_bytes(game.to_bytes()))
+            game.move(*rng.choice(list(game.generate_legal_moves())))
+            game.switch_player()
+    return positions
+
+
+def _moves_per_second(generate: Callable[[], int], number: int) -> float:
+    """Measures how many moves a generator function produces per second.
+
+    Args:
+        generate: A function that generates moves for a set of positions and returns the number of moves.
+        number: How often `generate` is called.
+
+    Returns:
+        The number of moves per second.
+    """
+    moves = generate()
+    return moves * number / timeit(generate, number=number)
+
+
+def main(number: int = 5) -> None:
+    """Runs the benchmark and prints the results.
+
+    Args:
+        number: How often the moves of all positions are generated.
+    """
+    games = random_positions()
+    bitboards = [Bitboard.from_game(game) for game in games]
+
+    game_speed = _moves_per_second(lambda: sum(len(list(game.generate_legal_moves())) for game in games), number)
+    bitboard_speed = _moves_per_second(
+        lambda: sum(len(list(bitboard.generate_legal_moves())) for bitboard in bitboards), number)
+    converted_speed = _moves_per_second(
+        lambda: sum(len(list(Bitboard.from_game(game).generate_legal_moves())) for game in games), number)
+
+    print(f'positions:                 {len(games):10d}')
+    print(f'Game:                      {game_speed:10.0f} moves/s')
+    print(f'Bitboard:                  {bitboard_speed:10.0f} moves/s ({bitboard_speed / game_speed:.1f}x)')
+    print(f'Bitboard incl. conversion: {converted_speed:10.0f} moves/s ({converted_speed / game_speed:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of the parallel search players of `abalone.parallel` with an increasing number of worker processes,
+measured in searched positions (lazy SMP) and random playouts (root-parallel MCTS) per second. The speedup is relative
+to a single worker. The MCTS part requires NumPy. Run it from the project root using:
+
+    $ python -m benchmarks.parallel_search
+"""
+
+import os
+from typing import List
+
+from abalone.game import Game
+from abalone.parallel import LazySMPPlayer, RootParallelMCTSPlayer
+from benchmarks.move_generation import random_positions
+
+
+def _worker_counts() -> List[int]:
+    """Returns the numbers of workers to be benchmarked: powers of two up to the number of processors."""
+    counts = [1]
+    while counts[-1] * 2 <= (os.cpu_count() or 1):
+        counts.append(counts[-1] * 2)
+    return counts
+
+
+def main(time_limit: float = 2.0, positions: int = 3) -> None:
+    """Runs the benchmark and prints the results.
+
+    Args:
+        time_limit: The time per move in seconds.
+        positions: The number of positions that are searched with every number of workers.
+    """
+    games: List[Game] = random_positions(plies=positions)[:positions]
+
+    print('lazy SMP')
+    baseline = 0.0
+    for workers in _worker_counts():
+        player = LazySMPPlayer(workers, time_limit=time_limit)
+        nodes_per_second, depth = 0.0, 0
+        for game in games:
+            player.turn(game, [])
+            nodes_per_second += player.nodes_per_second / len(games)
+            depth += player.depth
+        player.close()
+        baseline = baseline or nodes_per_second
+        print(f'{workers:3d} workers: {nodes_per_second:10.0f} nodes/s ({nodes_per_second / baseline:4.1f}x), '
+              f'average depth {depth / len(games):.1f}')
+
+    print('root-parallel MCTS')
+    baseline = 0.0
+    for workers in _worker_counts():
+        player = RootParallelMCTSPlayer(workers, seed=0, time_limit=time_limit)
+        playouts_per_second = 0.0
+        for game in games:
+            player.turn(game, [])
+            playouts_per_second += player.playouts_per_second / len(games)
+        player.close()
+        baseline = baseline or playouts_per_second
+        print(f'{workers:3d} workers: {playouts_per_second:10.0f} playouts/s '
+              f'({playouts_per_second / baseline:4.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
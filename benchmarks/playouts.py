@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of the random playouts of `abalone.playouts.random_playouts` compared to playing random moves with
+`abalone.game.Game`, measured in moves per second. It requires NumPy. Run it from the project root using:
+
+    $ python -m benchmarks.playouts
+"""
+
+from random import Random
+from timeit import timeit
+
+from abalone.game import Game
+from abalone.playouts import random_playouts
+
+
+def _play_random(games: int, max_plies: int) -> None:
+    """Plays random games with `abalone.game.Game` like `abalone.random_player.RandomPlayer`.
+
+    Args:
+        games: The number of games.
+        max_plies: The number of moves per game.
+    """
+    rng = Random(0)
+    for _ in range(games):
+        game = Game()
+        for _ in range(max_plies):
+            game.move(*rng.choice(list(game.generate_legal_moves())))
+            game.switch_player()
+
+
+def main(playouts: int = 1000, max_plies: int = 100) -> None:
+    """Runs the benchmark and prints the results.
+
+    Args:
+        playouts: The number of games played at once.
+        max_plies: The number of moves per game.
+    """
+    game_speed = 10 * max_plies / timeit(lambda: _play_random(10, max_plies), number=1)
+    playouts_speed = playouts * max_plies / timeit(lambda: random_playouts(Game(), playouts, max_plies, 0), number=1)
+
+    print(f'Game:     {game_speed:10.0f} moves/s')
+    print(f'playouts: {playouts_speed:10.0f} moves/s ({playouts_speed / game_speed:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -40,6 +40,7 @@ setuptools.setup(
     url='https://github.com/Scriptim/Abalone-BoAI',
     packages=['abalone'],
     install_requires=['colorama', 'inquirer'],
+    extras_require={'numpy': ['numpy']},
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Environment :: Console',
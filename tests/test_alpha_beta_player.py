@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for `abalone.alpha_beta_player`"""
+
+import unittest
+
+from abalone.alpha_beta_player import _WIN_SCORE, AlphaBetaPlayer, _key, _score_from_table, _score_to_table
+from abalone.bitboard import Bitboard
+from abalone.enums import Direction, Marble, Player, Space
+from abalone.game import Game
+
+
+class TestAlphaBetaPlayer(unittest.TestCase):
+    """Test case for `abalone.alpha_beta_player.AlphaBetaPlayer`."""
+
+    def test_turn(self):
+        """Test `abalone.alpha_beta_player.AlphaBetaPlayer.turn`"""
+        game = Game()
+        player = AlphaBetaPlayer(time_limit=0.2)
+        self.assertIn(player.turn(game, []), list(game.generate_legal_moves()))
+        self.assertGreater(player.nodes, 0)
+        self.assertGreater(player.nodes_per_second, 0)
+
+        game.switch_player()
+        self.assertIn(player.turn(game, []), list(game.generate_legal_moves()))
+
+    def test_capture(self):
+        """Test that `abalone.alpha_beta_player.AlphaBetaPlayer.turn` pushes a marble off the board"""
+        game = Game()
+        game.set_marble(Space.A3, Marble.WHITE)
+        player = AlphaBetaPlayer(time_limit=60, max_depth=2)
+        self.assertTupleEqual(player.turn(game, []), (Space.C3, Direction.SOUTH_EAST))
+        self.assertEqual(player.depth, 2)
+
+        game = Game(first_turn=Player.WHITE)
+        game.set_marble(Space.I7, Marble.BLACK)
+        game.move(*player.turn(game, []))
+        self.assertEqual(game.captured(Player.WHITE), 1)
+
+    def test_solver(self):
+        """Test that `abalone.alpha_beta_player.AlphaBetaPlayer.turn` plays a forced push-off without searching"""
+        game = Game()
+        for space in [Space.H4, Space.I5, Space.I6, Space.I7, Space.I8, Space.I9]:
+            game.set_marble(space, Marble.BLANK)
+        game.set_marble(Space.A3, Marble.WHITE)
+        player = AlphaBetaPlayer(time_limit=60)
+        player.nodes_per_second = 1.0
+        self.assertTupleEqual(player.turn(game, []), (Space.C3, Direction.SOUTH_EAST))
+        self.assertEqual(player.nodes, 0)
+        self.assertEqual(player.nodes_per_second, 0)
+        self.assertTupleEqual(AlphaBetaPlayer(time_limit=0.2, solver_plies=0).turn(game, []),
+                              (Space.C3, Direction.SOUTH_EAST))
+
+    def test_key(self):
+        """Test that the keys of the transposition table distinguish positions that differ in a single marble"""
+        game = Game()
+        game.set_marble(Space.A2, Marble.BLANK)
+        game.set_marble(Space.G3, Marble.BLACK)
+        self.assertNotEqual(_key(Bitboard.from_game(game)), _key(Bitboard.from_game(Game())))
+
+    def test_table_scores(self):
+        """Test that the scores of wins and losses are stored relative to the position, not to the root"""
+        for score in [_WIN_SCORE - 3, -_WIN_SCORE + 3, 1234, -1234]:
+            self.assertEqual(_score_from_table(_score_to_table(score, 3), 3), score)
+        self.assertEqual(_score_to_table(-_WIN_SCORE + 5, 5), -_WIN_SCORE)
+        self.assertEqual(_score_from_table(-_WIN_SCORE, 2), -_WIN_SCORE + 2)
+        self.assertEqual(_score_to_table(1234, 5), 1234)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for `abalone.batch`"""
+
+import unittest
+from random import Random
+
+from abalone.enums import InitialPosition, Marble, Player
+from abalone.game import Game
+from abalone.moves import MOVES, encode_move
+from abalone.utils import SPACES
+
+try:
+    import numpy as np
+    from abalone.batch import apply_moves, legal_move_masks, stack_games
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestBatch(unittest.TestCase):
+    """Test case for `abalone.batch`."""
+
+    def test_legal_move_masks(self):
+        """Test `abalone.batch.legal_move_masks` and `abalone.batch.stack_games` against\
+        `abalone.game.Game.generate_legal_moves`"""
+        rng = Random(0)
+        games = []
+        for initial_position in InitialPosition:
+            game = Game(initial_position)
+            for _ in range(40):
+                games.append(Game.from_bytes(game.to_bytes()))
+                game.move(*rng.choice(list(game.generate_legal_moves())))
+                game.switch_player()
+            # random arrangements of marbles with many pushes
+            for _ in range(20):
+                game = Game(initial_position, rng.choice(list(Player)))
+                marbles = [rng.choice(list(Marble)) for _ in SPACES]
+                for space, marble in zip(SPACES, marbles):
+                    game.set_marble(space, marble)
+                games.append(game)
+
+        boards, turns = stack_games(games)
+        self.assertTupleEqual(boards.shape, (len(games), 61))
+        self.assertTupleEqual(turns.shape, (len(games),))
+        masks = legal_move_masks(boards, turns)
+        self.assertTupleEqual(masks.shape, (len(games), len(MOVES)))
+        self.assertEqual(masks.dtype, np.bool_)
+        for game, mask in zip(games, masks):
+            self.assertCountEqual([MOVES[index] for index in np.flatnonzero(mask)], game.generate_legal_moves())
+
+        self.assertTupleEqual(legal_move_masks(np.zeros((0, 61), dtype=np.int8), np.zeros(0)).shape, (0, len(MOVES)))
+
+    def test_apply_moves(self):
+        """Test `abalone.batch.apply_moves` against `abalone.game.Game.move`"""
+        rng = Random(0)
+        games, moves, expected = [], [], []
+        for initial_position in InitialPosition:
+            game = Game(initial_position)
+            for _ in range(60):
+                move = rng.choice(list(game.generate_legal_moves()))
+                games.append(Game.from_bytes(game.to_bytes()))
+                moves.append(encode_move(move))
+                game.move(*move)
+                expected.append(game.to_bytes()[:-1])
+                game.switch_player()
+
+        boards, turns = stack_games(games)
+        result = apply_moves(boards, turns, np.array(moves))
+        self.assertListEqual([board.tobytes() for board in result], expected)
+        # the input is not modified
+        self.assertListEqual([board.tobytes() for board in boards], [game.to_bytes()[:-1] for game in games])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for `abalone.bitboard`"""
+
+import unittest
+from copy import deepcopy
+from random import Random
+
+from abalone.bitboard import Bitboard, popcount
+from abalone.enums import Direction, InitialPosition, Marble, Player, Space
+from abalone.game import Game, IllegalMoveException
+
+
+class TestBitboard(unittest.TestCase):
+    """Test case for `abalone.bitboard.Bitboard`."""
+
+    def test_conversion(self):
+        """Test `abalone.bitboard.Bitboard.from_game` and `abalone.bitboard.Bitboard.to_game`"""
+        for initial_position in InitialPosition:
+            game = Game(initial_position, Player.WHITE)
+            bitboard = Bitboard.from_game(game)
+            self.assertIs(bitboard.turn, Player.WHITE)
+            self.assertTupleEqual(bitboard.get_score(), game.get_score())
+            self.assertEqual(popcount(bitboard.black), game.get_score()[0])
+            self.assertEqual(bitboard.to_game().to_bytes(), game.to_bytes())
+        self.assertEqual(Bitboard.from_game(Game()), Bitboard.from_game(Game()))
+        self.assertNotEqual(Bitboard.from_game(Game()), Bitboard.from_game(Game(first_turn=Player.WHITE)))
+
+    def test_zobrist(self):
+        """Test `abalone.bitboard.Bitboard.zobrist`"""
+        for initial_position in InitialPosition:
+            for turn in Player:
+                game = Game(initial_position, turn)
+                bitboard = Bitboard.from_game(game)
+                self.assertEqual(Bitboard(bitboard.black, bitboard.white, turn).zobrist, game.zobrist)
+                self.assertEqual(hash(bitboard), hash(game))
+        game = Game()
+        game.set_marble(Space.A2, Marble.BLANK)
+        game.set_marble(Space.G3, Marble.BLACK)
+        self.assertNotEqual(Bitboard.from_game(game).zobrist, Bitboard.from_game(Game()).zobrist)
+
+    def test_generate_legal_moves(self):
+        """Test `abalone.bitboard.Bitboard.generate_legal_moves`,\
+        `abalone.bitboard.Bitboard.generate_own_marble_lines` and `abalone.bitboard.Bitboard.move` against\
+        `abalone.game.Game`"""
+        rng = Random(0)
+        for initial_position in InitialPosition:
+            game = Game(initial_position)
+            for _ in range(40):
+                bitboard = Bitboard.from_game(game)
+                legal_moves = list(game.generate_legal_moves())
+                self.assertCountEqual(bitboard.generate_legal_moves(), legal_moves)
+                self.assertCountEqual(bitboard.generate_own_marble_lines(), game.generate_own_marble_lines())
+                for move in legal_moves:
+                    copy = deepcopy(game)
+                    copy.move(*move)
+                    copy.switch_player()
+                    self.assertEqual(bitboard.move(*move), Bitboard.from_game(copy))
+                    self.assertEqual(bitboard.move(*move).zobrist, copy.zobrist)
+                game.move(*rng.choice(legal_moves))
+                game.switch_player()
+
+    def test_sumito(self):
+        """Test `abalone.bitboard.Bitboard.generate_legal_moves` and `abalone.bitboard.Bitboard.move` with sumitos"""
+        game = Game()
+        game.set_marble(Space.D4, Marble.WHITE)
+        game.set_marble(Space.E5, Marble.WHITE)
+        bitboard = Bitboard.from_game(game)
+        legal_moves = list(bitboard.generate_legal_moves())
+        self.assertIn((Space.A1, Direction.NORTH_EAST), legal_moves)
+        self.assertNotIn((Space.B2, Direction.NORTH_EAST), legal_moves)
+
+        game = Game()
+        game.set_marble(Space.A3, Marble.WHITE)
+        bitboard = Bitboard.from_game(game)
+        self.assertIn((Space.C3, Direction.SOUTH_EAST), list(bitboard.generate_legal_moves()))
+        bitboard = bitboard.move(Space.C3, Direction.SOUTH_EAST)
+        self.assertTupleEqual(bitboard.get_score(), (13, 14))
+        self.assertIs(bitboard.to_game().get_marble(Space.A3), Marble.BLACK)
+        self.assertIs(bitboard.to_game().get_marble(Space.C3), Marble.BLANK)
+
+    def test_move(self):
+        """Test `abalone.bitboard.Bitboard.move`"""
+        bitboard = Bitboard.from_game(Game())
+        self.assertRaises(IllegalMoveException, lambda: bitboard.move(Space.I5, Direction.WEST))
+        self.assertRaises(IllegalMoveException, lambda: bitboard.move((Space.A1, Space.E5), Direction.NORTH_WEST))
+        moved = bitboard.move((Space.C3, Space.C5), Direction.NORTH_WEST)
+        self.assertIs(moved.turn, Player.WHITE)
+        game = moved.to_game()
+        self.assertIs(game.get_marble(Space.D3), Marble.BLACK)
+        self.assertIs(game.get_marble(Space.C3), Marble.BLANK)
+        self.assertEqual(bitboard, Bitboard.from_game(Game()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for `abalone.book`"""
+
+import os
+import tempfile
+import unittest
+from typing import List, Tuple, Union
+
+from abalone.abstract_player import AbstractPlayer
+from abalone.book import MAGIC, BookBuilder, BookMove, BookPlayer, OpeningBook, build_book
+from abalone.enums import Direction, InitialPosition, Player, Space
+from abalone.game import Game
+from abalone.moves import encode_move
+from abalone.records import GameRecord, GameRecordWriter
+
+_OPENING = [(Space.A1, Direction.NORTH_EAST), (Space.I5, Direction.SOUTH_WEST)]
+_MIRRORED_OPENING = [(Space.A5, Direction.NORTH_WEST), (Space.I9, Direction.SOUTH_EAST)]
+
+
+class _FixedPlayer(AbstractPlayer):
+    """A player that always returns the same move."""
+
+    def __init__(self, move: Tuple[Union[Space, Tuple[Space, Space]], Direction]):
+        self.move = move
+
+    def turn(self, game: Game, moves_history: List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]) \
+            -> Tuple[Union[Space, Tuple[Space, Space]], Direction]:
+        return self.move
+
+
+class TestBook(unittest.TestCase):
+    """Test case for `abalone.book`."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.records = os.path.join(directory.name, 'games.abgr')
+        self.path = os.path.join(directory.name, 'book.abob')
+        with GameRecordWriter(self.records) as writer:
+            writer.write(GameRecord(InitialPosition.DEFAULT, Player.BLACK, 'a', 'b', Player.BLACK, _OPENING))
+            writer.write(GameRecord(InitialPosition.DEFAULT, Player.BLACK, 'a', 'b', None, _MIRRORED_OPENING))
+            writer.write(GameRecord(InitialPosition.DEFAULT, Player.BLACK, 'a', 'b', Player.WHITE,
+                                    [((Space.C3, Space.C5), Direction.NORTH_WEST)]))
+
+    def test_build_lookup(self):
+        """Test `abalone.book.build_book` and `abalone.book.OpeningBook.lookup`"""
+        self.assertEqual(build_book([self.records], self.path, workers=1), 3)
+        with OpeningBook(self.path) as book:
+            self.assertEqual(len(book), 3)
+            moves = book.lookup(Game())
+            self.assertEqual(len(moves), 2)
+            # the mirrored openings are the same move in the symmetric initial position
+            self.assertIn(moves[0].move, [_OPENING[0], _MIRRORED_OPENING[0]])
+            self.assertEqual(moves[0][1:], (2, 3))
+            self.assertEqual(moves[0].score, 0.75)
+            self.assertEqual(encode_move(moves[1].move), encode_move(((Space.C3, Space.C5), Direction.NORTH_WEST)))
+            self.assertEqual(moves[1][1:], (1, 0))
+
+            game = Game()
+            game.push(*_MIRRORED_OPENING[0])
+            self.assertListEqual(book.lookup(game), [BookMove(_MIRRORED_OPENING[1], 2, 1)])
+            game.push(*_MIRRORED_OPENING[1])
+            self.assertListEqual(book.lookup(game), [])
+
+            # the same position with swapped colors, rotated by 180 degrees
+            game = Game(first_turn=Player.WHITE)
+            self.assertEqual(len(book.lookup(game)), 2)
+            game.push(Space.I9, Direction.SOUTH_WEST)
+            self.assertEqual(book.lookup(game)[0].move[1], Direction.NORTH_EAST)
+
+        self.assertEqual(build_book([self.records], self.path, min_games=2, workers=1), 2)
+        self.assertEqual(build_book([self.records] * 2, self.path, max_plies=1, workers=2), 2)
+        with OpeningBook(self.path) as book:
+            self.assertEqual([book_move.games for book_move in book.lookup(Game())], [4, 2])
+
+    def test_builder(self):
+        """Test `abalone.book.BookBuilder`"""
+        builder = BookBuilder(max_plies=1)
+        builder.add_records(self.records)
+        other = BookBuilder()
+        other.add_records(self.records)
+        builder.update(other)
+        self.assertEqual(len(builder), 3)
+        self.assertEqual(builder.write(self.path, min_games=3), 1)
+        self.assertEqual(os.path.getsize(self.path), len(MAGIC) + 4 + 18)
+
+        builder.write(self.path, min_games=10)
+        with OpeningBook(self.path) as book:
+            self.assertEqual(len(book), 0)
+            self.assertListEqual(book.lookup(Game()), [])
+        with open(self.path, 'wb') as file:
+            file.write(b'not a book file')
+        with self.assertRaises(Exception):
+            OpeningBook(self.path)
+
+    def test_book_player(self):
+        """Test `abalone.book.BookPlayer`"""
+        build_book([self.records], self.path, workers=1)
+        fallback = (Space.A1, Direction.EAST)
+        player = BookPlayer(_FixedPlayer(fallback), self.path)
+        game = Game()
+        self.assertIn(player.turn(game, []), [_OPENING[0], _MIRRORED_OPENING[0]])
+        self.assertTrue(player.in_book)
+        game.push(Space.B1, Direction.NORTH_EAST)
+        self.assertEqual(player.turn(game, []), fallback)
+        self.assertFalse(player.in_book)
+        player.close()
+        # the memory map of the book is closed
+        self.assertRaises(ValueError, lambda: player.turn(Game(), []))
+
+        player = BookPlayer(_FixedPlayer(fallback), self.path, min_games=2, weighted=True)
+        self.assertIn(player.turn(Game(), []), [_OPENING[0], _MIRRORED_OPENING[0]])
+        player.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
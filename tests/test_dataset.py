@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for `abalone.dataset`"""
+
+import os
+import tempfile
+import unittest
+
+from abalone.enums import InitialPosition, Player
+from abalone.random_player import RandomPlayer
+from abalone.records import GameRecord, GameRecordWriter, RecordObserver
+from abalone.run_game import run_game
+
+try:
+    import numpy as np
+    from abalone.dataset import POSITION_DTYPE, count_positions, export_positions, export_shards, load_positions
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestDataset(unittest.TestCase):
+    """Test case for `abalone.dataset`."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.record_path = os.path.join(self.directory, 'games.abgr')
+        self.positions = []
+        with GameRecordWriter(self.record_path) as writer:
+            for max_moves in (10, 5, 7):
+                observer = RecordObserver(writer, 'random', 'random')
+                states = run_game(RandomPlayer(), RandomPlayer(), [observer], max_moves,
+                                  initial_position=InitialPosition.GERMAN_DAISY)
+                self.positions.append([game.to_bytes() for game, _ in states])
+            writer.write(GameRecord(InitialPosition.DEFAULT, Player.WHITE, 'a', 'b', Player.BLACK, []))
+
+    def test_export_positions(self):
+        """Test `abalone.dataset.export_positions` and `abalone.dataset.load_positions`"""
+        path = os.path.join(self.directory, 'positions.npy')
+        self.assertEqual(count_positions(self.record_path), 11 + 6 + 8 + 1)
+        self.assertEqual(export_positions(self.record_path, path), 26)
+        positions = load_positions(path)
+        self.assertIsInstance(positions, np.memmap)
+        self.assertEqual(positions.dtype, POSITION_DTYPE)
+        self.assertListEqual([position[:62].tobytes() for position in positions.view(np.int8).reshape(-1, 65)[:25]],
+                             sum(self.positions[:3], []))
+        self.assertListEqual(positions['score'][0].tolist(), [14, 14])
+        self.assertTrue((positions['outcome'][:25] == 0).all())
+        self.assertEqual(positions['outcome'][25], Player.BLACK.value)
+        self.assertEqual(positions['turn'][25], Player.WHITE.value)
+
+        self.assertEqual(export_positions(self.record_path, path, 1, 3), 6 + 8)
+        self.assertListEqual([position[:62].tobytes() for position in load_positions(path).view(np.int8)
+                             .reshape(-1, 65)], sum(self.positions[1:3], []))
+
+    def test_export_shards(self):
+        """Test `abalone.dataset.export_shards`"""
+        paths = export_shards([self.record_path], os.path.join(self.directory, 'shards'), 3, workers=2)
+        self.assertListEqual(list(map(os.path.basename, paths)), ['games-00000.npy', 'games-00001.npy'])
+        shards = list(map(load_positions, paths))
+        self.assertListEqual(list(map(len, shards)), [25, 1])
+        whole = os.path.join(self.directory, 'positions.npy')
+        export_positions(self.record_path, whole)
+        self.assertTrue((np.concatenate(shards) == load_positions(whole)).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
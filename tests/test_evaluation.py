@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for `abalone.evaluation`"""
+
+import unittest
+from copy import deepcopy
+from random import Random
+
+from abalone.enums import Direction, InitialPosition, Marble, Player, Space
+from abalone.evaluation import EvaluatedGame, Features, Weights, compute_features
+from abalone.game import Game
+
+
+class TestEvaluation(unittest.TestCase):
+    """Test case for `abalone.evaluation`."""
+
+    def assertFeatures(self, game: EvaluatedGame):
+        """Asserts that the incremental features of both players are equal to those computed from scratch."""
+        for player in Player:
+            self.assertEqual(game.features(player), compute_features(game, player))
+
+    def test_initial_features(self):
+        """Test `abalone.evaluation.EvaluatedGame.features` of the initial positions"""
+        game = EvaluatedGame()
+        self.assertEqual(game.features(Player.BLACK), Features(material=14, centrality=10, adjacency=27, edge=7))
+        self.assertEqual(game.features(Player.WHITE), game.features(Player.BLACK))
+        self.assertEqual(game.evaluate(), 0)
+        for initial_position in InitialPosition:
+            self.assertFeatures(EvaluatedGame(initial_position))
+
+    def test_push_pop(self):
+        """Test that the features are kept up to date by `abalone.game.Game.push` and `abalone.game.Game.pop`"""
+        rng = Random(0)
+        for initial_position in InitialPosition:
+            game = EvaluatedGame(initial_position)
+            features = []
+            for _ in range(60):
+                features.append((game.features(Player.BLACK), game.features(Player.WHITE)))
+                game.push(*rng.choice(list(game.generate_legal_moves())))
+                self.assertFeatures(game)
+            while features:
+                game.pop()
+                self.assertEqual((game.features(Player.BLACK), game.features(Player.WHITE)), features.pop())
+
+    def test_set_marble(self):
+        """Test that the features are kept up to date by `abalone.game.Game.set_marble`"""
+        game = EvaluatedGame()
+        game.set_marble(Space.E5, Marble.BLACK)
+        game.set_marble(Space.A1, Marble.WHITE)
+        game.set_marble(Space.I9, Marble.BLANK)
+        self.assertFeatures(game)
+        copy = deepcopy(game)
+        copy.set_marble(Space.E5, Marble.BLANK)
+        self.assertFeatures(copy)
+        self.assertFeatures(game)
+
+    def test_evaluate(self):
+        """Test `abalone.evaluation.EvaluatedGame.evaluate`"""
+        game = EvaluatedGame(weights=Weights(material=1, centrality=0, adjacency=0, edge=0))
+        game.move(Space.A1, Direction.NORTH_EAST)
+        self.assertEqual(game.evaluate(), 0)
+        game.set_marble(Space.I5, Marble.BLANK)
+        self.assertEqual(game.evaluate(), 1)
+        game.switch_player()
+        self.assertEqual(game.evaluate(), -1)
+
+        game = EvaluatedGame()
+        game.push(Space.A1, Direction.NORTH_EAST)
+        # the move brought a marble to the center, which is good for black (not in turn)
+        self.assertLess(game.evaluate(), 0)
+
+    def test_from_game(self):
+        """Test `abalone.evaluation.EvaluatedGame.from_game`"""
+        game = Game()
+        for space in [Space.E5, Space.F5, Space.G5]:
+            game.set_marble(space, Marble.BLACK)
+        game.move(Space.E5, Direction.NORTH_WEST)
+        self.assertEqual(game.captured(Player.BLACK), 1)
+        evaluated = EvaluatedGame.from_game(game)
+        self.assertIsInstance(evaluated, EvaluatedGame)
+        self.assertEqual(evaluated.to_bytes(), game.to_bytes())
+        self.assertEqual(evaluated.captured(Player.BLACK), 1)
+        self.assertFeatures(evaluated)
+
+
+if __name__ == '__main__':
+    unittest.main()
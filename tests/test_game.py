@@ -19,10 +19,54 @@
 """Unit tests for `abalone.game`"""
 
 import unittest
-from typing import List, Tuple
+from copy import deepcopy
+from random import Random
+from typing import List, Tuple, Union
 
-from abalone.enums import Direction, Marble, Player, Space
+from abalone.enums import Direction, InitialPosition, Marble, Player, Space
 from abalone.game import Game, IllegalMoveException
+from abalone.moves import MOVES
+
+
+def _reference_legal_moves(game: Game) -> List[Tuple[Union[Space, Tuple[Space, Space]], Direction]]:
+    """Generates the legal moves by trying every candidate move on a copy of the game."""
+    legal_moves = []
+    for marbles in game.generate_own_marble_lines():
+        for direction in Direction:
+            copy = deepcopy(game)
+            try:
+                copy.move(marbles, direction)
+            except IllegalMoveException:
+                continue
+            legal_moves.append((marbles, direction))
+    return legal_moves
+
+
+def _random_positions(initial_position: InitialPosition, seed: int) -> List[Game]:
+    """Generates random positions starting from `initial_position`, both by random play and by randomly rearranging\
+    the marbles on the board."""
+    rng = Random(seed)
+    positions = []
+
+    game = Game(initial_position)
+    for _ in range(20):
+        legal_moves = list(game.generate_legal_moves())
+        if not legal_moves:
+            break
+        game.move(*rng.choice(legal_moves))
+        game.switch_player()
+        positions.append(deepcopy(game))
+
+    spaces = [space for space in Space if space is not Space.OFF]
+    for _ in range(10):
+        game = Game(initial_position, rng.choice(list(Player)))
+        marbles = [game.get_marble(space) for space in spaces]
+        rng.shuffle(marbles)
+        for space, marble in zip(spaces, marbles):
+            game.set_marble(space, marble if rng.random() > 0.1 else Marble.BLANK)
+        positions.append(game)
+
+    return positions
 
 
 class TestGame(unittest.TestCase):
@@ -55,12 +99,78 @@ class TestGame(unittest.TestCase):
         self.assertIs(game.get_marble(Space.A1), Marble.BLANK)
         self.assertRaises(Exception, lambda: game.set_marble(Space.OFF, Marble.BLANK))
 
+    def test_board(self):
+        """Test `abalone.game.Game.board`"""
+        game = Game()
+        self.assertEqual(game.board, InitialPosition.DEFAULT.value)
+        self.assertEqual(len(game.board), 9)
+        self.assertEqual(list(map(len, game.board)), [5, 6, 7, 8, 9, 8, 7, 6, 5])
+        self.assertIs(game.board[8][0], Marble.BLACK)
+        self.assertIs(game.board[4][0], Marble.BLANK)
+        self.assertIs(game.board[-1][-1], Marble.BLACK)
+        self.assertListEqual(game.board[2][1:4], [Marble.BLANK, Marble.WHITE, Marble.WHITE])
+
+        game.board[4][0] = Marble.WHITE
+        self.assertIs(game.get_marble(Space.E1), Marble.WHITE)
+        game.set_marble(Space.I9, Marble.BLANK)
+        self.assertIs(game.board[0][4], Marble.BLANK)
+
+        board = deepcopy(game.board)
+        self.assertIsInstance(board, list)
+        game.set_marble(Space.E1, Marble.BLANK)
+        self.assertIs(board[4][0], Marble.WHITE)
+
+        game.board = InitialPosition.GERMAN_DAISY.value
+        self.assertEqual(game.board, Game(InitialPosition.GERMAN_DAISY).board)
+        self.assertIs(game.get_marble(Space.A1), Marble.BLANK)
+
+    def test_to_bytes(self):
+        """Test `abalone.game.Game.to_bytes` and `abalone.game.Game.from_bytes`"""
+        game = Game(InitialPosition.BELGIAN_DAISY, Player.WHITE)
+        position = game.to_bytes()
+        self.assertEqual(len(position), 62)
+        self.assertNotEqual(position, Game(InitialPosition.BELGIAN_DAISY).to_bytes())
+
+        restored = Game.from_bytes(position)
+        self.assertIs(restored.turn, Player.WHITE)
+        self.assertEqual(restored.board, game.board)
+        restored.set_marble(Space.A1, Marble.BLANK)
+        self.assertIs(game.get_marble(Space.A1), Marble.BLACK)
+        self.assertRaises(Exception, lambda: Game.from_bytes(position[1:]))
+
     def test_get_score(self):
         """Test `abalone.game.Game.get_score`"""
         game = Game()
         self.assertTupleEqual(game.get_score(), (14, 14))
         game.set_marble(Space.A1, Marble.BLANK)
         self.assertTupleEqual(game.get_score(), (13, 14))
+        game.set_marble(Space.E1, Marble.WHITE)
+        game.board[4][1] = Marble.WHITE
+        self.assertTupleEqual(game.get_score(), (13, 16))
+        game.board = InitialPosition.GERMAN_DAISY.value
+        self.assertTupleEqual(game.get_score(), (14, 14))
+
+        for seed, initial_position in enumerate(InitialPosition):
+            for game in _random_positions(initial_position, seed):
+                score = game.get_score()
+                self.assertTupleEqual(score, (game.to_bytes()[:-1].count(1), game.to_bytes()[:-1].count(255)))
+                for move in list(game.generate_legal_moves()):
+                    game.push(*move)
+                    game.pop()
+                self.assertTupleEqual(game.get_score(), score)
+
+    def test_captured(self):
+        """Test `abalone.game.Game.captured`"""
+        game = Game()
+        game.set_marble(Space.A3, Marble.WHITE)
+        game.push(Space.C3, Direction.SOUTH_EAST)
+        self.assertEqual(game.captured(Player.BLACK), 1)
+        self.assertEqual(game.captured(Player.WHITE), 0)
+        game.pop()
+        self.assertEqual(game.captured(Player.BLACK), 0)
+        game.move(Space.C3, Direction.SOUTH_EAST)
+        self.assertEqual(game.captured(Player.BLACK), 1)
+        self.assertTupleEqual(game.get_score(), (13, 14))
 
     def test_move(self):
         """Test `abalone.game.Game.move` including `abalone.game.Game.move_inline` and\
@@ -161,6 +271,133 @@ class TestGame(unittest.TestCase):
         self.assertNotIn((Space.I5, Direction.NORTH_EAST), legal_moves)
         self.assertNotIn(((Space.C3, Space.C5), Direction.NORTH_WEST), legal_moves)
 
+    def test_generate_legal_moves_equivalence(self):
+        """Test `abalone.game.Game.generate_legal_moves` against trying every candidate move on a copy"""
+        for seed, initial_position in enumerate(InitialPosition):
+            for game in _random_positions(initial_position, seed):
+                position = game.to_bytes()
+                self.assertListEqual(list(game.generate_legal_moves()), _reference_legal_moves(game))
+                self.assertEqual(game.to_bytes(), position)
+
+    def test_legal_move_mask(self):
+        """Test `abalone.game.Game.legal_move_mask`"""
+        for seed, initial_position in enumerate(InitialPosition):
+            for game in _random_positions(initial_position, seed):
+                mask = game.legal_move_mask()
+                self.assertEqual(len(mask), len(MOVES))
+                self.assertCountEqual([MOVES[index] for index, legal in enumerate(mask) if legal],
+                                      game.generate_legal_moves())
+
+    def test_push_pop(self):
+        """Test `abalone.game.Game.push` and `abalone.game.Game.pop`"""
+        game = Game()
+        initial = game.to_bytes()
+        game.push(Space.A1, Direction.NORTH_EAST)
+        self.assertIs(game.turn, Player.WHITE)
+        self.assertIs(game.get_marble(Space.A1), Marble.BLANK)
+        self.assertIs(game.get_marble(Space.D4), Marble.BLACK)
+        game.push((Space.G5, Space.G7), Direction.SOUTH_WEST)
+        self.assertTupleEqual(game.pop(), ((Space.G5, Space.G7), Direction.SOUTH_WEST))
+        self.assertTupleEqual(game.pop(), (Space.A1, Direction.NORTH_EAST))
+        self.assertEqual(game.to_bytes(), initial)
+        self.assertRaises(Exception, game.pop)
+
+        # illegal moves are not recorded
+        self.assertRaises(IllegalMoveException, lambda: game.push(Space.A1, Direction.SOUTH_EAST))
+        self.assertIs(game.turn, Player.BLACK)
+        self.assertRaises(Exception, game.pop)
+        game.set_marble(Space.E1, Marble.WHITE)
+        self.assertRaises(Exception, game.pop)
+
+        # sumito with a marble pushed off the board
+        game = Game()
+        game.set_marble(Space.A3, Marble.WHITE)
+        position = game.to_bytes()
+        game.push(Space.C3, Direction.SOUTH_EAST)
+        self.assertTupleEqual(game.get_score(), (13, 14))
+        game.pop()
+        self.assertEqual(game.to_bytes(), position)
+
+        # every move of random positions can be taken back
+        for seed, initial_position in enumerate(InitialPosition):
+            for game in _random_positions(initial_position, seed):
+                position = game.to_bytes()
+                for move in list(game.generate_legal_moves()):
+                    copy = deepcopy(game)
+                    copy.move(*move)
+                    copy.switch_player()
+                    game.push(*move)
+                    self.assertEqual(game.to_bytes(), copy.to_bytes())
+                    self.assertTupleEqual(game.pop(), move)
+                    self.assertEqual(game.to_bytes(), position)
+
+        # more moves than the initial capacity of the undo arrays
+        rng = Random(0)
+        game = Game(InitialPosition.BELGIAN_DAISY)
+        positions, moves = [], []
+        for _ in range(200):
+            legal_moves = list(game.generate_legal_moves())
+            if not legal_moves or 8 in game.get_score():
+                break
+            positions.append((game.to_bytes(), game.captured(Player.BLACK), game.captured(Player.WHITE)))
+            moves.append(rng.choice(legal_moves))
+            game.push(*moves[-1])
+        self.assertGreater(len(moves), 64)
+        while moves:
+            self.assertTupleEqual(game.pop(), moves.pop())
+            self.assertTupleEqual((game.to_bytes(), game.captured(Player.BLACK), game.captured(Player.WHITE)),
+                                  positions.pop())
+
+    def test_zobrist(self):
+        """Test `abalone.game.Game.zobrist`, `abalone.game.Game.__hash__` and `abalone.game.Game.__eq__`"""
+        game = Game()
+        self.assertEqual(game, Game())
+        self.assertEqual(hash(game), hash(Game()))
+        self.assertNotEqual(game, Game(first_turn=Player.WHITE))
+        self.assertNotEqual(game.zobrist, Game(first_turn=Player.WHITE).zobrist)
+        self.assertNotEqual(game.zobrist, Game(InitialPosition.BELGIAN_DAISY).zobrist)
+
+        # transposition
+        game.push(Space.A1, Direction.NORTH_EAST)
+        game.push(Space.I5, Direction.SOUTH_WEST)
+        game.push(Space.A2, Direction.NORTH_EAST)
+        transposition = Game()
+        transposition.push(Space.A2, Direction.NORTH_EAST)
+        transposition.push(Space.I5, Direction.SOUTH_WEST)
+        transposition.push(Space.A1, Direction.NORTH_EAST)
+        self.assertEqual(game, transposition)
+        self.assertEqual(game.zobrist, transposition.zobrist)
+        self.assertEqual({game: 1}[transposition], 1)
+
+        game.switch_player()
+        self.assertNotEqual(game.zobrist, transposition.zobrist)
+        game.turn = transposition.turn
+        self.assertEqual(game.zobrist, transposition.zobrist)
+        game.set_marble(Space.E5, Marble.WHITE)
+        self.assertNotEqual(game, transposition)
+        self.assertEqual(game.zobrist, Game.from_bytes(game.to_bytes()).zobrist)
+
+        for seed, initial_position in enumerate(InitialPosition):
+            for game in _random_positions(initial_position, seed):
+                zobrist = game.zobrist
+                self.assertEqual(zobrist, Game.from_bytes(game.to_bytes()).zobrist)
+                for move in list(game.generate_legal_moves()):
+                    game.push(*move)
+                    self.assertEqual(game.zobrist, Game.from_bytes(game.to_bytes()).zobrist)
+                    game.pop()
+                self.assertEqual(game.zobrist, zobrist)
+
+    def test_is_legal_move(self):
+        """Test `abalone.game.Game.is_legal_move`"""
+        game = Game()
+        self.assertTrue(game.is_legal_move(Space.A1, Direction.NORTH_EAST))
+        self.assertTrue(game.is_legal_move((Space.C3, Space.C5), Direction.NORTH_WEST))
+        self.assertFalse(game.is_legal_move(Space.A1, Direction.SOUTH_EAST))
+        self.assertFalse(game.is_legal_move(Space.I5, Direction.SOUTH_WEST))
+        self.assertFalse(game.is_legal_move((Space.C3, Space.C5), Direction.SOUTH_EAST))
+        self.assertFalse(game.is_legal_move((Space.OFF, Space.C5), Direction.NORTH_WEST))
+        self.assertIs(game.get_marble(Space.D4), Marble.BLANK)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for `abalone.instrumentation`"""
+
+import os
+import pstats
+import sys
+import tempfile
+import unittest
+from types import ModuleType
+
+from abalone import game as game_module
+from abalone import instrumentation, utils
+from abalone.enums import Direction, Player, Space
+from abalone.game import Game
+from abalone.instrumentation import disable, enable, instrument
+from abalone.random_player import RandomPlayer
+from abalone.run_game import run_game
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test case for `abalone.instrumentation`."""
+
+    def tearDown(self):
+        disable()
+
+    def test_calls(self):
+        """Test that `abalone.instrumentation.enable` counts the calls of the instrumented functions"""
+        originals = [getattr(owner, name) for owner, name in instrumentation.INSTRUMENTED]
+        neighbor = game_module.neighbor
+        with instrument() as statistics:
+            self.assertIs(instrumentation.statistics, statistics)
+            self.assertIsNot(Game.move, originals[0])
+            self.assertIsNot(game_module.neighbor, neighbor)
+            self.assertRaises(Exception, enable)
+            game = Game()
+            game.move((Space.C3, Space.C5), Direction.NORTH_WEST)
+            game.move(Space.A1, Direction.NORTH_EAST)
+            moves = game.generate_legal_moves()
+            next(moves)
+            moves.close()
+            self.assertIs(utils.neighbor(Space.A1, Direction.EAST), Space.A2)
+
+        self.assertIsNone(instrumentation.statistics)
+        self.assertListEqual([getattr(owner, name) for owner, name in instrumentation.INSTRUMENTED], originals)
+        self.assertIs(game_module.neighbor, neighbor)
+        self.assertEqual(statistics.calls['Game.move'].calls, 2)
+        self.assertEqual(statistics.calls['Game.move_inline'].calls, 1)
+        self.assertEqual(statistics.calls['Game.move_broadside'].calls, 1)
+        self.assertEqual(statistics.calls['Game.generate_legal_moves'].calls, 1)
+        self.assertEqual(statistics.calls['Game.generate_own_marble_lines'].calls, 1)
+        self.assertGreater(statistics.calls['utils.neighbor'].calls, 1)
+        self.assertGreater(statistics.calls['Game.move'].time, 0)
+        self.assertGreaterEqual(statistics.calls['Game.move'].time, statistics.calls['Game.move_inline'].time)
+        self.assertIn('Game.move: 2 calls', repr(statistics))
+        self.assertIsNone(disable())
+
+    def test_import_while_enabled(self):
+        """Test that `abalone.instrumentation.disable` restores functions imported while the instrumentation is\
+        enabled"""
+        module = ModuleType('imported_while_enabled')
+        sys.modules[module.__name__] = module
+        self.addCleanup(sys.modules.pop, module.__name__)
+        with instrument():
+            exec('from abalone.utils import neighbor', vars(module))
+            self.assertTrue(hasattr(module.neighbor, '__wrapped__'))
+        self.assertIs(module.neighbor, utils.neighbor)
+        self.assertFalse(hasattr(module.neighbor, '__wrapped__'))
+
+    def test_run_game(self):
+        """Test that `abalone.run_game.run_game` times and profiles the turns while the instrumentation is enabled"""
+        with tempfile.TemporaryDirectory() as directory:
+            with instrument(profile_directory=directory) as statistics:
+                for _ in range(2):
+                    list(run_game(RandomPlayer(), RandomPlayer(), [], max_moves=5))
+            self.assertEqual(statistics.games, 2)
+            self.assertEqual(statistics.turns[Player.BLACK].calls, 6)
+            self.assertEqual(statistics.turns[Player.WHITE].calls, 4)
+            self.assertGreater(statistics.turns[Player.BLACK].time, 0)
+            self.assertGreater(statistics.calls['Game.generate_legal_moves'].calls, 0)
+            self.assertListEqual(sorted(os.listdir(directory)), ['game-00000.prof', 'game-00001.prof'])
+            profile = pstats.Stats(os.path.join(directory, 'game-00000.prof'))
+            self.assertTrue(any(function[2] == 'turn' for function in profile.stats))
+
+        # no statistics are collected while the instrumentation is disabled
+        list(run_game(RandomPlayer(), RandomPlayer(), [], max_moves=5))
+        self.assertEqual(statistics.turns[Player.BLACK].calls, 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for `abalone.mcts_player`"""
+
+import unittest
+
+from abalone.enums import Direction, Marble, Player, Space
+from abalone.game import Game
+
+try:
+    import numpy as np
+    from abalone.mcts_player import MCTSPlayer
+    from abalone.moves import MOVES
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestMCTSPlayer(unittest.TestCase):
+    """Test case for `abalone.mcts_player.MCTSPlayer`."""
+
+    def test_turn(self):
+        """Test `abalone.mcts_player.MCTSPlayer.turn`"""
+        game = Game()
+        player = MCTSPlayer(time_limit=None, iterations=30, rollouts=8, rollout_depth=4, seed=0)
+        move = player.turn(game, [])
+        self.assertIn(move, list(game.generate_legal_moves()))
+        self.assertEqual(player.iterations, 30)
+        self.assertEqual(player.playouts, 30 * 8)
+        self.assertGreater(player.playouts_per_second, 0)
+        self.assertGreater(player.nodes, 1)
+        self.assertEqual(player.reused_nodes, 0)
+
+        # the root is expanded even if the tree is full
+        player = MCTSPlayer(time_limit=None, iterations=3, rollouts=2, rollout_depth=2, max_nodes=1, seed=0)
+        self.assertIn(player.turn(game, []), list(game.generate_legal_moves()))
+
+        player = MCTSPlayer(time_limit=0.2, rollouts=8, rollout_depth=4, seed=0)
+        player.turn(game, [])
+        self.assertGreater(player.iterations, 0)
+        self.assertRaises(Exception, lambda: MCTSPlayer(time_limit=None, iterations=None))
+
+    def test_capture(self):
+        """Test that `abalone.mcts_player.MCTSPlayer` pushes the sixth marble off the board"""
+        game = Game()
+        for space in Space:
+            if space is not Space.OFF:
+                game.set_marble(space, Marble.BLANK)
+        for space in [Space.A1, Space.A2, Space.A3, Space.A4, Space.A5, Space.B1, Space.B2, Space.B3, Space.B4,
+                      Space.E3, Space.F3]:
+            game.set_marble(space, Marble.BLACK)
+        for space in [Space.G3, Space.I5, Space.I6, Space.I7, Space.I8, Space.I9, Space.H6, Space.H7, Space.H8]:
+            game.set_marble(space, Marble.WHITE)
+        player = MCTSPlayer(time_limit=None, iterations=400, rollouts=4, rollout_depth=2, seed=0)
+        self.assertTupleEqual(player.turn(game, []), (Space.E3, Direction.NORTH_WEST))
+
+    def test_tree_reuse(self):
+        """Test that `abalone.mcts_player.MCTSPlayer` reuses the subtree of the played moves"""
+        game = Game()
+        player = MCTSPlayer(time_limit=None, iterations=150, rollouts=4, rollout_depth=4, seed=0)
+        move = player.turn(game, [])
+        # the reply that has been searched most often
+        root_child = next(child for child in range(player._first_children[0],
+                                                   player._first_children[0] + player._child_counts[0])
+                          if MOVES[player._moves[child]] == move)
+        first = player._first_children[root_child]
+        reply_node = max(range(first, first + player._child_counts[root_child]),
+                         key=lambda child: player._visits[child])
+        reply = MOVES[player._moves[reply_node]]
+        visits = player._visits[reply_node]
+
+        game.move(*move)
+        game.switch_player()
+        game.move(*reply)
+        game.switch_player()
+        player.turn(game, [move, reply])
+        self.assertGreater(visits, 0)
+        self.assertEqual(player._visits[0], visits + 150)
+
+        # an unrelated position clears the tree
+        player.turn(Game(first_turn=Player.WHITE), [])
+        self.assertEqual(player.reused_nodes, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
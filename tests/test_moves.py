@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for `abalone.moves`"""
+
+import unittest
+from random import Random
+
+from abalone.enums import Direction, InitialPosition, Space
+from abalone.game import Game
+from abalone.moves import INLINE_MOVES, MOVES, decode_move, encode_move
+
+
+class TestMoves(unittest.TestCase):
+    """Test case for `abalone.moves`."""
+
+    def test_moves(self):
+        """Test `abalone.moves.MOVES`"""
+        self.assertEqual(len(set(MOVES)), len(MOVES))
+        self.assertTrue(all(isinstance(move[0], Space) for move in MOVES[:INLINE_MOVES]))
+        self.assertTrue(all(isinstance(move[0], tuple) for move in MOVES[INLINE_MOVES:]))
+
+        moves = set(MOVES)
+        rng = Random(0)
+        for initial_position in InitialPosition:
+            game = Game(initial_position)
+            for _ in range(40):
+                legal_moves = list(game.generate_legal_moves())
+                self.assertTrue(moves.issuperset(legal_moves))
+                game.move(*rng.choice(legal_moves))
+                game.switch_player()
+
+    def test_encode_decode(self):
+        """Test `abalone.moves.encode_move` and `abalone.moves.decode_move`"""
+        for index, move in enumerate(MOVES):
+            self.assertEqual(encode_move(move), index)
+            self.assertEqual(decode_move(index), move)
+        self.assertEqual(encode_move(((Space.C5, Space.C3), Direction.NORTH_WEST)),
+                         encode_move(((Space.C3, Space.C5), Direction.NORTH_WEST)))
+        self.assertRaises(Exception, lambda: encode_move((Space.A1, Direction.WEST)))
+        self.assertRaises(Exception, lambda: encode_move(((Space.C3, Space.C5), Direction.EAST)))
+        self.assertRaises(Exception, lambda: encode_move(((Space.A1, Space.E5), Direction.EAST)))
+
+
+if __name__ == '__main__':
+    unittest.main()
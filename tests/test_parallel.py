@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for `abalone.parallel`"""
+
+import unittest
+
+from abalone.game import Game
+from abalone.parallel import LazySMPPlayer, RootParallelMCTSPlayer
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class TestParallel(unittest.TestCase):
+    """Test case for `abalone.parallel`."""
+
+    def test_lazy_smp_player(self):
+        """Test `abalone.parallel.LazySMPPlayer`"""
+        game = Game()
+        player = LazySMPPlayer(workers=2, table_size_mb=1, time_limit=0.3, max_depth=2)
+        self.addCleanup(player.close)
+        move = player.turn(game, [])
+        self.assertIn(move, list(game.generate_legal_moves()))
+        self.assertEqual(player.depth, 2)
+        self.assertGreater(player.nodes, 0)
+        self.assertGreater(player.nodes_per_second, 0)
+
+        game.move(*move)
+        game.switch_player()
+        self.assertIn(player.turn(game, [move]), list(game.generate_legal_moves()))
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_root_parallel_mcts_player(self):
+        """Test `abalone.parallel.RootParallelMCTSPlayer`"""
+        game = Game()
+        player = RootParallelMCTSPlayer(workers=2, seed=0, time_limit=None, iterations=10, rollouts=4,
+                                        rollout_depth=4)
+        self.addCleanup(player.close)
+        self.assertIn(player.turn(game, []), list(game.generate_legal_moves()))
+        self.assertEqual(player.iterations, 2 * 10)
+        self.assertEqual(player.playouts, 2 * 10 * 4)
+        self.assertGreater(player.playouts_per_second, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for `abalone.playouts`"""
+
+import unittest
+
+from abalone.enums import Marble, Player, Space
+from abalone.game import Game
+
+try:
+    import numpy as np
+    from abalone.batch import stack_games
+    from abalone.playouts import play_random, random_playouts
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestPlayouts(unittest.TestCase):
+    """Test case for `abalone.playouts`."""
+
+    @staticmethod
+    def _position(white: int) -> Game:
+        """Returns a position in which black can push the white marble on G3 off the board with E3 NORTH_WEST."""
+        game = Game()
+        for space in Space:
+            if space is not Space.OFF:
+                game.set_marble(space, Marble.BLANK)
+        for space in [Space.A1, Space.A2, Space.A3, Space.A4, Space.A5, Space.B1, Space.B2, Space.B3, Space.B4,
+                      Space.E3, Space.F3]:
+            game.set_marble(space, Marble.BLACK)
+        for space in [Space.G3, Space.I5, Space.I6, Space.I7, Space.I8, Space.I9, Space.H6, Space.H7, Space.H8,
+                      Space.H9][:white]:
+            game.set_marble(space, Marble.WHITE)
+        return game
+
+    def test_play_random(self):
+        """Test `abalone.playouts.play_random`"""
+        boards, turns = stack_games([self._position(9)] * 200 + [self._position(8)])
+        final_boards, result = play_random(boards, turns, 1, 0)
+        self.assertListEqual(final_boards[-1].tolist(), boards[-1].tolist())
+        self.assertEqual(result.plies[-1], 0)
+        self.assertEqual(result.winners[-1], Player.BLACK.value)
+        self.assertTrue((result.plies[:-1] == 1).all())
+        # some games are won by pushing G3 off the board
+        won = result.winners[:-1] == Player.BLACK.value
+        self.assertTrue(won.any())
+        self.assertTrue((final_boards[:-1][won] == Marble.WHITE.value).sum(axis=1).max() == 8)
+        self.assertTrue((result.winners[:-1][~won] == 0).all())
+        self.assertListEqual(result.marble_differences.tolist(),
+                             ((final_boards == Marble.BLACK.value).sum(axis=1)
+                              - (final_boards == Marble.WHITE.value).sum(axis=1)).tolist())
+        self.assertAlmostEqual(result.win_rate(Player.BLACK) + result.win_rate(Player.WHITE) + result.draw_rate(), 1)
+
+    def test_random_playouts(self):
+        """Test `abalone.playouts.random_playouts`"""
+        game = Game()
+        result = random_playouts(game, 50, 20, 1)
+        self.assertEqual(game.to_bytes(), Game().to_bytes())
+        self.assertEqual(len(result.winners), 50)
+        self.assertTrue((result.plies == 20).all())
+        self.assertEqual(result.draw_rate(), 1)
+        self.assertEqual(result.win_rate(Player.BLACK), 0)
+        self.assertTrue((result.marble_differences == 0).all())
+        self.assertEqual(result.average_marble_difference(Player.WHITE), 0)
+        # reproducible with the same seed
+        self.assertTrue((random_playouts(game, 50, 20, 1).plies == result.plies).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for `abalone.records`"""
+
+import os
+import tempfile
+import unittest
+
+from abalone.enums import Direction, InitialPosition, Marble, Player, Space
+from abalone.game import Game
+from abalone.random_player import RandomPlayer
+from abalone.records import MAGIC, GameRecord, GameRecordWriter, RecordObserver, index_games, read_games, \
+    read_positions
+from abalone.run_game import run_game
+
+
+class TestRecords(unittest.TestCase):
+    """Test case for `abalone.records`."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'games.abgr')
+
+    def test_write_read(self):
+        """Test `abalone.records.GameRecordWriter`, `abalone.records.read_games` and `abalone.records.index_games`"""
+        records = [
+            GameRecord(InitialPosition.DEFAULT, Player.BLACK, 'black', 'whïte', None, []),
+            GameRecord(InitialPosition.BELGIAN_DAISY, Player.WHITE, 'a', 'b', Player.WHITE,
+                       [(Space.I5, Direction.SOUTH_WEST), ((Space.A1, Space.B2), Direction.EAST)])
+        ]
+        with GameRecordWriter(self.path) as writer:
+            writer.write(records[0])
+        # appending to an existing file
+        with GameRecordWriter(self.path) as writer:
+            writer.write(records[1])
+        self.assertEqual(os.path.getsize(self.path), len(MAGIC) + 2 * 11 + 11 + 2 + 2 * 2)
+        self.assertListEqual(list(read_games(self.path)), records)
+        games = index_games(self.path)
+        self.assertListEqual(games, [(len(MAGIC), 0), (len(MAGIC) + 11 + 11, 2)])
+        self.assertListEqual(list(read_games(self.path, games[1][0])), records[1:])
+
+        with open(self.path, 'ab') as file:
+            file.write(b'\x00')
+        with self.assertRaises(Exception):
+            list(read_games(self.path))
+        with self.assertRaises(Exception):
+            index_games(self.path)
+        with open(self.path, 'wb') as file:
+            file.write(b'not a record file')
+        with self.assertRaises(Exception):
+            list(read_games(self.path))
+        with self.assertRaises(Exception):
+            GameRecordWriter(self.path)
+
+    def test_record_observer(self):
+        """Test `abalone.records.RecordObserver` and `abalone.records.read_positions`"""
+        games = []
+        with GameRecordWriter(self.path) as writer:
+            for _ in range(3):
+                states = run_game(RandomPlayer(), RandomPlayer(), [RecordObserver(writer, 'random', 'random')],
+                                  max_moves=20)
+                games.append([game.to_bytes() for game, _ in states])
+
+        records = list(read_games(self.path))
+        self.assertEqual(len(records), 3)
+        self.assertTrue(all(len(record.moves) == 20 and record.winner is None for record in records))
+        positions = [(game.to_bytes(), record) for game, record in read_positions(self.path)]
+        self.assertListEqual([position for position, _ in positions], sum(games, []))
+        self.assertIs(positions[0][1], positions[20][1])
+
+        with GameRecordWriter(self.path) as writer:
+            observer = RecordObserver(writer, 'random', 'random')
+            list(run_game(RandomPlayer(), RandomPlayer(), [observer], max_moves=1,
+                          initial_position=InitialPosition.BELGIAN_DAISY, first_turn=Player.WHITE))
+            self.assertIs(observer.initial_position, InitialPosition.BELGIAN_DAISY)
+            game = Game()
+            game.set_marble(Space.A1, Marble.BLANK)
+            self.assertRaises(Exception, lambda: observer.on_start(game))
+        record = list(read_games(self.path))[-1]
+        self.assertIs(record.initial_position, InitialPosition.BELGIAN_DAISY)
+        self.assertIs(record.first_turn, Player.WHITE)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,13 +18,19 @@
 
 """Unit tests for `abalone.game`"""
 
+import io
 import unittest
+from contextlib import redirect_stdout
+from multiprocessing import active_children
+from time import sleep
 from typing import List, Tuple, Union
 
 from abalone.abstract_player import AbstractPlayer
 from abalone.enums import Direction, Player, Space
-from abalone.game import Game
-from abalone.run_game import run_game
+from abalone.game import Game, IllegalMoveException
+from abalone.parallel import LazySMPPlayer
+from abalone.random_player import RandomPlayer
+from abalone.run_game import GameObserver, run_game
 
 
 class TestRunGame(unittest.TestCase):
@@ -85,6 +91,20 @@ class TestRunGame(unittest.TestCase):
         """Test `abalone.run_game.run_game`"""
         final_state = list(run_game(self._TestRunGamePlayerBlack(), self._TestRunGamePlayerWhite()))[-1]
         self.assertTupleEqual(final_state[0].get_score(), (11, 8))
+
+    def test_run_game_time_control_subprocesses(self):
+        """Test `abalone.run_game.run_game` with a time control and a player that starts processes of its own"""
+        errors = []
+
+        class ErrorObserver(GameObserver):
+            def on_end(self, game, moves_history, winner, error):
+                errors.append(error)
+
+        states = list(run_game(LazySMPPlayer(workers=2, table_size_mb=1, time_limit=0.2, max_depth=1), RandomPlayer(),
+                               [ErrorObserver()], max_moves=4, time_control=(30, 0)))
+        self.assertEqual(len(states[-1][1]), 4)
+        self.assertListEqual(errors, [None])
+        self.assertListEqual(active_children(), [])
         self.assertEqual(final_state[0].turn, Player.WHITE)
         self.assertEqual(len(final_state[1]), 25)
         self.assertTupleEqual(final_state[1][-1], (Space.C4, Direction.SOUTH_EAST))
@@ -95,6 +115,111 @@ class TestRunGame(unittest.TestCase):
         states = list(run_game(self._TestRunGameExceptionPlayer(), self._TestRunGamePlayerWhite()))
         self.assertEqual(len(states), 1)
 
+    def test_run_game_observers(self):
+        """Test `abalone.run_game.run_game` with observers"""
+        class RecordingObserver(GameObserver):
+            def __init__(self):
+                self.events = []
+
+            def on_start(self, game):
+                self.events.append(('start', game.get_score()))
+
+            def on_move(self, game, move, moves_history):
+                self.events.append(('move', move, len(moves_history)))
+
+            def on_end(self, game, moves_history, winner, error):
+                self.events.append(('end', winner, error))
+
+        observer = RecordingObserver()
+        output = io.StringIO()
+        with redirect_stdout(output):
+            states = list(run_game(self._TestRunGamePlayerBlack(), self._TestRunGamePlayerWhite(), [observer]))
+        # headless unless a printing observer is given
+        self.assertEqual(output.getvalue(), '')
+        self.assertEqual(len(observer.events), len(states) + 1)
+        self.assertTupleEqual(observer.events[0], ('start', (14, 14)))
+        self.assertTupleEqual(observer.events[1], ('move', (Space.A5, Direction.NORTH_WEST), 1))
+        self.assertTupleEqual(observer.events[-1], ('end', Player.BLACK, None))
+
+        observer = RecordingObserver()
+        list(run_game(self._TestRunGameIllegalMoveExceptionPlayer(), self._TestRunGamePlayerWhite(), [observer]))
+        self.assertEqual(len(observer.events), 2)
+        self.assertIsNone(observer.events[1][1])
+        self.assertIsInstance(observer.events[1][2], IllegalMoveException)
+
+    def test_run_game_draws(self):
+        """Test `abalone.run_game.run_game` with a move limit and repetitions"""
+        class ShufflingPlayer(AbstractPlayer):
+            def turn(self, game, moves_history):
+                if game.turn is Player.BLACK:
+                    return (Space.C3, Direction.NORTH_WEST) if len(moves_history) % 4 == 0 \
+                        else (Space.D3, Direction.SOUTH_EAST)
+                return (Space.G7, Direction.SOUTH_EAST) if len(moves_history) % 4 == 1 \
+                    else (Space.F7, Direction.NORTH_WEST)
+
+        states = list(run_game(ShufflingPlayer(), ShufflingPlayer(), [], max_moves=10))
+        self.assertEqual(len(states[-1][1]), 10)
+        # the initial position occurs for the third time after eight moves
+        states = list(run_game(ShufflingPlayer(), ShufflingPlayer(), [], repetitions=3))
+        self.assertEqual(len(states[-1][1]), 8)
+        states = list(run_game(ShufflingPlayer(), ShufflingPlayer(), [], max_moves=10, repetitions=3))
+        self.assertEqual(len(states[-1][1]), 8)
+
+    def test_run_game_win_on_last_move(self):
+        """Test that `abalone.run_game.run_game` reports a win on the last allowed move"""
+        winners = []
+
+        class WinnerObserver(GameObserver):
+            def on_end(self, game, moves_history, winner, error):
+                winners.append(winner)
+
+        states = list(run_game(self._TestRunGamePlayerBlack(), self._TestRunGamePlayerWhite(), [WinnerObserver()],
+                               max_moves=25))
+        self.assertEqual(len(states[-1][1]), 25)
+        self.assertListEqual(winners, [Player.BLACK])
+
+    def test_run_game_time_control(self):
+        """Test `abalone.run_game.run_game` with a time control"""
+        class SlowPlayer(TestRunGame._TestRunGamePlayerWhite):
+            def turn(self, game, moves_history):
+                if len(moves_history) > 2:
+                    sleep(0.1)
+                return super().turn(game, moves_history)
+
+        errors = []
+
+        class ErrorObserver(GameObserver):
+            def on_end(self, game, moves_history, winner, error):
+                errors.append((game.turn, winner, error))
+
+        states = list(run_game(self._TestRunGamePlayerBlack(), SlowPlayer(), [ErrorObserver()],
+                               time_control=(0.15, 0.01)))
+        self.assertEqual(len(states[-1][1]), 5)
+        turn, winner, error = errors[0]
+        self.assertIs(turn, Player.WHITE)
+        self.assertIsNone(winner)
+        self.assertIsInstance(error, TimeoutError)
+        # the worker process of the player who has run out of time is terminated
+        self.assertListEqual(active_children(), [])
+
+        final_state = list(run_game(self._TestRunGamePlayerBlack(), self._TestRunGamePlayerWhite(), [],
+                                    time_control=(10, 0)))[-1]
+        self.assertTupleEqual(final_state[0].get_score(), (11, 8))
+
+    def test_run_game_time_control_subprocesses(self):
+        """Test `abalone.run_game.run_game` with a time control and a player that starts processes of its own"""
+        errors = []
+
+        class ErrorObserver(GameObserver):
+            def on_end(self, game, moves_history, winner, error):
+                errors.append(error)
+
+        states = list(run_game(LazySMPPlayer(workers=2, table_size_mb=1, time_limit=0.2, max_depth=1), RandomPlayer(),
+                               [ErrorObserver()], max_moves=4, time_control=(30, 0)))
+        self.assertEqual(len(states[-1][1]), 4)
+        self.assertListEqual(errors, [None])
+        self.assertListEqual(active_children(), [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for `abalone.solver`"""
+
+import unittest
+from time import perf_counter
+from typing import List
+
+from abalone.bitboard import Bitboard
+from abalone.enums import Direction, Marble, Player, Space
+from abalone.game import Game
+from abalone.solver import PushOffSolver
+from abalone.utils import SPACES
+
+
+def _position(black: List[Space], white: List[Space], turn: Player = Player.BLACK) -> Game:
+    """Creates a position with marbles on the given spaces only."""
+    game = Game(first_turn=turn)
+    for space in SPACES:
+        game.set_marble(space, Marble.BLANK)
+    for space in black:
+        game.set_marble(space, Marble.BLACK)
+    for space in white:
+        game.set_marble(space, Marble.WHITE)
+    return game
+
+
+_BLACK = [Space.E3, Space.D3, Space.C3, Space.A2, Space.A4, Space.B4, Space.F8, Space.F9, Space.G9, Space.E9, Space.E8]
+_WHITE = [Space.B3, Space.H5, Space.H6, Space.H7, Space.H8, Space.H9, Space.I5, Space.I6, Space.I7]
+
+
+class TestSolver(unittest.TestCase):
+    """Test case for `abalone.solver.PushOffSolver`."""
+
+    def test_immediate(self):
+        """Test that `abalone.solver.PushOffSolver.solve` finds a push-off in one ply"""
+        game = _position(_BLACK + [Space.B3], [Space.A3] + _WHITE[1:])
+        solution = PushOffSolver().solve(game, max_plies=1)
+        self.assertIs(solution.winner, Player.BLACK)
+        self.assertEqual(solution.plies, 1)
+        game.move(*solution.moves[0])
+        self.assertEqual(game.get_score(), (12, 8))
+
+    def test_forced(self):
+        """Test that `abalone.solver.PushOffSolver.solve` proves a push-off against every defense"""
+        game = _position(_BLACK, _WHITE)
+        solver = PushOffSolver()
+        self.assertIsNone(solver.solve(game, max_plies=2))
+        solution = solver.solve(game, max_plies=5)
+        self.assertIs(solution.winner, Player.BLACK)
+        self.assertEqual(solution.plies, 3)
+
+        # a search is aborted at its deadline
+        self.assertIsNone(PushOffSolver().solve(game, max_plies=5, deadline=perf_counter() - 1))
+        self.assertIsNotNone(PushOffSolver().solve(game, max_plies=5, deadline=perf_counter() + 60))
+
+        # every defense loses
+        board = Bitboard.from_game(game).move(*solution.moves[0])
+        for move in board.generate_legal_moves():
+            child = board.move(*move)
+            self.assertTrue(any(child.move(*attack).get_score()[1] == 8 for attack in child.generate_legal_moves()))
+
+        for move in solution.moves:
+            game.move(*move)
+            game.switch_player()
+        self.assertEqual(game.get_score()[1], 8)
+
+        # solved positions are cached
+        self.assertEqual(solver.solve(_position(_BLACK, _WHITE), max_plies=5), solution)
+        self.assertLess(solver.nodes, 5)
+
+    def test_loss(self):
+        """Test that `abalone.solver.PushOffSolver.solve` finds forced wins of the opponent"""
+        game = _position(_BLACK, _WHITE)
+        board = Bitboard.from_game(game).move(Space.D3, Direction.SOUTH_EAST)
+        solution = PushOffSolver().solve(board, max_plies=2)
+        self.assertIs(solution.winner, Player.BLACK)
+        self.assertEqual(solution.plies, 2)
+        self.assertIsNone(PushOffSolver().prove(board, Player.WHITE, max_plies=4))
+
+    def test_no_solution(self):
+        """Test that `abalone.solver.PushOffSolver.solve` does not search positions far from the end"""
+        solver = PushOffSolver()
+        self.assertIsNone(solver.solve(Game(), max_plies=7))
+        self.assertLess(solver.nodes, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
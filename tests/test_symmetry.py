@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for `abalone.symmetry`"""
+
+import unittest
+from random import Random
+
+from abalone.enums import Direction, InitialPosition, Marble, Player, Space
+from abalone.game import Game
+from abalone.moves import MOVES, encode_move
+from abalone.symmetry import MOVE_PERMUTATIONS, SPACE_PERMUTATIONS, SYMMETRIES, canonical_position, inverse, \
+    transform_direction, transform_move, transform_position, transform_space
+from abalone.utils import DIRECTIONS, SPACES, neighbor
+
+
+def _random_games(seed: int):
+    """Generates positions by random play from every initial position."""
+    rng = Random(seed)
+    for initial_position in InitialPosition:
+        game = Game(initial_position)
+        for _ in range(15):
+            game.push(*rng.choice(list(game.generate_legal_moves())))
+            yield game
+
+
+class TestSymmetry(unittest.TestCase):
+    """Test case for `abalone.symmetry`."""
+
+    def test_permutations(self):
+        """Test `abalone.symmetry.SPACE_PERMUTATIONS` and `abalone.symmetry.MOVE_PERMUTATIONS`"""
+        self.assertEqual(len(SPACE_PERMUTATIONS), SYMMETRIES)
+        self.assertEqual(len(set(SPACE_PERMUTATIONS)), SYMMETRIES)
+        self.assertEqual(SPACE_PERMUTATIONS[0], tuple(range(len(SPACES))))
+        for permutation in SPACE_PERMUTATIONS:
+            self.assertEqual(sorted(permutation), list(range(len(SPACES))))
+        for permutation in MOVE_PERMUTATIONS:
+            self.assertEqual(sorted(permutation), list(range(len(MOVES))))
+
+    def test_transform_space(self):
+        """Test `abalone.symmetry.transform_space` and `abalone.symmetry.transform_direction`"""
+        self.assertIs(transform_space(Space.A1, 1), Space.E1)
+        self.assertIs(transform_space(Space.A1, 3), Space.I9)
+        self.assertIs(transform_space(Space.A5, 6), Space.E1)
+        self.assertIs(transform_space(Space.E5, 5), Space.E5)
+        self.assertIs(transform_space(Space.OFF, 4), Space.OFF)
+        self.assertIs(transform_direction(Direction.NORTH_EAST, 1), Direction.EAST)
+        self.assertIs(transform_direction(Direction.EAST, 6), Direction.NORTH_WEST)
+        for symmetry in range(SYMMETRIES):
+            for space in SPACES:
+                self.assertIs(transform_space(transform_space(space, symmetry), inverse(symmetry)), space)
+                for direction in DIRECTIONS:
+                    # neighbors stay neighbors
+                    self.assertIs(transform_space(neighbor(space, direction), symmetry),
+                                  neighbor(transform_space(space, symmetry), transform_direction(direction, symmetry)))
+
+    def test_transform_position(self):
+        """Test `abalone.symmetry.transform_position` and `abalone.symmetry.transform_move`"""
+        for game in _random_games(0):
+            position = game.to_bytes()
+            legal_moves = list(game.generate_legal_moves())
+            for symmetry in range(SYMMETRIES):
+                transformed = Game.from_bytes(transform_position(position, symmetry))
+                self.assertCountEqual(map(encode_move, transformed.generate_legal_moves()),
+                                      [encode_move(transform_move(move, symmetry)) for move in legal_moves])
+                self.assertCountEqual(map(encode_move, transformed.generate_legal_moves()),
+                                      [MOVE_PERMUTATIONS[symmetry][encode_move(move)] for move in legal_moves])
+                self.assertEqual(transform_position(transformed.to_bytes(), inverse(symmetry)), position)
+
+            swapped = Game.from_bytes(transform_position(position, 0, True))
+            self.assertIs(swapped.turn, game.not_in_turn_player())
+            self.assertEqual(swapped.get_score(), game.get_score()[::-1])
+            self.assertCountEqual(swapped.generate_legal_moves(), legal_moves)
+
+    def test_canonical_position(self):
+        """Test `abalone.symmetry.canonical_position`"""
+        for game in _random_games(1):
+            position = game.to_bytes()
+            canonical, symmetry, swapped = canonical_position(position)
+            self.assertFalse(swapped)
+            self.assertEqual(transform_position(position, symmetry), canonical)
+            for other in range(SYMMETRIES):
+                self.assertEqual(canonical_position(transform_position(position, other))[0], canonical)
+                self.assertLessEqual(canonical, transform_position(position, other))
+
+            canonical, symmetry, swapped = canonical_position(position, colors=True)
+            self.assertEqual(transform_position(position, symmetry, swapped), canonical)
+            self.assertEqual(canonical_position(transform_position(position, 3, True), colors=True)[0], canonical)
+
+    def test_game_canonical(self):
+        """Test `abalone.game.Game.canonical` and `abalone.game.Game.canonical_zobrist`"""
+        game = Game()
+        game.move(Space.A1, Direction.NORTH_EAST)
+        game.switch_player()
+        mirrored = Game()
+        mirrored.move(Space.A5, Direction.NORTH_WEST)
+        mirrored.switch_player()
+        self.assertNotEqual(game.zobrist, mirrored.zobrist)
+        self.assertEqual(game.canonical(), mirrored.canonical())
+        self.assertEqual(game.canonical_zobrist(), mirrored.canonical_zobrist())
+        self.assertEqual(game.canonical_zobrist(), game.canonical().zobrist)
+
+        swapped = Game(first_turn=Player.WHITE)
+        swapped.move(Space.I9, Direction.SOUTH_WEST)
+        swapped.switch_player()
+        self.assertIs(swapped.turn, Player.BLACK)
+        self.assertIs(swapped.get_marble(Space.F6), Marble.WHITE)
+        self.assertNotEqual(game.canonical_zobrist(), swapped.canonical_zobrist())
+        self.assertEqual(game.canonical_zobrist(colors=True), swapped.canonical_zobrist(colors=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for `abalone.tournament`"""
+
+import unittest
+from functools import partial
+from time import sleep
+
+from abalone.abstract_player import AbstractPlayer
+from abalone.enums import Direction, InitialPosition, Player, Space
+from abalone.random_player import RandomPlayer
+from abalone.tournament import GameSpec, play_game, player_name, run_tournament, schedule, summarize
+
+
+class _IllegalPlayer(AbstractPlayer):
+    def turn(self, game, moves_history):
+        return Space.A1, Direction.EAST
+
+
+class _SlowPlayer(AbstractPlayer):
+    def turn(self, game, moves_history):
+        sleep(0.2)
+        return Space.A1, Direction.NORTH_EAST
+
+
+class TestTournament(unittest.TestCase):
+    """Test case for `abalone.tournament`."""
+
+    def test_schedule(self):
+        """Test `abalone.tournament.schedule`"""
+        games = schedule([(RandomPlayer, _IllegalPlayer)], games_per_pairing=2,
+                         initial_positions=[InitialPosition.DEFAULT, InitialPosition.GERMAN_DAISY], seed=3)
+        self.assertEqual(len(games), 8)
+        self.assertListEqual([game.index for game in games], list(range(8)))
+        self.assertEqual(len({game.seed for game in games}), 8)
+        self.assertEqual(sum(game.black is RandomPlayer for game in games), 4)
+        self.assertEqual(sum(game.initial_position is InitialPosition.GERMAN_DAISY for game in games), 4)
+        self.assertListEqual(games, schedule([(RandomPlayer, _IllegalPlayer)], 2,
+                                             [InitialPosition.DEFAULT, InitialPosition.GERMAN_DAISY], seed=3))
+
+    def test_play_game(self):
+        """Test `abalone.tournament.play_game`"""
+        result = play_game(GameSpec(0, RandomPlayer, RandomPlayer, InitialPosition.BELGIAN_DAISY, '0:0', 20, None,
+                                    None))
+        self.assertIsNone(result.winner)
+        self.assertEqual(result.reason, 'move limit')
+        self.assertEqual(result.moves, 20)
+        self.assertTrue(all(time >= 0 for time in result.move_times))
+
+        result = play_game(GameSpec(0, RandomPlayer, _IllegalPlayer, InitialPosition.DEFAULT, '0:0', None, None, None))
+        self.assertIs(result.winner, Player.BLACK)
+        self.assertEqual(result.reason, 'forfeit')
+        self.assertEqual(result.moves, 1)
+
+        result = play_game(GameSpec(0, _SlowPlayer, RandomPlayer, InitialPosition.DEFAULT, '0:0', None, None,
+                                    (0.05, 0)))
+        self.assertIs(result.winner, Player.WHITE)
+        self.assertEqual(result.reason, 'time')
+
+    def test_run_tournament(self):
+        """Test `abalone.tournament.run_tournament`"""
+        games = schedule([(RandomPlayer, partial(RandomPlayer))], games_per_pairing=2, seed=1, max_moves=30)
+        results = run_tournament(games, workers=2)
+        self.assertListEqual([result.spec.seed for result in results], [game.seed for game in games])
+        # the results do not depend on the number of processes
+        self.assertListEqual([result[1:5] for result in results],
+                             [result[1:5] for result in run_tournament(games, workers=1)])
+
+    def test_summarize(self):
+        """Test `abalone.tournament.summarize`"""
+        games = schedule([(RandomPlayer, _IllegalPlayer)], games_per_pairing=3, max_moves=None)
+        statistics = summarize(run_tournament(games, workers=1))
+        self.assertSetEqual(set(statistics), {player_name(RandomPlayer), player_name(_IllegalPlayer)})
+        random_player = statistics[player_name(RandomPlayer)]
+        self.assertEqual((random_player.games, random_player.wins, random_player.losses, random_player.draws),
+                         (6, 6, 0, 0))
+        self.assertEqual(random_player.moves, 3)
+        self.assertEqual(statistics[player_name(_IllegalPlayer)].losses, 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Scriptim (https://github.com/Scriptim)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for `abalone.transposition`"""
+
+import unittest
+
+from abalone.enums import Direction, Space
+from abalone.game import Game
+from abalone.transposition import ENTRY_SIZE, Bound, TranspositionEntry, TranspositionTable
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """Test case for `abalone.transposition.TranspositionTable`."""
+
+    def test_size(self):
+        """Test `abalone.transposition.TranspositionTable.size`"""
+        table = TranspositionTable(size_mb=1)
+        self.assertEqual(table.size, 2 ** 20)
+        self.assertEqual(table.buckets, 2 ** 20 // (2 * ENTRY_SIZE))
+        self.assertLessEqual(TranspositionTable(size_mb=0.1).size, 0.1 * 2 ** 20)
+        self.assertRaises(Exception, lambda: TranspositionTable(size_mb=0))
+
+    def test_shared(self):
+        """Test `abalone.transposition.TranspositionTable.shared` and tables attached to a buffer"""
+        table = TranspositionTable.shared(size_mb=0.5)
+        self.assertEqual(len(table), 0)
+        attached = TranspositionTable(0.5, table.buffer)
+        attached.store(42, 3, -7, Bound.LOWER, (Space.A1, Direction.EAST))
+        self.assertEqual(len(table), 1)
+        self.assertEqual(table.probe(42), TranspositionEntry(3, -7, Bound.LOWER, (Space.A1, Direction.EAST)))
+        table.clear()
+        self.assertIsNone(attached.probe(42))
+        self.assertRaises(Exception, lambda: TranspositionTable(1, table.buffer))
+
+    def test_store_probe(self):
+        """Test `abalone.transposition.TranspositionTable.store` and\
+        `abalone.transposition.TranspositionTable.probe`"""
+        table = TranspositionTable(size_mb=1)
+        game = Game()
+        self.assertIsNone(table.probe(game.zobrist))
+        table.store(game.zobrist, 3, -42, Bound.LOWER, ((Space.C3, Space.C5), Direction.NORTH_WEST))
+        self.assertEqual(table.probe(game.zobrist),
+                         TranspositionEntry(3, -42, Bound.LOWER, ((Space.C3, Space.C5), Direction.NORTH_WEST)))
+        table.store(game.zobrist, 4, 7, Bound.EXACT, (Space.A1, Direction.NORTH_EAST))
+        self.assertEqual(table.probe(game.zobrist), TranspositionEntry(4, 7, Bound.EXACT, (Space.A1, Direction.NE)))
+        game.switch_player()
+        table.store(game.zobrist, 0, 0, Bound.UPPER)
+        self.assertEqual(table.probe(game.zobrist), TranspositionEntry(0, 0, Bound.UPPER, None))
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.hits, 3)
+        self.assertEqual(table.misses, 1)
+        self.assertEqual(table.collisions, 0)
+        self.assertRaises(Exception, lambda: table.store(game.zobrist, -1, 0, Bound.EXACT))
+        self.assertRaises(Exception, lambda: table.store(game.zobrist, 128, 0, Bound.EXACT))
+        self.assertRaises(Exception, lambda: table.store(game.zobrist, 1, 0, Bound.EXACT, (Space.A1, Direction.WEST)))
+        self.assertEqual(len(table), 2)
+
+        table.clear()
+        self.assertIsNone(table.probe(game.zobrist))
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.hits, 0)
+
+    def test_replacement(self):
+        """Test the replacement policy of `abalone.transposition.TranspositionTable.store`"""
+        table = TranspositionTable(size_mb=2 * ENTRY_SIZE / 2 ** 20)
+        self.assertEqual(table.buckets, 1)
+
+        table.store(1, 5, 1, Bound.EXACT)
+        table.store(2, 3, 2, Bound.EXACT)
+        # the deep entry stays in the depth-preferred slot
+        table.store(3, 4, 3, Bound.EXACT)
+        self.assertEqual(table.collisions, 1)
+        self.assertEqual(table.probe(1).score, 1)
+        self.assertIsNone(table.probe(2))
+        self.assertEqual(table.probe(3).score, 3)
+        # a deeper entry replaces the depth-preferred slot and the previous entry moves to the other slot
+        table.store(4, 6, 4, Bound.EXACT)
+        self.assertEqual(table.collisions, 2)
+        self.assertEqual(table.probe(4).score, 4)
+        self.assertEqual(table.probe(1).score, 1)
+        self.assertIsNone(table.probe(3))
+        # a deeper entry of a position in the other slot
+        table.store(1, 7, 5, Bound.EXACT)
+        self.assertEqual(table.collisions, 2)
+        self.assertEqual(table.probe(1), TranspositionEntry(7, 5, Bound.EXACT, None))
+        self.assertEqual(table.probe(4).score, 4)
+        self.assertEqual(len(table), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
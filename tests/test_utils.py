@@ -21,7 +21,9 @@
 import unittest
 
 from abalone.enums import Direction, Space
-from abalone.utils import line_from_to, line_to_edge, neighbor
+from abalone.game import Game
+from abalone.utils import DISTANCES_TO_EDGE, _compute_neighbor, line_from_to, line_to_edge, neighbor, pack_move, \
+    unpack_move
 
 
 class TestMethods(unittest.TestCase):
@@ -42,6 +44,26 @@ class TestMethods(unittest.TestCase):
         self.assertRaises(Exception, lambda: line_from_to(Space.A1, Space.OFF))
         self.assertRaises(Exception, lambda: line_from_to(Space.OFF, Space.OFF))
 
+        for from_space in Space:
+            if from_space is Space.OFF:
+                continue
+            for to_space in Space:
+                if to_space is Space.OFF:
+                    continue
+                expected = None, None
+                for direction in Direction:
+                    line = [from_space]
+                    while line[-1] is not Space.OFF:
+                        line.append(_compute_neighbor(line[-1], direction))
+                        if line[-1] is to_space:
+                            expected = line, direction
+                            break
+                self.assertTupleEqual(line_from_to(from_space, to_space), expected)
+
+        line, _ = line_from_to(Space.A1, Space.A3)
+        line.clear()
+        self.assertTupleEqual(line_from_to(Space.A1, Space.A3), ([Space.A1, Space.A2, Space.A3], Direction.EAST))
+
     def test_line_to_edge(self):
         """Test `abalone.utils.line_to_edge`"""
         self.assertSequenceEqual(line_to_edge(Space.C4, Direction.SOUTH_EAST), [Space.C4, Space.B4, Space.A4])
@@ -50,6 +72,18 @@ class TestMethods(unittest.TestCase):
         self.assertSequenceEqual(line_to_edge(Space.A1, Direction.WEST), [Space.A1])
         self.assertRaises(Exception, lambda: line_to_edge(Space.OFF, Direction.EAST))
 
+        for space in Space:
+            if space is Space.OFF:
+                continue
+            for direction in Direction:
+                line = [space]
+                while _compute_neighbor(line[-1], direction) is not Space.OFF:
+                    line.append(_compute_neighbor(line[-1], direction))
+                self.assertListEqual(line_to_edge(space, direction), line)
+
+        line_to_edge(Space.A1, Direction.EAST).clear()
+        self.assertListEqual(line_to_edge(Space.A1, Direction.EAST), [Space.A1, Space.A2, Space.A3, Space.A4, Space.A5])
+
     def test_neighbor(self):
         """Test `abalone.utils.neighbor`"""
         self.assertIs(neighbor(Space.OFF, Direction.NORTH_EAST), Space.OFF)
@@ -67,6 +101,38 @@ class TestMethods(unittest.TestCase):
         self.assertIs(neighbor(Space.A5, Direction.EAST), Space.OFF)
         self.assertIs(neighbor(Space.A1, Direction.WEST), Space.OFF)
 
+        for space in Space:
+            for direction in Direction:
+                self.assertIs(neighbor(space, direction), _compute_neighbor(space, direction))
+
+    def test_distances_to_edge(self):
+        """Test `abalone.utils.DISTANCES_TO_EDGE`"""
+        self.assertEqual(DISTANCES_TO_EDGE[Space.E5], 4)
+        self.assertEqual(DISTANCES_TO_EDGE[Space.C4], 2)
+        self.assertEqual(DISTANCES_TO_EDGE[Space.B2], 1)
+        self.assertEqual(DISTANCES_TO_EDGE[Space.A1], 0)
+        self.assertEqual(sum(1 for distance in DISTANCES_TO_EDGE.values() if distance == 0), 24)
+        self.assertNotIn(Space.OFF, DISTANCES_TO_EDGE)
+
+    def test_pack_move(self):
+        """Test `abalone.utils.pack_move` and `abalone.utils.unpack_move`"""
+        self.assertEqual(pack_move((Space.A1, Direction.NORTH_EAST)), 0)
+        self.assertTupleEqual(unpack_move(pack_move(((Space.C5, Space.C3), Direction.SOUTH_WEST))),
+                              ((Space.C5, Space.C3), Direction.SOUTH_WEST))
+        self.assertRaises(Exception, lambda: pack_move((Space.OFF, Direction.EAST)))
+        self.assertRaises(Exception, lambda: pack_move(((Space.A1, Space.A4), Direction.NORTH_EAST)))
+        self.assertRaises(Exception, lambda: pack_move(((Space.A1, Space.B3), Direction.NORTH_EAST)))
+
+        packed_moves = set()
+        game = Game()
+        for marbles in game.generate_own_marble_lines():
+            for direction in Direction:
+                packed_move = pack_move((marbles, direction))
+                self.assertLess(packed_move, 2 ** 14)
+                self.assertTupleEqual(unpack_move(packed_move), (marbles, direction))
+                packed_moves.add(packed_move)
+        self.assertEqual(len(packed_moves), 6 * len(list(game.generate_own_marble_lines())))
+
 
 if __name__ == '__main__':
     unittest.main()